@@ -0,0 +1 @@
+"""Benchmarks offline do agendador e da automação."""
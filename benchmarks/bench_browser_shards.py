@@ -0,0 +1,82 @@
+"""
+Benchmark: um navegador vs. guias distribuídas em N navegadores
+
+Abre as guias com o BrowserManager real (requer Chrome instalado) e, em
+paralelo, executa rodadas de pequenos ``page.evaluate`` com manipulação de
+DOM. Cada chamada passa pelo processo do navegador, que é o gargalo de um
+único shard com muitas guias.
+
+Uso:
+    python -m benchmarks.bench_browser_shards --tabs 20 --shards 4
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from bot_keydrop.backend.bot_logic.browser_manager import BrowserManager
+from bot_keydrop.backend.bot_logic.browser_shards import auto_shard_count
+
+WORKLOAD = """
+(n) => {
+    const root = document.body;
+    for (let i = 0; i < n; i++) {
+        const el = document.createElement('div');
+        el.textContent = 'item ' + i;
+        root.appendChild(el);
+    }
+    const count = root.childElementCount;
+    root.innerHTML = '';
+    return count;
+}
+"""
+
+
+async def run_shards(shards: int, num_tabs: int, rounds: int, nodes: int) -> float:
+    manager = BrowserManager()
+    manager.user_profiles_dir = Path(tempfile.mkdtemp(prefix="bench_profiles_"))
+    manager.browser_shards = shards
+    manager.context_pool_size = 0
+    manager.keep_cookies = False
+
+    if not await manager.start_browser():
+        raise RuntimeError("Não foi possível iniciar o navegador")
+    try:
+        await asyncio.gather(*(manager.create_tab(tab_id) for tab_id in range(1, num_tabs + 1)))
+
+        async def drive(tab_id: int):
+            page = manager.tabs[tab_id].page
+            for _ in range(rounds):
+                await page.evaluate(WORKLOAD, nodes)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(drive(tab_id) for tab_id in manager.tabs))
+        return time.perf_counter() - start
+    finally:
+        await manager.stop_browser()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tabs", type=int, default=20)
+    parser.add_argument("--shards", type=int, default=0, help="0 = automático pelos núcleos")
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--nodes", type=int, default=200)
+    args = parser.parse_args()
+
+    sharded = args.shards or auto_shard_count(args.tabs)
+    calls = args.tabs * args.rounds
+    results = {}
+    for shards in sorted({1, sharded}):
+        elapsed = asyncio.run(run_shards(shards, args.tabs, args.rounds, args.nodes))
+        results[shards] = elapsed
+        print(f"{shards:2d} shard(s): {calls} chamadas em {elapsed:.2f}s ({calls / elapsed:,.0f}/s)")
+
+    if sharded != 1:
+        print(f"ganho {sharded} shards/1 shard: {results[1] / results[sharded]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark: descoberta de sorteios por handles vs. snapshot único
+
+Simula uma página com N cards em que cada chamada ao navegador custa um
+round-trip fixo e compara o caminho antigo — query_selector_all seguido de
+query_selector/is_enabled/inner_text por card — com o snapshot em um único
+evaluate mais a resolução do link somente do card escolhido.
+
+Uso:
+    python -m benchmarks.bench_lottery_discovery --cards 30 --latency 0.004
+"""
+
+import argparse
+import asyncio
+import time
+
+from bot_keydrop.backend.bot_logic.automation_tasks import KeydropAutomation
+from bot_keydrop.backend.bot_logic.lottery_snapshot import resolve_join_link, snapshot_lotteries
+
+SELECTORS = KeydropAutomation.SELECTORS
+
+
+class Remote:
+    """Contador de round-trips compartilhado pelos objetos da página"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+
+    async def call(self, result=None):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return result
+
+
+class FakeElement:
+    def __init__(self, remote: Remote, card: dict, role: str):
+        self.remote = remote
+        self.card = card
+        self.role = role
+
+    async def query_selector(self, selector):
+        if selector == SELECTORS['join_link']:
+            return await self.remote.call(FakeElement(self.remote, self.card, 'link'))
+        if selector == SELECTORS['lottery_title']:
+            return await self.remote.call(FakeElement(self.remote, self.card, 'title'))
+        return await self.remote.call(None)
+
+    async def is_enabled(self):
+        return await self.remote.call(self.card['enabled'])
+
+    async def inner_text(self):
+        return await self.remote.call(self.card['title'])
+
+    def as_element(self):
+        return self
+
+
+class FakePage:
+    def __init__(self, remote: Remote, num_cards: int):
+        self.remote = remote
+        self.cards = [
+            {'key': f'/pt/giveaways/{i}', 'title': f'Sorteio {i}', 'enabled': i % 3 != 0}
+            for i in range(num_cards)
+        ]
+
+    async def query_selector_all(self, selector):
+        return await self.remote.call([FakeElement(self.remote, c, 'card') for c in self.cards])
+
+    async def evaluate(self, script, args):
+        rows = [[i, c['key'], c['title'], False, c['enabled']] for i, c in enumerate(self.cards)]
+        return await self.remote.call(rows)
+
+    async def evaluate_handle(self, script, args):
+        key = args[2]
+        card = next(c for c in self.cards if c['key'] == key)
+        return await self.remote.call(FakeElement(self.remote, card, 'link'))
+
+
+async def by_handles(page: FakePage):
+    """Caminho anterior: vários round-trips por card"""
+    lotteries = []
+    for card in await page.query_selector_all(SELECTORS['giveaway_card']):
+        link = await card.query_selector(SELECTORS['join_link'])
+        if link and await link.is_enabled():
+            title_element = await card.query_selector(SELECTORS['lottery_title'])
+            title = await title_element.inner_text() if title_element else ''
+            amateur = await card.query_selector(SELECTORS['amateur_lottery']) or 'amateur' in title.lower()
+            info = {'title': title, 'type': 'amateur' if amateur else 'unknown', 'is_amateur': bool(amateur)}
+            lotteries.append({'card': card, 'link': link, 'info': info})
+    return lotteries[0]['link']
+
+
+async def by_snapshot(page: FakePage):
+    cards = [card for card in await snapshot_lotteries(page, SELECTORS) if card.enabled]
+    return await resolve_join_link(page, cards[0], SELECTORS)
+
+
+async def run(mode: str, num_cards: int, latency: float):
+    remote = Remote(latency)
+    page = FakePage(remote, num_cards)
+    start = time.perf_counter()
+    await (by_handles(page) if mode == "handles" else by_snapshot(page))
+    return remote.calls, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cards", type=int, default=30)
+    parser.add_argument("--latency", type=float, default=0.004, help="custo de um round-trip CDP (s)")
+    args = parser.parse_args()
+
+    results = {}
+    for mode in ("handles", "snapshot"):
+        calls, elapsed = asyncio.run(run(mode, args.cards, args.latency))
+        results[mode] = elapsed
+        print(f"{mode:8s}: {calls:4d} round-trips em {elapsed * 1000:7.1f}ms ({args.cards} cards)")
+    print(f"ganho: {results['handles'] / results['snapshot']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark: estatísticas e páginas do histórico de participações
+
+Compara a lista de ParticipationAttempt (varredura linear por consulta e
+cópia do buffer inteiro por página) com o ParticipationStore em colunas
+(busca binária e contagens acumuladas) para N tentativas mantidas.
+
+Uso:
+    python -m benchmarks.bench_participation_history --attempts 100000 --queries 200
+"""
+
+import argparse
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from bot_keydrop.backend.bot_logic.automation_tasks import ParticipationAttempt, ParticipationResult
+from bot_keydrop.backend.bot_logic.participation_store import ParticipationStore
+
+RESULTS = [ParticipationResult.SUCCESS, ParticipationResult.FAILED, ParticipationResult.ALREADY_PARTICIPATED]
+
+
+def build(num_attempts: int):
+    start = datetime.now() - timedelta(seconds=num_attempts * 2)
+    return [
+        ParticipationAttempt(i % 20 + 1, 1, start + timedelta(seconds=i * 2), RESULTS[i % 3])
+        for i in range(num_attempts)
+    ]
+
+
+def list_queries(attempts, cutoffs, limit):
+    for cutoff in cutoffs:
+        recent = [a for a in attempts if a.timestamp >= cutoff]
+        len([a for a in recent if a.result == ParticipationResult.SUCCESS])
+        len([a for a in recent if a.result == ParticipationResult.FAILED])
+        [a.to_dict() for a in list(attempts)[-limit:]]
+
+
+def store_queries(store, cutoffs, limit):
+    for cutoff in cutoffs:
+        store.counts(cutoff)
+        store.last_timestamp(cutoff)
+        store.page(limit)
+
+
+def measure(label: str, build_fn):
+    tracemalloc.start()
+    value = build_fn()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{label:6s}: {size / 1024 / 1024:7.1f} MiB")
+    return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--attempts", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=100, help="tamanho da página do histórico")
+    args = parser.parse_args()
+
+    attempts = measure("lista", lambda: build(args.attempts))
+
+    def fill():
+        store = ParticipationStore(capacity=args.attempts)
+        for a in attempts:
+            store.append(a.timestamp, a.tab_id, a.result.value, a.attempt_number)
+        return store
+
+    store = measure("store", fill)
+
+    now = datetime.now()
+    cutoffs = [now - timedelta(hours=(i % 48) + 1) for i in range(args.queries)]
+    timings = {}
+    for label, run in (("lista", lambda: list_queries(attempts, cutoffs, args.limit)),
+                       ("store", lambda: store_queries(store, cutoffs, args.limit))):
+        start = time.perf_counter()
+        run()
+        timings[label] = (time.perf_counter() - start) / args.queries
+        print(f"{label:6s}: {timings[label] * 1000:8.3f}ms por consulta (stats + página de {args.limit})")
+    print(f"ganho: {timings['lista'] / timings['store']:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
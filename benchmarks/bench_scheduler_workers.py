@@ -0,0 +1,76 @@
+"""
+Benchmark: despacho em lotes vs. workers por guia
+
+Simula guias rápidas e algumas guias lentas (goto com timeout, retentativas)
+e mede quantas participações cada modo completa no mesmo intervalo.
+
+Uso:
+    python -m benchmarks.bench_scheduler_workers
+"""
+
+import argparse
+import asyncio
+import time
+
+from bot_keydrop.backend.bot_logic.scheduler import BotScheduler
+from benchmarks.fakes import FakeAutomation, FakeBrowserManager, FakeConfigManager
+
+
+async def run_mode(mode: str, num_tabs: int, slow_tabs: int, duration: float,
+                   fast_latency: float, slow_latency: float, interval: float) -> int:
+    config = FakeConfigManager(
+        num_tabs=num_tabs,
+        amateur_lottery_wait_time=interval,
+        iteration_delay=0.0,
+        wait_time_between_actions=0.0,
+        scheduler_mode=mode,
+        max_concurrent_tasks=10,
+        checkpoint_enabled=False,
+        adaptive_concurrency=False,
+    )
+    browser = FakeBrowserManager()
+    automation = FakeAutomation(lambda tab_id: slow_latency if tab_id <= slow_tabs else fast_latency)
+    scheduler = BotScheduler(browser, automation, config)
+    scheduler.resource_monitor = None
+
+    await browser.start_browser()
+    scheduler._dispatch_mode = mode
+    scheduler.is_running = True
+    await scheduler._create_tabs_and_tasks()
+
+    loop_task = asyncio.create_task(scheduler._main_loop())
+    await asyncio.sleep(duration)
+    scheduler.should_stop = True
+    scheduler._wakeup.set()
+    loop_task.cancel()
+    await asyncio.gather(loop_task, return_exceptions=True)
+    await scheduler._stop_tab_workers()
+    return automation.participations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tabs", type=int, default=20)
+    parser.add_argument("--slow-tabs", type=int, default=2)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--fast-latency", type=float, default=0.05)
+    parser.add_argument("--slow-latency", type=float, default=3.0)
+    parser.add_argument("--interval", type=float, default=0.1)
+    args = parser.parse_args()
+
+    results = {}
+    for mode in ("batch", "per_tab"):
+        start = time.perf_counter()
+        count = asyncio.run(run_mode(mode, args.tabs, args.slow_tabs, args.duration,
+                                     args.fast_latency, args.slow_latency, args.interval))
+        elapsed = time.perf_counter() - start
+        results[mode] = count
+        print(f"{mode:8s}: {count:5d} participações em {elapsed:.1f}s "
+              f"({count / args.duration * 3600:,.0f}/h)")
+
+    if results["batch"]:
+        print(f"ganho per_tab/batch: {results['per_tab'] / results['batch']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
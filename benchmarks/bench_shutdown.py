@@ -0,0 +1,116 @@
+"""
+Benchmark: encerramento sequencial vs. paralelo com prazo
+
+Cria guias falsas cujo fechamento de contexto leva um tempo fixo (como o
+round-trip ao navegador) e compara o caminho antigo — close_tab guia a guia
+com gc.collect() em cada uma — com stop_browser.
+
+Uso:
+    python -m benchmarks.bench_shutdown --tabs 50
+"""
+
+import argparse
+import asyncio
+import gc
+import tempfile
+import time
+from pathlib import Path
+
+from bot_keydrop.backend.bot_logic.browser_manager import BrowserManager
+from bot_keydrop.backend.bot_logic.browser_shards import BrowserShard
+
+
+class SlowPage:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def on(self, event, handler):
+        pass
+
+    async def close(self):
+        await asyncio.sleep(self.latency)
+
+
+class SlowContext:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    async def route(self, pattern, handler):
+        pass
+
+    async def new_page(self):
+        return SlowPage(self.latency)
+
+    async def close(self):
+        await asyncio.sleep(self.latency)
+
+
+class SlowBrowser:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def on(self, event, handler):
+        pass
+
+    async def new_context(self, **options):
+        return SlowContext(self.latency)
+
+    async def close(self):
+        await asyncio.sleep(self.latency)
+
+
+async def build_manager(num_tabs: int, latency: float, ballast: int) -> BrowserManager:
+    manager = BrowserManager()
+    manager.user_profiles_dir = Path(tempfile.mkdtemp(prefix="bench_profiles_"))
+    manager.context_pool_size = 0
+    manager.enable_stealth = False
+    manager.keep_cookies = False
+    manager.browser = SlowBrowser(latency)
+    manager.shards = [BrowserShard(0, manager.browser)]
+    manager.is_running = True
+    for tab_id in range(1, num_tabs + 1):
+        await manager.create_tab(tab_id)
+    # Objetos vivos tornam cada gc.collect() tão caro quanto no processo real
+    manager._ballast = [{'i': i} for i in range(ballast)]
+    return manager
+
+
+async def sequential(manager: BrowserManager):
+    """Caminho anterior: uma guia por vez, gc.collect() após cada uma"""
+    for tab_id in list(manager.tabs.keys()):
+        await manager.close_tab(tab_id, collect=True)
+    await manager.browser.close()
+
+
+async def run(mode: str, num_tabs: int, latency: float, ballast: int) -> float:
+    manager = await build_manager(num_tabs, latency, ballast)
+    start = time.perf_counter()
+    if mode == "sequencial":
+        await sequential(manager)
+    else:
+        await manager.stop_browser()
+    elapsed = time.perf_counter() - start
+    del manager._ballast
+    gc.collect()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tabs", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.15, help="custo de fechar página/contexto (s)")
+    parser.add_argument("--ballast", type=int, default=300_000, help="objetos vivos no heap")
+    args = parser.parse_args()
+
+    results = {}
+    for mode in ("sequencial", "paralelo"):
+        results[mode] = asyncio.run(run(mode, args.tabs, args.latency, args.ballast))
+        print(f"{mode:10s}: {args.tabs} guias encerradas em {results[mode]:.2f}s")
+    print(f"ganho: {results['sequencial'] / results['paralelo']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark: início frio vs. quente do navegador
+
+Mede ``start_browser`` em três situações com o BrowserManager real (requer
+Chrome instalado): sem nada iniciado, após parar mantendo o driver e após
+o pré-aquecimento feito na abertura da API.
+
+Uso:
+    python -m benchmarks.bench_startup --cycles 3
+"""
+
+import argparse
+import asyncio
+import tempfile
+from pathlib import Path
+
+from bot_keydrop.backend.bot_logic.browser_manager import BrowserManager
+
+
+async def run(cycles: int):
+    manager = BrowserManager()
+    manager.user_profiles_dir = Path(tempfile.mkdtemp(prefix="bench_profiles_"))
+    manager.context_pool_size = 0
+
+    try:
+        for _ in range(cycles):
+            # Frio: driver e navegador do zero
+            await manager.start_browser()
+            await manager.stop_browser(keep_driver=False)
+
+            # Driver mantido entre parar/iniciar
+            await manager.start_browser()
+            await manager.stop_browser()
+            await manager.start_browser()
+            await manager.stop_browser()
+
+            # Pré-aquecido em segundo plano antes do start
+            await manager.start_prewarm()
+            await manager.start_browser()
+            await manager.stop_browser(keep_driver=False)
+    finally:
+        await manager.release_driver()
+
+    for mode, hist in manager.startup_latency.items():
+        if hist.count:
+            stats = hist.to_dict()
+            print(f"{mode:12s} n={hist.count:2d} média={stats['mean'] * 1000:7.0f}ms "
+                  f"p95={stats['p95'] * 1000:7.0f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cycles", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args.cycles))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark: busca do botão por imagem em disco vs. em memória
+
+Gera um screenshot sintético com o botão embutido e compara o caminho
+antigo — PNG gravado em disco, screenshot e template relidos a cada
+chamada, busca colorida na tela inteira — com o TemplateMatcher (PNG
+decodificado em memória, template em cache, busca reduzida + refinamento).
+Também mede o maior atraso do event loop com a busca rodando em thread.
+
+Requer opencv-python e numpy.
+
+Uso:
+    python -m benchmarks.bench_template_match --calls 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from bot_keydrop.backend.bot_logic.template_matcher import TemplateMatcher
+
+
+def build_images(workdir: Path):
+    rng = np.random.default_rng(1)
+    template = rng.integers(0, 255, (40, 120, 3), dtype=np.uint8)
+    screen = rng.integers(0, 255, (1080, 1920, 3), dtype=np.uint8)
+    screen[600:640, 900:1020] = template
+    template_path = workdir / 'participar_button.png'
+    cv2.imwrite(str(template_path), template)
+    ok, encoded = cv2.imencode('.png', screen)
+    return template_path, encoded.tobytes()
+
+
+def old_pipeline(screenshot: bytes, template_path: Path, workdir: Path):
+    """Caminho anterior de _attempt_participation_image"""
+    screenshot_path = workdir / 'screen_1.png'
+    screenshot_path.write_bytes(screenshot)  # page.screenshot(path=...)
+    img = cv2.imread(str(screenshot_path))
+    templ = cv2.imread(str(template_path))
+    res = cv2.matchTemplate(img, templ, cv2.TM_CCOEFF_NORMED)
+    return cv2.minMaxLoc(res)
+
+
+def timed(fn, calls: int):
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000, max(samples) * 1000
+
+
+async def loop_lag(fn, calls: int) -> float:
+    """Maior atraso de um tick de 5ms enquanto as buscas rodam em thread"""
+    lag = 0.0
+    running = True
+
+    async def ticker():
+        nonlocal lag
+        loop = asyncio.get_running_loop()
+        while running:
+            start = loop.time()
+            await asyncio.sleep(0.005)
+            lag = max(lag, loop.time() - start - 0.005)
+
+    task = asyncio.create_task(ticker())
+    for _ in range(calls):
+        await asyncio.to_thread(fn)
+    running = False
+    await task
+    return lag * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        template_path, screenshot = build_images(workdir)
+        matcher = TemplateMatcher(template_path)
+
+        old_median, old_max = timed(lambda: old_pipeline(screenshot, template_path, workdir), args.calls)
+        cold = TemplateMatcher(template_path)
+        new_cold, _ = timed(lambda: cold.match(screenshot), 1)
+        new_median, new_max = timed(lambda: matcher.match(screenshot), args.calls)
+        region_median, _ = timed(lambda: matcher.match(screenshot, key=1), args.calls)
+        lag = asyncio.run(loop_lag(lambda: matcher.match(screenshot), args.calls))
+
+    print(f"disco, tela inteira : mediana {old_median:7.1f}ms  máx {old_max:7.1f}ms")
+    print(f"memória, 1ª chamada : {new_cold:7.1f}ms (carrega o template)")
+    print(f"memória, 2 escalas  : mediana {new_median:7.1f}ms  máx {new_max:7.1f}ms")
+    print(f"memória, região     : mediana {region_median:7.1f}ms")
+    print(f"atraso máx. do loop com busca em thread: {lag:.1f}ms")
+    print(f"ganho: {old_median / new_median:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
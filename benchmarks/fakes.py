@@ -0,0 +1,134 @@
+"""
+Substitutos leves de BrowserManager e KeydropAutomation para benchmarks
+"""
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Callable, Dict, Optional, Set
+
+from bot_keydrop.backend.bot_logic.automation_tasks import ParticipationAttempt, ParticipationResult
+from bot_keydrop.backend.config.config_manager import BotConfig
+
+
+class FakeConfigManager:
+    """ConfigManager em memória que aceita valores fora dos limites da UI"""
+
+    def __init__(self, **overrides):
+        self._config = BotConfig.model_construct(**overrides)
+
+    def get_config(self) -> BotConfig:
+        return self._config
+
+
+class FakeBrowserManager:
+    """Gerenciador de navegador sem Playwright"""
+
+    def __init__(self):
+        self.is_running = False
+        self.tabs: Dict[int, SimpleNamespace] = {}
+        self.restarts = 0
+        # Guias que a simulação marcou como falhas/sem resposta; a triagem pede recuperação
+        self.unhealthy: Set[int] = set()
+
+    def mark_unhealthy(self, tab_id, unhealthy=True):
+        if unhealthy:
+            self.unhealthy.add(tab_id)
+        else:
+            self.unhealthy.discard(tab_id)
+
+    async def start_browser(self, headless=False, mini_window=False, user_data_dir=None):
+        self.is_running = True
+        return True
+
+    async def stop_browser(self):
+        self.is_running = False
+        self.tabs.clear()
+        return True
+
+    async def emergency_stop(self):
+        return await self.stop_browser()
+
+    async def create_tab(self, tab_id, proxy=None):
+        info = SimpleNamespace(
+            tab_id=tab_id,
+            page=True,
+            status='ready',
+            last_activity=datetime.now(),
+            error_count=0,
+            participation_count=0,
+        )
+        self.tabs[tab_id] = info
+        self.unhealthy.discard(tab_id)
+        return info
+
+    async def restart_tab(self, tab_id, proxy=None):
+        self.restarts += 1
+        return await self.create_tab(tab_id, proxy) is not None
+
+    async def triage_tab(self, tab_id, expected_url=None):
+        return 'healthy' if tab_id in self.tabs and tab_id not in self.unhealthy else 'recover'
+
+    async def recover_tab(self, tab_id, proxy=None):
+        if await self.restart_tab(tab_id, proxy):
+            return 'new_context'
+        return None
+
+    async def clear_cache(self, preserve_login=True):
+        return True
+
+    def get_tab_info(self, tab_id):
+        return self.tabs.get(tab_id)
+
+    def get_tab_count(self):
+        return len(self.tabs)
+
+    def is_tab_ready(self, tab_id):
+        return tab_id in self.tabs
+
+    def get_all_tabs_info(self):
+        return [vars(tab) for tab in self.tabs.values()]
+
+
+class FakeAutomation:
+    """
+    Automação simulada com latência por guia
+
+    Args:
+        latency: Função ``tab_id -> segundos`` gasta em cada participação
+        outcome: Função ``tab_id -> ParticipationResult`` (padrão: sucesso)
+    """
+
+    def __init__(self,
+                 latency: Callable[[int], float],
+                 outcome: Optional[Callable[[int], ParticipationResult]] = None):
+        self.latency = latency
+        self.outcome = outcome or (lambda tab_id: ParticipationResult.SUCCESS)
+        self.participations = 0
+
+    async def navigate_to_lotteries(self, tab_id):
+        return True
+
+    async def setup_login_tabs(self):
+        return False, []
+
+    async def participate_in_lottery(self, tab_id, max_retries=1):
+        await asyncio.sleep(self.latency(tab_id))
+        result = self.outcome(tab_id)
+        if result == ParticipationResult.SUCCESS:
+            self.participations += 1
+        return ParticipationAttempt(
+            tab_id=tab_id,
+            attempt_number=1,
+            timestamp=datetime.now(),
+            result=result,
+        )
+
+    def get_participation_history(self, limit=None, offset=0):
+        return []
+
+    def get_participation_counts(self, since=None):
+        return {'total': 0}
+
+    def get_winnings_history(self, limit=None):
+        return []
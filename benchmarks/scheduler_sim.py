@@ -0,0 +1,265 @@
+"""
+Simulação do BotScheduler em tempo virtual
+
+Executa o agendador real contra BrowserManager/KeydropAutomation simulados
+num event loop cujo relógio avança instantaneamente até o próximo timer.
+Horas de operação simulada terminam em segundos, permitindo comparar
+mudanças no agendador offline.
+
+Uso:
+    python -m benchmarks.scheduler_sim --hours 4 --tabs 5 20 100
+    python -m benchmarks.scheduler_sim --mode per_tab --failure-rate 0.2
+"""
+
+import argparse
+import asyncio
+import random
+import selectors
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from bot_keydrop.backend.bot_logic.automation_tasks import ParticipationResult
+from bot_keydrop.backend.bot_logic.scheduler import BotScheduler
+from benchmarks.fakes import FakeAutomation, FakeBrowserManager, FakeConfigManager
+
+
+class _VirtualSelector(selectors.DefaultSelector):
+    """Selector que, em vez de bloquear, avança o relógio virtual do loop"""
+
+    def __init__(self):
+        super().__init__()
+        self.loop: Optional["VirtualTimeLoop"] = None
+
+    def select(self, timeout=None):
+        if timeout and timeout > 0 and self.loop is not None:
+            self.loop.advance(timeout)
+        return super().select(0)
+
+
+class VirtualTimeLoop(asyncio.SelectorEventLoop):
+    """
+    Event loop com relógio virtual
+
+    ``time()`` retorna o tempo simulado; quando não há callbacks prontos o
+    loop salta direto para o próximo timer agendado.
+    """
+
+    def __init__(self, start: Optional[datetime] = None):
+        selector = _VirtualSelector()
+        super().__init__(selector)
+        selector.loop = self
+        self._virtual_time = 0.0
+        self.start_datetime = start or datetime(2025, 1, 1)
+
+    def time(self) -> float:
+        return self._virtual_time
+
+    def advance(self, seconds: float):
+        self._virtual_time += seconds
+
+    def now(self) -> datetime:
+        """Relógio de parede correspondente ao tempo virtual"""
+        return self.start_datetime + timedelta(seconds=self._virtual_time)
+
+
+@dataclass
+class TabProfile:
+    """Distribuições de latência e falha de uma guia simulada"""
+    latency_median: float = 8.0   # segundos por participação
+    latency_sigma: float = 0.5    # dispersão log-normal
+    failure_rate: float = 0.05
+    hang_rate: float = 0.0        # chance de esperar o timeout de goto
+    hang_latency: float = 30.0
+
+
+@dataclass
+class SimulationReport:
+    """Resultado agregado de uma simulação"""
+    tabs: int
+    mode: str
+    simulated_hours: float
+    wall_seconds: float
+    participations: int
+    executions: int
+    retries: int
+    reschedules: int
+    tab_restarts: int
+    dispatch_lag: List[float] = field(default_factory=list)
+
+    def percentile(self, q: float) -> float:
+        if not self.dispatch_lag:
+            return 0.0
+        ordered = sorted(self.dispatch_lag)
+        index = min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    @property
+    def participations_per_hour(self) -> float:
+        return self.participations / self.simulated_hours if self.simulated_hours else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            'tabs': self.tabs,
+            'mode': self.mode,
+            'simulated_hours': self.simulated_hours,
+            'wall_seconds': round(self.wall_seconds, 3),
+            'participations': self.participations,
+            'participations_per_hour': round(self.participations_per_hour, 1),
+            'executions': self.executions,
+            'retries': self.retries,
+            'reschedules': self.reschedules,
+            'tab_restarts': self.tab_restarts,
+            'dispatch_lag_p50': round(self.percentile(50), 3),
+            'dispatch_lag_p95': round(self.percentile(95), 3),
+            'dispatch_lag_p99': round(self.percentile(99), 3),
+        }
+
+
+class SimulatedAutomation(FakeAutomation):
+    """
+    Automação com latência log-normal e falhas sorteadas por guia
+
+    Guias cuja última participação falhou ou travou são marcadas no
+    navegador simulado, para que a triagem do agendador as recupere.
+    """
+
+    def __init__(self, profiles: Dict[int, TabProfile], default: TabProfile, seed: int,
+                 browser: Optional[FakeBrowserManager] = None):
+        self.profiles = profiles
+        self.default = default
+        self.rng = random.Random(seed)
+        self.browser = browser
+        self._hung: Dict[int, bool] = {}
+        super().__init__(self._latency, self._outcome)
+
+    def _profile(self, tab_id: int) -> TabProfile:
+        return self.profiles.get(tab_id, self.default)
+
+    def _latency(self, tab_id: int) -> float:
+        profile = self._profile(tab_id)
+        self._hung[tab_id] = bool(profile.hang_rate and self.rng.random() < profile.hang_rate)
+        if self._hung[tab_id]:
+            return profile.hang_latency
+        return self.rng.lognormvariate(0, profile.latency_sigma) * profile.latency_median
+
+    def _outcome(self, tab_id: int) -> ParticipationResult:
+        failed = self.rng.random() < self._profile(tab_id).failure_rate
+        if self.browser is not None:
+            self.browser.mark_unhealthy(tab_id, failed or self._hung.get(tab_id, False))
+        return ParticipationResult.FAILED if failed else ParticipationResult.SUCCESS
+
+
+async def _simulate(scheduler: BotScheduler, loop: VirtualTimeLoop, report: SimulationReport,
+                    duration: float):
+    original_execute = scheduler._execute_single_task
+
+    async def instrumented(task):
+        report.dispatch_lag.append(max(0.0, (loop.now() - task.next_execution).total_seconds()))
+        await original_execute(task)
+        report.executions += 1
+        if task.last_result != ParticipationResult.SUCCESS.value and task.retry_count:
+            remaining = (task.next_execution - loop.now()).total_seconds()
+            if remaining >= scheduler.reschedule_delay - 1:
+                report.reschedules += 1
+            else:
+                report.retries += 1
+
+    scheduler._execute_single_task = instrumented
+
+    await scheduler.start_bot()
+    await asyncio.sleep(duration)
+
+    # Encerrar sem registrar histórico de performance em disco
+    scheduler.should_stop = True
+    scheduler.is_running = False
+    scheduler._wakeup.set()
+    if scheduler.main_task:
+        scheduler.main_task.cancel()
+        await asyncio.gather(scheduler.main_task, return_exceptions=True)
+    await scheduler._stop_tab_workers()
+    await scheduler._cancel_all_tasks()
+
+
+def run_simulation(num_tabs: int,
+                   hours: float = 1.0,
+                   mode: str = "batch",
+                   profile: Optional[TabProfile] = None,
+                   tab_profiles: Optional[Dict[int, TabProfile]] = None,
+                   seed: int = 42,
+                   **config_overrides) -> SimulationReport:
+    """
+    Executa o BotScheduler real em tempo virtual
+
+    Args:
+        num_tabs: Número de guias simuladas
+        hours: Horas de operação simulada
+        mode: scheduler_mode ('batch' ou 'per_tab')
+        profile: Perfil padrão das guias
+        tab_profiles: Perfis específicos por guia
+        seed: Semente para resultados reproduzíveis
+        **config_overrides: Campos adicionais de BotConfig
+
+    Returns:
+        Relatório da simulação
+    """
+    config = {
+        'num_tabs': num_tabs,
+        'scheduler_mode': mode,
+        'enable_login_tabs': False,
+        'checkpoint_enabled': False,
+        'adaptive_concurrency': False,
+    }
+    config.update(config_overrides)
+
+    loop = VirtualTimeLoop()
+    browser = FakeBrowserManager()
+    automation = SimulatedAutomation(tab_profiles or {}, profile or TabProfile(), seed, browser)
+    report = SimulationReport(
+        tabs=num_tabs, mode=mode, simulated_hours=hours, wall_seconds=0.0,
+        participations=0, executions=0, retries=0, reschedules=0, tab_restarts=0,
+    )
+
+    started = time.perf_counter()
+    try:
+        asyncio.set_event_loop(loop)
+        scheduler = BotScheduler(browser, automation, FakeConfigManager(**config))
+        scheduler._now = loop.now
+        scheduler.resource_monitor = None
+        loop.run_until_complete(_simulate(scheduler, loop, report, hours * 3600))
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+    report.wall_seconds = time.perf_counter() - started
+    report.participations = automation.participations
+    report.tab_restarts = browser.restarts
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tabs", type=int, nargs="+", default=[5, 20, 100])
+    parser.add_argument("--hours", type=float, default=4.0)
+    parser.add_argument("--mode", choices=["batch", "per_tab"], nargs="+", default=["batch", "per_tab"])
+    parser.add_argument("--latency", type=float, default=8.0, help="Mediana da participação (s)")
+    parser.add_argument("--failure-rate", type=float, default=0.05)
+    parser.add_argument("--hang-rate", type=float, default=0.02)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    profile = TabProfile(latency_median=args.latency, failure_rate=args.failure_rate, hang_rate=args.hang_rate)
+    columns = ['tabs', 'mode', 'participations_per_hour', 'dispatch_lag_p50', 'dispatch_lag_p95',
+               'dispatch_lag_p99', 'retries', 'reschedules', 'tab_restarts', 'wall_seconds']
+    print(" | ".join(columns))
+    for tabs in args.tabs:
+        for mode in args.mode:
+            data = run_simulation(tabs, args.hours, mode, profile, seed=args.seed).to_dict()
+            print(" | ".join(str(data[c]) for c in columns))
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.INFO)
+    main()
@@ -7,10 +7,16 @@ from .macro_recorder import MacroRecorder
 from .automation_tasks import KeydropAutomation, ParticipationResult, ParticipationAttempt, create_keydrop_automation
 from .scheduler import BotScheduler, BotStatus, TaskStatus, ScheduledTask, BotStatistics, create_bot_scheduler
 from .tab_watchdog import TabWatchdog
+from .tab_metrics import TabBudget, TabUsage
+from .metrics import LatencyHistogram, SchedulerMetrics
+from .event_bus import EventBus
+from .concurrency import AdaptiveLimiter
+from .resource_policy import ResourcePolicy
 
 __all__ = [
     'BrowserManager', 'TabInfo', 'browser_manager',
     'KeydropAutomation', 'ParticipationResult', 'ParticipationAttempt', 'create_keydrop_automation',
     'BotScheduler', 'BotStatus', 'TaskStatus', 'ScheduledTask', 'BotStatistics', 'create_bot_scheduler',
-    'TabWatchdog', 'MacroRecorder'
+    'TabWatchdog', 'MacroRecorder', 'LatencyHistogram', 'SchedulerMetrics',
+    'EventBus', 'AdaptiveLimiter', 'ResourcePolicy', 'TabBudget', 'TabUsage'
 ]
@@ -5,14 +5,22 @@ Contém a lógica para interagir com o Keydrop e executar participações em sor
 
 import asyncio
 import logging
+import re
 import secrets
+from pathlib import Path
 from bot_keydrop.performance_utils import measure_time
-from typing import Dict, List, Optional, Any, Tuple, Deque
-from collections import deque
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
+from urllib.parse import urlsplit
 from ..learning.learner import ParticipationLearner
+from .browser_manager import same_page
+from .lottery_snapshot import LotteryCard, resolve_join_link, snapshot_lotteries
+from .page_freshness import TRANSFER_SCRIPT, PageFreshness
+from .participation_store import ParticipationStore
+from .template_matcher import TemplateMatcher
+from .wait_engine import WaitEngine
 
 # Configuração de logging
 logging.basicConfig(level=logging.INFO)
@@ -85,7 +93,24 @@ class KeydropAutomation:
         'already_participated': '.already-participated, .participated, [class*="disabled"]',
         'loading': '.loading, .spinner, [class*="loading"]',
         'error_message': '.error, .alert-danger, .error-message',
-        'login_required': '.login-required, .auth-required, [href*="login"]'
+        'login_required': '.login-required, .auth-required, [href*="login"]',
+        'success_message': '.success-message, .alert-success, [class*="success"], .notification[class*="success"]'
+    }
+
+    # Condição de botão de participação que mudou de estado após o clique
+    BUTTON_CHANGED_SCRIPT = (
+        "(el) => !el.isConnected || el.disabled"
+        " || /participando|participated|sucesso|success|aderiu|participou/i.test(el.innerText)"
+    )
+
+    # Endpoint de participação chamado pelo botão (ex.: /v1/giveaway//joinGiveaway/<id>)
+    JOIN_ENDPOINT = re.compile(r'/giveaways?/(?:[^?#]*/)?join', re.IGNORECASE)
+
+    # Intervalo mínimo após cada ação: limite inferior das pausas fixas que vinham depois dela
+    ACTION_HOLD = {
+        'navigate': 3.0,  # goto inicial: antes 3 a 6s
+        'listing': 1.0,   # goto/reload antes de ler os cards: antes 1 a 3s
+        'join': 4.0,      # clique de participação: antes 2 a 4s + 2s
     }
     
     # URLs importantes
@@ -103,11 +128,13 @@ class KeydropAutomation:
             browser_manager: Instância do gerenciador de navegador
         """
         self.browser_manager = browser_manager
-        # Utilize deque to automatically discard oldest entries when the limit is exceeded
-        self.participation_history: List[ParticipationAttempt] = []
         self.winnings_history: List[WinningRecord] = []
         self.max_history_size = 1000
-        self.participation_history: Deque[ParticipationAttempt] = deque(maxlen=self.max_history_size)
+        # Histórico em colunas: janelas de tempo por busca binária, sem copiar o buffer
+        self.participation_history = ParticipationStore()
+        self.waits = WaitEngine()
+        self.freshness = PageFreshness()
+        self.template_matcher = TemplateMatcher(Path(__file__).parent / 'participar_button.png')
 
         logger.info("Automação Keydrop inicializada")
         self.learner = ParticipationLearner()
@@ -145,12 +172,8 @@ class KeydropAutomation:
                 tab_info.status = 'participating'
                 tab_info.last_activity = datetime.now()
                 
-                # Garantir que estamos na página de sorteios
-                await page.goto(
-                    self.URLS['keydrop_lotteries'],
-                    wait_until='domcontentloaded',
-                    timeout=30000
-                )
+                # Garantir que estamos na página de sorteios (relendo, recarregando ou navegando)
+                await self._ensure_listing(tab_id, page)
                 
                 # Verificar se requer login
                 if await self._check_login_required(page):
@@ -166,6 +189,7 @@ class KeydropAutomation:
                 lotteries = await self._find_available_lotteries(page)
                 
                 if not lotteries:
+                    self.freshness.expire(tab_id)
                     return ParticipationAttempt(
                         tab_id=tab_id,
                         attempt_number=attempt_number,
@@ -193,6 +217,7 @@ class KeydropAutomation:
                 
             except Exception as e:
                 logger.error(f"Erro na tentativa {attempt_number} de participação na guia {tab_id}: {e}")
+                self.freshness.mark_broken(tab_id)
                 attempt_number += 1
                 if attempt_number <= max_retries:
                     await asyncio.sleep(secrets.SystemRandom().uniform(3, 7))
@@ -212,6 +237,58 @@ class KeydropAutomation:
         self._add_to_history(result)
         return result
     
+    async def _ensure_listing(self, tab_id: int, page) -> str:
+        """
+        Deixa a listagem de sorteios atualizada com o menor custo
+
+        Args:
+            tab_id: ID da guia
+            page: Página do Playwright
+
+        Returns:
+            Ação executada: 'reuse', 'reload' ou 'goto'
+        """
+        listing_url = self.URLS['keydrop_lotteries']
+        action = self.freshness.decide(tab_id, page.url, listing_url)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        transferred = 0
+        if action != 'reuse':
+            await self.waits.pace(tab_id)
+            if action == 'reload':
+                await page.reload(wait_until='domcontentloaded', timeout=30000)
+            else:
+                await page.goto(listing_url, wait_until='domcontentloaded', timeout=30000)
+            self.waits.hold(tab_id, self.ACTION_HOLD['listing'])
+            self.freshness.mark_loaded(tab_id)
+            transferred = await self._transferred_bytes(page)
+        self.freshness.record(action, loop.time() - started, transferred)
+        return action
+
+    @staticmethod
+    async def _transferred_bytes(page) -> int:
+        """Bytes transferidos pela última navegação (0 se indisponível)"""
+        try:
+            return int(await page.evaluate(TRANSFER_SCRIPT) or 0)
+        except Exception:
+            return 0
+
+    async def _return_to_listing(self, tab_id: int, page):
+        """
+        Volta à listagem somente se a ação anterior navegou para fora dela
+
+        Args:
+            tab_id: ID da guia
+            page: Página do Playwright
+        """
+        listing_url = self.URLS['keydrop_lotteries']
+        if same_page(page.url, listing_url):
+            return
+        await self.waits.pace(tab_id)
+        await page.go_back(wait_until='domcontentloaded')
+        if not same_page(page.url, listing_url):
+            self.freshness.mark_broken(tab_id)
+
     async def _check_login_required(self, page) -> bool:
         """
         Verifica se a página requer login
@@ -238,24 +315,16 @@ class KeydropAutomation:
         Returns:
             Lista de sorteios encontrados
         """
-        lotteries = []
-        
         try:
-            # Aguardar um momento para carregamento
-            await asyncio.sleep(secrets.SystemRandom().uniform(1, 3))
+            # Aguardar a lista de cards (antes: pausa fixa de 1 a 3s)
+            await self._wait_for_lottery_list(page, 'lottery_list', timeout=3.0, fixed=2.0)
             
-            # Procurar cards de sorteio disponíveis
-            cards = await page.query_selector_all(self.SELECTORS['giveaway_card'])
-
-            for card in cards:
-                try:
-                    link = await card.query_selector(self.SELECTORS['join_link'])
-                    if link and await link.is_enabled():
-                        lottery_info = await self._extract_lottery_info(card)
-                        lotteries.append({'card': card, 'link': link, 'info': lottery_info})
-                except Exception as e:
-                    logger.debug(f"Erro ao processar card de sorteio: {e}")
-                    continue
+            # Um único evaluate lê todos os cards; handles só para o card escolhido
+            cards = await snapshot_lotteries(page, self.SELECTORS)
+            lotteries = [
+                {'card': card, 'link': None, 'info': card.info}
+                for card in cards if card.enabled
+            ]
             
             logger.info(f"Encontrados {len(lotteries)} sorteios disponíveis")
             return lotteries
@@ -264,38 +333,36 @@ class KeydropAutomation:
             logger.error(f"Erro ao procurar sorteios: {e}")
             return []
     
-    async def _extract_lottery_info(self, card) -> Dict[str, Any]:
+    async def _resolve_link(self, page, lottery: Dict[str, Any]):
         """
-        Extrai informações de um sorteio
-        
+        Resolve o link de participação do sorteio no momento do uso
+
+        Os handles não são guardados: cada tentativa navega e volta, o que
+        invalidaria handles obtidos antes.
+
         Args:
-            card: Elemento do card de sorteio
-            
+            page: Página do Playwright
+            lottery: Sorteio retornado por _find_available_lotteries
+
         Returns:
-            Informações do sorteio
+            ElementHandle do link ou None se o card sumiu da página
         """
-        info = {
-            'title': '',
-            'type': 'unknown',
-            'is_amateur': False
-        }
-        
-        try:
-            # Procurar título dentro do card
-            title_element = await card.query_selector(self.SELECTORS['lottery_title'])
-            if title_element:
-                info['title'] = await title_element.inner_text()
-
-            # Verificar se é sorteio AMATEUR
-            amateur_element = await card.query_selector(self.SELECTORS['amateur_lottery'])
-            if amateur_element or 'amateur' in info['title'].lower():
-                info['type'] = 'amateur'
-                info['is_amateur'] = True
-        
-        except Exception as e:
-            logger.debug(f"Erro ao extrair informações do sorteio: {e}")
-        
-        return info
+        card = lottery.get('card')
+        if not isinstance(card, LotteryCard):
+            return lottery.get('link')
+        return await resolve_join_link(page, card, self.SELECTORS)
+
+    def _link_not_found(self, lottery: Dict[str, Any], tab_id: int, attempt_number: int) -> ParticipationAttempt:
+        """Resultado de um sorteio cujo card sumiu entre o snapshot e a tentativa"""
+        return ParticipationAttempt(
+            tab_id=tab_id,
+            attempt_number=attempt_number,
+            timestamp=datetime.now(),
+            result=ParticipationResult.BUTTON_NOT_FOUND,
+            error_message='Sorteio não está mais na página',
+            lottery_type=lottery['info']['type'],
+            lottery_title=lottery['info']['title']
+        )
 
     async def _try_participation_methods(self, page, lottery: Dict[str, Any], tab_id: int, attempt_number: int) -> ParticipationAttempt:
         """Try multiple participation strategies and record results."""
@@ -350,10 +417,13 @@ class KeydropAutomation:
             Resultado da tentativa
         """
         try:
-            link = lottery['link']
+            link = await self._resolve_link(page, lottery)
             lottery_info = lottery['info']
+            if link is None:
+                return self._link_not_found(lottery, tab_id, attempt_number)
             
             # Abrir página do sorteio
+            await self.waits.pace(tab_id)
             await link.click()
             await page.wait_for_load_state('domcontentloaded', timeout=15000)
 
@@ -367,7 +437,7 @@ class KeydropAutomation:
                     join_button = None
 
             if not join_button:
-                await page.go_back()
+                await self._return_to_listing(tab_id, page)
                 return ParticipationAttempt(
                     tab_id=tab_id,
                     attempt_number=attempt_number,
@@ -381,7 +451,7 @@ class KeydropAutomation:
             # Verificar se já participou
             button_text = await join_button.inner_text()
             if any(word in button_text.lower() for word in ['já aderiu', 'já participou', 'participando']):
-                await page.go_back()
+                await self._return_to_listing(tab_id, page)
                 return ParticipationAttempt(
                     tab_id=tab_id,
                     attempt_number=attempt_number,
@@ -396,20 +466,22 @@ class KeydropAutomation:
             await asyncio.sleep(secrets.SystemRandom().uniform(0.5, 1.5))
 
             # Clicar no botão
+            await self.waits.pace(tab_id)
+            response = self._watch_join_response(page)
             await join_button.click()
+            self.waits.hold(tab_id, self.ACTION_HOLD['join'])
 
-            # Aguardar resultado da participação
-            await asyncio.sleep(secrets.SystemRandom().uniform(2, 4))
-
-            # Verificar se a participação foi bem-sucedida
-            success = await self._verify_participation_success(page, join_button)
+            # Aguardar e verificar o resultado (antes: pausas fixas de 2 a 4s + 2s)
+            success = await self._verify_participation_success(
+                page, join_button, response, timeout=6.0, fixed=5.0
+            )
 
             result = ParticipationResult.SUCCESS if success else ParticipationResult.FAILED
 
             logger.info(f"Participação na guia {tab_id}: {result.value}")
 
             # Voltar para a página de sorteios
-            await page.go_back()
+            await self._return_to_listing(tab_id, page)
 
             return ParticipationAttempt(
                 tab_id=tab_id,
@@ -430,20 +502,88 @@ class KeydropAutomation:
                 error_message=str(e)
             )
     
-    async def _verify_participation_success(self, page, button) -> bool:
+    async def _wait_for_lottery_list(self, page, name: str, timeout: float, fixed: float) -> bool:
+        """Aguarda os cards de sorteio aparecerem na página"""
+        return await self.waits.until(
+            name,
+            [page.wait_for_selector(self.SELECTORS['giveaway_card'], state='attached',
+                                    timeout=timeout * 1000)],
+            timeout=timeout,
+            fixed=fixed,
+        )
+
+    @classmethod
+    def _is_join_response(cls, response) -> bool:
+        """Resposta da requisição de participação enviada pelo clique (POST/PUT no endpoint de entrada)"""
+        return (response.request.method in ('POST', 'PUT')
+                and cls.JOIN_ENDPOINT.search(urlsplit(response.url).path) is not None)
+
+    @staticmethod
+    async def _join_accepted(response) -> bool:
+        """
+        Conclui somente se a resposta de participação for 2xx
+
+        Uma resposta de erro não encerra a espera: a condição falha e as
+        condições da página continuam valendo até o prazo.
+        """
+        result = await response
+        if not result.ok:
+            raise RuntimeError(f"Participação recusada: HTTP {result.status}")
+        return True
+
+    def _watch_join_response(self, page, timeout: float = 6.0) -> asyncio.Future:
+        """
+        Arma a espera pela resposta de participação antes do clique
+
+        Args:
+            page: Página do Playwright
+            timeout: Prazo da espera (segundos)
+
+        Returns:
+            Future concluído quando a resposta chega
+        """
+        future = asyncio.ensure_future(
+            page.wait_for_event('response', predicate=self._is_join_response, timeout=timeout * 1000)
+        )
+        # Se o clique falhar, o future é descartado sem gerar aviso de exceção não lida
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        return future
+
+    async def _verify_participation_success(self, page, button, response=None,
+                                            timeout: float = 4.0, fixed: float = 4.0) -> bool:
         """
         Verifica se a participação foi bem-sucedida
         
         Args:
             page: Página do Playwright
             button: Botão que foi clicado
+            response: Espera armada por _watch_join_response antes do clique
+            timeout: Prazo para o resultado aparecer (segundos)
+            fixed: Pausa fixa que a espera substitui, para as estatísticas
             
         Returns:
             True se a participação foi bem-sucedida
         """
         try:
-            # Aguardar um momento para a página processar
-            await asyncio.sleep(2)
+            # Aguardar o botão mudar, a resposta chegar ou uma mensagem de sucesso
+            conditions = [
+                page.wait_for_selector(self.SELECTORS['success_message'], state='visible',
+                                       timeout=timeout * 1000)
+            ]
+            if button is not None:
+                conditions.append(page.wait_for_function(
+                    self.BUTTON_CHANGED_SCRIPT, arg=button, timeout=timeout * 1000
+                ))
+            if response is not None:
+                conditions.append(self._join_accepted(response))
+            await self.waits.until('participation_result', conditions, timeout=timeout, fixed=fixed)
+
+            # Resposta 2xx do endpoint de participação: a página pode ainda não ter sido atualizada
+            if (response is not None and response.done() and not response.cancelled()
+                    and response.exception() is None and response.result().ok):
+                return True
+            if button is None:
+                return await self._has_success_message(page)
             
             # Verificar mudança no texto do botão
             new_button_text = await button.inner_text()
@@ -459,27 +599,19 @@ class KeydropAutomation:
             if not await button.is_enabled():
                 return True
             
-            # Procurar mensagens de sucesso na página
-            success_selectors = [
-                '.success-message',
-                '.alert-success',
-                '[class*="success"]',
-                '.notification[class*="success"]'
-            ]
-            
-            for selector in success_selectors:
-                element = await page.query_selector(selector)
-                if element and await element.is_visible():
-                    return True
-
-            return False
+            return await self._has_success_message(page)
 
         except Exception as e:
             logger.debug(f"Erro ao verificar sucesso da participação: {e}")
             return False
-        except Exception as e:
-            logger.debug(f"Erro ao verificar sucesso da participação: {e}")
-            return False
+
+    async def _has_success_message(self, page) -> bool:
+        """Procura mensagens de sucesso visíveis na página"""
+        for selector in self.SELECTORS['success_message'].split(', '):
+            element = await page.query_selector(selector)
+            if element and await element.is_visible():
+                return True
+        return False
 
     async def _attempt_with_learned_selector(self, page, lottery: Dict[str, Any], tab_id: int, attempt_number: int, selector: str) -> ParticipationAttempt:
         """Try learned selector with text and image fallbacks."""
@@ -505,14 +637,17 @@ class KeydropAutomation:
     async def _attempt_participation_js(self, page, lottery: Dict[str, Any], tab_id: int, attempt_number: int) -> ParticipationAttempt:
         """Alternative participation using direct JavaScript calls."""
         try:
-            link = lottery['link']
+            link = await self._resolve_link(page, lottery)
             lottery_info = lottery['info']
+            if link is None:
+                return self._link_not_found(lottery, tab_id, attempt_number)
 
+            await self.waits.pace(tab_id)
             await page.evaluate('(el) => el.click()', link)
             await page.wait_for_load_state('domcontentloaded', timeout=15000)
             join_button = await page.query_selector(self.SELECTORS['join_button'])
             if not join_button:
-                await page.go_back()
+                await self._return_to_listing(tab_id, page)
                 return ParticipationAttempt(
                     tab_id=tab_id,
                     attempt_number=attempt_number,
@@ -521,10 +656,12 @@ class KeydropAutomation:
                     lottery_type=lottery_info['type'],
                     lottery_title=lottery_info['title']
                 )
+            await self.waits.pace(tab_id)
+            response = self._watch_join_response(page)
             await page.evaluate('(el) => el.click()', join_button)
-            await asyncio.sleep(2)
-            success = await self._verify_participation_success(page, join_button)
-            await page.go_back()
+            self.waits.hold(tab_id, self.ACTION_HOLD['join'])
+            success = await self._verify_participation_success(page, join_button, response)
+            await self._return_to_listing(tab_id, page)
             result = ParticipationResult.SUCCESS if success else ParticipationResult.FAILED
             return ParticipationAttempt(
                 tab_id=tab_id,
@@ -547,23 +684,19 @@ class KeydropAutomation:
     async def _attempt_participation_image(self, page, lottery: Dict[str, Any], tab_id: int, attempt_number: int) -> ParticipationAttempt:
         """Fallback participation using image recognition."""
         try:
-            import cv2
-            from pathlib import Path
-            screenshot_path = Path(Path.cwd() / f"screen_{tab_id}.png")
-            await page.screenshot(path=str(screenshot_path))
-            template_path = Path(__file__).parent / 'participar_button.png'
-            if not template_path.exists():
+            if not self.template_matcher.template_path.exists():
                 return ParticipationAttempt(tab_id=tab_id, attempt_number=attempt_number, timestamp=datetime.now(), result=ParticipationResult.FAILED, error_message='template_not_found')
-            img = cv2.imread(str(screenshot_path))
-            templ = cv2.imread(str(template_path))
-            res = cv2.matchTemplate(img, templ, cv2.TM_CCOEFF_NORMED)
-            _, max_val, _, max_loc = cv2.minMaxLoc(res)
-            if max_val >= 0.8:
-                x, y = max_loc
-                await page.mouse.click(x + templ.shape[1] / 2, y + templ.shape[0] / 2)
-                await asyncio.sleep(2)
-                success = await self._verify_participation_success(page, None)
-                await page.go_back()
+            # Screenshot em memória; decodificação e busca fora do event loop
+            screenshot = await page.screenshot()
+            found = await asyncio.to_thread(self.template_matcher.match, screenshot, tab_id)
+            if found:
+                x, y, _ = found
+                await self.waits.pace(tab_id)
+                response = self._watch_join_response(page)
+                await page.mouse.click(x, y)
+                self.waits.hold(tab_id, self.ACTION_HOLD['join'])
+                success = await self._verify_participation_success(page, None, response)
+                await self._return_to_listing(tab_id, page)
                 result = ParticipationResult.SUCCESS if success else ParticipationResult.FAILED
                 return ParticipationAttempt(tab_id, attempt_number, datetime.now(), result, lottery_type=lottery['info']['type'], lottery_title=lottery['info']['title'])
             return ParticipationAttempt(tab_id=tab_id, attempt_number=attempt_number, timestamp=datetime.now(), result=ParticipationResult.BUTTON_NOT_FOUND, error_message='button_not_found_image')
@@ -584,10 +717,12 @@ class KeydropAutomation:
             return ParticipationAttempt(tab_id=tab_id, attempt_number=attempt_number, timestamp=datetime.now(), result=ParticipationResult.FAILED, error_message='no_coordinates')
         try:
             x, y = coords
+            await self.waits.pace(tab_id)
+            response = self._watch_join_response(page)
             await page.mouse.click(x, y)
-            await asyncio.sleep(2)
-            success = await self._verify_participation_success(page, None)
-            await page.go_back()
+            self.waits.hold(tab_id, self.ACTION_HOLD['join'])
+            success = await self._verify_participation_success(page, None, response)
+            await self._return_to_listing(tab_id, page)
             result = ParticipationResult.SUCCESS if success else ParticipationResult.FAILED
             return ParticipationAttempt(tab_id, attempt_number, datetime.now(), result, lottery_type=lottery['info']['type'], lottery_title=lottery['info']['title'])
         except Exception as e:
@@ -618,10 +753,13 @@ class KeydropAutomation:
             page = tab_info.page
             
             # Navegar para página de sorteios
+            await self.waits.pace(tab_id)
             await page.goto(self.URLS['keydrop_lotteries'], wait_until='domcontentloaded', timeout=30000)
+            self.waits.hold(tab_id, self.ACTION_HOLD['navigate'])
+            self.freshness.mark_loaded(tab_id)
             
-            # Aguardar carregamento
-            await asyncio.sleep(secrets.SystemRandom().uniform(3, 6))
+            # Aguardar os cards (antes: pausa fixa de 3 a 6s)
+            await self._wait_for_lottery_list(page, 'navigate', timeout=6.0, fixed=4.5)
             
             tab_info.url = self.URLS['keydrop_lotteries']
             tab_info.status = 'ready'
@@ -673,10 +811,15 @@ class KeydropAutomation:
         Args:
             attempt: Tentativa de participação
         """
-        self.participation_history.append(attempt)
-
-        if len(self.participation_history) >= self.max_history_size:
-            self.participation_history.clear()
+        self.participation_history.append(
+            attempt.timestamp,
+            attempt.tab_id,
+            attempt.result.value,
+            attempt_number=attempt.attempt_number,
+            lottery_type=attempt.lottery_type,
+            lottery_title=attempt.lottery_title,
+            error_message=attempt.error_message,
+        )
 
     async def learn_participation(self, tab_id: int, learn_time: int = 30) -> bool:
         """Record user actions on the page to learn a custom selector."""
@@ -715,14 +858,12 @@ class KeydropAutomation:
         """
         cutoff_time = datetime.now() - timedelta(hours=hours)
         
-        recent_attempts = [
-            attempt for attempt in self.participation_history
-            if attempt.timestamp >= cutoff_time
-        ]
+        counts = self.participation_history.counts(cutoff_time)
+        last_attempt = self.participation_history.last_timestamp(cutoff_time)
         
-        total_attempts = len(recent_attempts)
-        successful = len([a for a in recent_attempts if a.result == ParticipationResult.SUCCESS])
-        failed = len([a for a in recent_attempts if a.result == ParticipationResult.FAILED])
+        total_attempts = counts['total']
+        successful = counts.get(ParticipationResult.SUCCESS.value, 0)
+        failed = counts.get(ParticipationResult.FAILED.value, 0)
         
         success_rate = (successful / total_attempts * 100) if total_attempts > 0 else 0
         
@@ -732,24 +873,69 @@ class KeydropAutomation:
             'failed_participations': failed,
             'success_rate': success_rate,
             'period_hours': hours,
-            'last_attempt': recent_attempts[-1].timestamp.isoformat() if recent_attempts else None
+            'last_attempt': last_attempt.isoformat() if last_attempt else None
         }
+
+    def get_participation_counts(self, since: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Obtém tentativas por resultado desde um instante
+        
+        Args:
+            since: Início da janela (None = todo o histórico mantido)
+            
+        Returns:
+            Contagem por resultado e total
+        """
+        return self.participation_history.counts(since)
     
-    def get_participation_history(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    def get_wait_stats(self) -> Dict[str, Any]:
+        """
+        Obtém o tempo real das esperas comparado às pausas fixas antigas
+        
+        Returns:
+            Estatísticas do motor de esperas
+        """
+        return self.waits.get_stats()
+
+    def get_navigation_stats(self) -> Dict[str, Any]:
+        """
+        Obtém quantas vezes a listagem foi relida, recarregada ou navegada
+        
+        Returns:
+            Contagens, custos e economia estimada
+        """
+        return self.freshness.get_stats()
+
+    def forget_tab(self, tab_id: int):
+        """
+        Descarta o estado de navegação de uma guia cuja página foi trocada
+        
+        Args:
+            tab_id: ID da guia
+        """
+        self.freshness.forget(tab_id)
+
+    def get_image_match_stats(self) -> Dict[str, Any]:
+        """
+        Obtém chamadas, acertos e tempo da busca do botão por imagem
+        
+        Returns:
+            Estatísticas do localizador por template
+        """
+        return self.template_matcher.get_stats()
+
+    def get_participation_history(self, limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
         """
         Obtém histórico de participações
         
         Args:
             limit: Limite de registros (opcional)
+            offset: Quantas tentativas mais recentes pular (paginação)
             
         Returns:
             Lista de tentativas de participação
         """
-        history: List[ParticipationAttempt] = list(self.participation_history)
-        if limit:
-            history = history[-limit:]
-
-        return [attempt.to_dict() for attempt in history]
+        return self.participation_history.page(limit, offset)
 
     def record_winning(self, amount: float, lottery_type: str) -> None:
         """Registra um ganho obtido"""
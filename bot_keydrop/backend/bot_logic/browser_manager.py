@@ -5,20 +5,71 @@ Responsável por iniciar, fechar e gerenciar instâncias do Chrome usando Playwr
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+import os
+import time
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, field
+from .browser_shards import BrowserShard, auto_shard_count, pick_shard
+from .context_pool import ContextPool, PooledContext
 from .macro_recorder import MacroRecorder
+from .metrics import LatencyHistogram
+from .profile_store import ProfileStore
+from .resource_policy import ResourceCounters, ResourcePolicy
+from .session_store import SessionStore
+from .tab_metrics import TabUsage
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import urlsplit
 import json
 import gc
-import uuid
+import psutil
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
 
 # Configuração de logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Restaura o localStorage do session.json em contextos pré-aquecidos (uma vez por aba)
+RESTORE_LOCAL_STORAGE_SCRIPT = """
+(() => {
+    const origins = %s;
+    try {
+        if (window.sessionStorage.getItem('__session_restored')) return;
+        const entry = origins.find(o => o.origin === window.location.origin);
+        if (!entry) return;
+        for (const item of entry.localStorage || []) {
+            window.localStorage.setItem(item.name, item.value);
+        }
+        window.sessionStorage.setItem('__session_restored', '1');
+    } catch (e) {}
+})();
+"""
+
+# Sonda de vivacidade: uma única avaliação curta no renderer
+PROBE_SCRIPT = "() => [document.readyState, location.href]"
+
+
+def same_page(url: Optional[str], expected: Optional[str]) -> bool:
+    """Compara host e caminho, ignorando query, fragmento e barra final"""
+    if not expected or expected == "about:blank":
+        return True
+    if not url:
+        return False
+    current, target = urlsplit(url), urlsplit(expected)
+    return (current.netloc == target.netloc
+            and current.path.rstrip('/') == target.path.rstrip('/'))
+
+
+@dataclass
+class TabProbe:
+    """Resultado da sonda de vivacidade de uma guia"""
+    alive: bool  # renderer respondeu dentro do prazo
+    on_page: bool  # página esperada carregada (não apenas 'loading')
+    ready_state: Optional[str]
+    url: Optional[str]
+    latency: float
+    error: Optional[str] = None
+
 
 @dataclass
 class TabInfo:
@@ -33,6 +84,12 @@ class TabInfo:
     participation_count: int = 0
     proxy: str = ""
     macro_recorder: Optional[MacroRecorder] = None
+    pooled: bool = False  # criada a partir de um contexto pré-aquecido
+    resources: Optional[ResourceCounters] = None
+    usage: TabUsage = field(default_factory=TabUsage)  # memória/CPU via CDP
+    shard: int = 0  # índice do navegador que hospeda a guia
+    responsive: Optional[bool] = None  # resultado da última sonda
+    probe_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
     
     def to_dict(self) -> Dict[str, Any]:
         """Converte para dicionário"""
@@ -43,21 +100,54 @@ class TabInfo:
             'last_activity': self.last_activity.isoformat(),
             'error_count': self.error_count,
             'participation_count': self.participation_count,
-            'proxy': self.proxy
+            'proxy': self.proxy,
+            'pooled': self.pooled,
+            'shard': self.shard,
+            'responsive': self.responsive,
+            'probe_latency': self.probe_latency.to_dict(),
+            'resources': self.resources.to_dict() if self.resources else None,
+            **self.usage.to_dict()
         }
 
 
 class BrowserManager:
     """Gerenciador de navegador usando Playwright"""
+
+    RECOVERY_TIERS = ('reload', 'new_page', 'new_context')
     
     def __init__(self, page_load_timeout: int = 30_000):
         """Inicializa o gerenciador de navegador"""
         self.playwright: Optional[Playwright] = None
-        self.browser: Optional[Browser] = None
+        self.browser: Optional[Browser] = None  # navegador do shard 0
+        self.browser_shards = 1  # número de navegadores (0 = automático pelos núcleos)
+        self.shards: List[BrowserShard] = []
+        self._launch_options: Dict[str, Any] = {}
+        self._stopping = False
+        self.shutdown_timeout = 5.0  # prazo global do encerramento (segundos)
+        self.emergency_timeout = 2.0
+        # Tempo mínimo para playwright.stop() mesmo com o prazo esgotado; depois o driver é finalizado
+        self.driver_stop_grace = 2.0
+        self.last_shutdown: Optional[Dict[str, Any]] = None
+        # Driver e navegador pré-aquecidos: reaproveitados entre parar/iniciar
+        self.keep_driver = True
+        self._warm_browsers: List[Browser] = []
+        self._warm_options: Optional[Dict[str, Any]] = None
+        self._prewarm_task: Optional[asyncio.Task] = None
+        self.last_startup: Optional[Dict[str, Any]] = None
+        self.startup_latency: Dict[str, LatencyHistogram] = {
+            'cold': LatencyHistogram(),
+            'driver_warm': LatencyHistogram(),
+            'warm': LatencyHistogram(),
+        }
         self.tabs: Dict[int, TabInfo] = {}
         self.contexts: Dict[int, BrowserContext] = {}  # Contexts por tab_id
         self.user_profiles_dir = Path("profiles")  # Diretório base para perfis
         self.tab_profiles: Dict[int, Path] = {}
+        self._profile_store: Optional[ProfileStore] = None
+        self.profile_disk_budget_mb = 1024  # 0 = sem limite
+        self.profile_gc_interval = 3600.0  # segundos
+        self.num_tabs = 0  # guias configuradas: perfis de 1..num_tabs nunca são despejados
+        self._profile_gc_task: Optional[asyncio.Task] = None
         self.macro_dir = Path("macros")
         self.is_running = False
         self.headless_mode = False
@@ -65,10 +155,30 @@ class BrowserManager:
         self.enable_stealth = True
         self.keep_cookies = True
         self.optimize_resources = True
+        self.resource_policy = ResourcePolicy()
+        self.session_store = SessionStore()
+        self._cdp_sessions: Dict[int, Tuple[Page, Any]] = {}  # Sessões CDP por tab_id
         self.user_data_dir = None
         self.browser_args = []
         self.page_load_timeout = page_load_timeout
         self.proxy_manager = None
+
+        # Pool de contextos pré-aquecidos para reinícios e novas guias
+        self.context_pool_size = 2
+        self.context_pool: Optional[ContextPool] = None
+        self.restart_latency: Dict[str, LatencyHistogram] = {
+            'pooled': LatencyHistogram(),
+            'cold': LatencyHistogram(),
+        }
+
+        # Escada de recuperação: recarregar -> nova página -> novo contexto
+        self.recovery_reload_timeout = 15.0  # segundos
+        self.recovery_page_timeout = 20.0  # segundos
+        self.probe_timeout = 2.0  # segundos
+        self.recovery_stats: Dict[str, Dict[str, Any]] = {
+            tier: {'attempts': 0, 'successes': 0, 'latency': LatencyHistogram()}
+            for tier in self.RECOVERY_TIERS
+        }
         
         # Configurações do navegador
         self.default_viewport = {'width': 1280, 'height': 720}
@@ -98,56 +208,67 @@ class BrowserManager:
         Returns:
             True se iniciou com sucesso
         """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
         try:
             # Forçar execução visível para simular interação humana
             self.headless_mode = False
             self.mini_window_mode = mini_window
             self.user_data_dir = user_data_dir
             self.enable_stealth = stealth
-            
-            # Inicializar Playwright
-            self.playwright = await async_playwright().start()
-            
-            # Configurar argumentos do navegador
-            browser_args = [
-                '--disable-dev-shm-usage',
-                '--disable-gpu',
-                '--disable-extensions',
-                '--disable-plugins',
-                '--disable-images',  # Para economizar banda
-                '--disable-javascript-harmony-shipping',
-                '--disable-background-timer-throttling',
-                '--disable-backgrounding-occluded-windows',
-                '--disable-renderer-backgrounding',
-                '--disable-field-trial-config',
-                '--disable-ipc-flooding-protection',
-                '--disable-default-apps',
-                '--start-maximized'
-            ]
-            
-            # Adicionar argumentos para economizar recursos
-            if self.mini_window_mode:
-                browser_args.extend([
-                    f'--window-size={self.mini_viewport["width"]},{self.mini_viewport["height"]}',
-                    '--force-device-scale-factor=0.5'
-                ])
-            
-            # Configurar contexto do navegador
-            launch_options = {
-                'headless': self.headless_mode,
-                'args': browser_args,
-                'ignore_default_args': ['--enable-blink-features=IdleDetection']  # Evitar detecção de automação
-            }
-            
-            if self.user_data_dir:
-                launch_options['user_data_dir'] = self.user_data_dir
-            
-            # Iniciar navegador Google Chrome
-            launch_options["channel"] = "chrome"  # garantir uso do Chrome estável
-            self.browser = await self.playwright.chromium.launch(**launch_options)
+
+            # Um pré-aquecimento em andamento é aproveitado em vez de duplicado
+            if self._prewarm_task and not self._prewarm_task.done():
+                await asyncio.shield(self._prewarm_task)
+
+            # Inicializar Playwright (ou reaproveitar o driver já iniciado)
+            driver_reused = self.playwright is not None
+            await self._ensure_driver()
+
+            launch_options = self._build_launch_options()
+            self._launch_options = launch_options
+            shard_count = self.browser_shards or auto_shard_count()
+            browsers = await self._take_warm_browsers(launch_options, shard_count)
+            reused = len(browsers)
+            browsers += await self._launch_browsers(launch_options, shard_count - reused)
+
+            self.shards = [BrowserShard(index, browser) for index, browser in enumerate(browsers)]
+            for shard in self.shards:
+                self._watch_shard(shard)
+            self.browser = self.shards[0].browser
             self.is_running = True
-            
-            logger.info(f"Navegador iniciado - Headless: {headless}, Mini: {mini_window}")
+
+            # Coleta de perfis órfãos/excedentes em segundo plano
+            if self._profile_gc_task is None or self._profile_gc_task.done():
+                self._profile_gc_task = asyncio.create_task(self._profile_gc_loop())
+
+            # Pré-aquecer contextos em segundo plano
+            if self.context_pool_size > 0:
+                self.context_pool = ContextPool(
+                    self._create_warm_context, self.context_pool_size, self._release_reservation
+                )
+                self.context_pool.start()
+            
+            duration = loop.time() - started
+            if driver_reused and reused == shard_count:
+                mode = 'warm'
+            elif driver_reused:
+                mode = 'driver_warm'
+            else:
+                mode = 'cold'
+            self.startup_latency[mode].record(duration)
+            self.last_startup = {
+                'mode': mode,
+                'duration': round(duration, 3),
+                'driver_reused': driver_reused,
+                'browsers_reused': reused,
+                'shards': shard_count,
+            }
+
+            logger.info(
+                f"Navegador iniciado ({mode}) em {duration:.2f}s - Headless: {headless}, "
+                f"Mini: {mini_window}, Shards: {len(self.shards)}"
+            )
             return True
             
         except Exception as e:
@@ -155,6 +276,223 @@ class BrowserManager:
             await self.stop_browser()
             return False
     
+    def _build_launch_options(self) -> Dict[str, Any]:
+        """Opções de lançamento do Chrome para o modo atual"""
+        browser_args = [
+            '--disable-dev-shm-usage',
+            '--disable-gpu',
+            '--disable-extensions',
+            '--disable-plugins',
+            '--disable-images',  # Para economizar banda
+            '--disable-javascript-harmony-shipping',
+            '--disable-background-timer-throttling',
+            '--disable-backgrounding-occluded-windows',
+            '--disable-renderer-backgrounding',
+            '--disable-field-trial-config',
+            '--disable-ipc-flooding-protection',
+            '--disable-default-apps',
+            '--start-maximized'
+        ]
+
+        # Adicionar argumentos para economizar recursos
+        if self.mini_window_mode:
+            browser_args.extend([
+                f'--window-size={self.mini_viewport["width"]},{self.mini_viewport["height"]}',
+                '--force-device-scale-factor=0.5'
+            ])
+
+        launch_options = {
+            'headless': self.headless_mode,
+            'args': browser_args,
+            'ignore_default_args': ['--enable-blink-features=IdleDetection']  # Evitar detecção de automação
+        }
+
+        if self.user_data_dir:
+            launch_options['user_data_dir'] = self.user_data_dir
+
+        launch_options["channel"] = "chrome"  # garantir uso do Chrome estável
+        return launch_options
+
+    async def _ensure_driver(self):
+        """Inicia o driver do Playwright se ainda não estiver rodando"""
+        if self.playwright is None:
+            self.playwright = await async_playwright().start()
+
+    async def _launch_browsers(self, launch_options: Dict[str, Any], count: int) -> List[Browser]:
+        """Lança ``count`` navegadores em paralelo; em caso de falha fecha os que abriram"""
+        if count <= 0:
+            return []
+        browsers = await asyncio.gather(
+            *(self.playwright.chromium.launch(**launch_options) for _ in range(count)),
+            return_exceptions=True,
+        )
+        failures = [b for b in browsers if isinstance(b, BaseException)]
+        if failures:
+            await asyncio.gather(
+                *(b.close() for b in browsers if not isinstance(b, BaseException)),
+                return_exceptions=True,
+            )
+            raise failures[0]
+        return list(browsers)
+
+    async def _take_warm_browsers(self, launch_options: Dict[str, Any], count: int) -> List[Browser]:
+        """Retira navegadores pré-aquecidos compatíveis; os demais são fechados"""
+        warm, self._warm_browsers = self._warm_browsers, []
+        options, self._warm_options = self._warm_options, None
+        usable = [b for b in warm if b.is_connected()] if options == launch_options else []
+        taken, extra = usable[:count], [b for b in warm if b not in usable[:count]]
+        if extra:
+            await asyncio.gather(*(b.close() for b in extra), return_exceptions=True)
+        return taken
+
+    async def prewarm(self, mini_window: bool = False) -> bool:
+        """
+        Inicia o driver e os navegadores antes do primeiro start
+
+        Os navegadores ficam sem guias até ``start_browser`` adotá-los.
+
+        Args:
+            mini_window: Modo de janela que será usado no start
+
+        Returns:
+            True se o pré-aquecimento foi concluído
+        """
+        if self.is_running:
+            return True
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            self.headless_mode = False
+            self.mini_window_mode = mini_window
+            await self._ensure_driver()
+            driver_time = loop.time() - started
+
+            launch_options = self._build_launch_options()
+            count = self.browser_shards or auto_shard_count()
+            browsers = await self._take_warm_browsers(launch_options, count)
+            browsers += await self._launch_browsers(launch_options, count - len(browsers))
+            self._warm_browsers, self._warm_options = browsers, launch_options
+            logger.info(
+                f"Navegador pré-aquecido em {loop.time() - started:.2f}s "
+                f"(driver {driver_time:.2f}s, {len(browsers)} navegadores)"
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"Pré-aquecimento do navegador falhou: {e}")
+            return False
+
+    def start_prewarm(self, mini_window: bool = False) -> Optional[asyncio.Task]:
+        """Agenda o pré-aquecimento em segundo plano"""
+        if self.is_running:
+            return None
+        if self._prewarm_task is None or self._prewarm_task.done():
+            self._prewarm_task = asyncio.create_task(self.prewarm(mini_window))
+        return self._prewarm_task
+
+    async def release_driver(self):
+        """Fecha navegadores pré-aquecidos e o driver mantidos entre ciclos"""
+        if self._prewarm_task and not self._prewarm_task.done():
+            self._prewarm_task.cancel()
+            await asyncio.gather(self._prewarm_task, return_exceptions=True)
+        self._prewarm_task = None
+        warm, self._warm_browsers, self._warm_options = self._warm_browsers, [], None
+        if warm:
+            await asyncio.gather(*(b.close() for b in warm), return_exceptions=True)
+        if self.playwright and not self.is_running:
+            playwright, self.playwright = self.playwright, None
+            try:
+                await asyncio.wait_for(playwright.stop(), self.shutdown_timeout)
+            except Exception as e:
+                logger.warning(f"Erro ao encerrar o driver do Playwright: {e}")
+
+    def get_warm_status(self) -> Dict[str, Any]:
+        """Prontidão do driver/navegador e tempos de inicialização frio vs. quente"""
+        return {
+            'driver_ready': self.playwright is not None,
+            'browser_ready': self.is_running or any(b.is_connected() for b in self._warm_browsers),
+            'prewarming': bool(self._prewarm_task and not self._prewarm_task.done()),
+            'last_startup': self.last_startup,
+            'startup_latency': {name: hist.to_dict() for name, hist in self.startup_latency.items()},
+        }
+
+    def _get_shards(self) -> List[BrowserShard]:
+        """Shards ativos; um navegador atribuído diretamente vira o shard 0"""
+        if not self.shards and self.browser is not None:
+            self.shards = [BrowserShard(0, self.browser)]
+        return self.shards
+
+    def _assign_shard(self, tab_id: int, shard: BrowserShard):
+        """Registra a guia no shard (antes de qualquer await, para manter o balanceamento)"""
+        self._release_shard(tab_id)
+        shard.tab_ids.add(tab_id)
+
+    def _release_shard(self, tab_id: int):
+        for shard in self.shards:
+            shard.tab_ids.discard(tab_id)
+
+    def _watch_shard(self, shard: BrowserShard):
+        """Reinicia somente este shard se o processo do navegador cair"""
+        browser = shard.browser
+        browser.on("disconnected", lambda _: self._on_shard_disconnected(shard, browser))
+
+    def _on_shard_disconnected(self, shard: BrowserShard, browser: Browser):
+        if self._stopping or not self.is_running or shard.browser is not browser:
+            return
+        shard.crashes += 1
+        logger.error(f"Navegador do shard {shard.index} caiu; reiniciando {shard.load} guias")
+        asyncio.create_task(self._restart_shard(shard))
+
+    async def _restart_shard(self, shard: BrowserShard) -> bool:
+        """
+        Relança o navegador de um shard e recria apenas as guias que ele hospedava
+
+        Args:
+            shard: Shard afetado
+
+        Returns:
+            True se o navegador foi relançado
+        """
+        shard.restarting = True
+        affected = sorted(shard.tab_ids)
+        shard.tab_ids.clear()
+        try:
+            # Contextos e páginas do processo que caiu não existem mais
+            for tab_id in affected:
+                tab_info = self.tabs.get(tab_id)
+                if tab_info:
+                    tab_info.page = None
+                    tab_info.context = None
+                    tab_info.status = 'error'
+            if self.context_pool:
+                self.context_pool.discard(lambda pooled: pooled.shard == shard.index)
+
+            shard.browser = await self.playwright.chromium.launch(**self._launch_options)
+            self._watch_shard(shard)
+            if shard.index == 0:
+                self.browser = shard.browser
+        except Exception as e:
+            logger.error(f"Erro ao relançar navegador do shard {shard.index}: {e}")
+            shard.browser = None
+            return False
+        finally:
+            shard.restarting = False
+
+        results = await asyncio.gather(
+            *(self.restart_tab(tab_id) for tab_id in affected), return_exceptions=True
+        )
+        restored = sum(1 for result in results if result is True)
+        logger.info(f"Shard {shard.index} reiniciado: {restored}/{len(affected)} guias recriadas")
+        return True
+
+    def get_shard_stats(self) -> List[Dict[str, Any]]:
+        """
+        Distribuição das guias entre os navegadores
+
+        Returns:
+            Guias, quedas e estado de cada shard
+        """
+        return [shard.to_dict() for shard in self._get_shards()]
+
     def _get_profile_path(self, tab_id: int) -> Path:
         """
         Obtém o caminho do perfil específico para uma guia
@@ -165,9 +503,58 @@ class BrowserManager:
         Returns:
             Caminho do perfil
         """
-        if tab_id not in self.tab_profiles:
-            self.tab_profiles[tab_id] = self.user_profiles_dir / str(uuid.uuid4())
-        return self.tab_profiles[tab_id]
+        # Mapeamento estável, persistido no índice de perfis
+        path = self.profile_store.path_for(tab_id)
+        self.tab_profiles[tab_id] = path
+        return path
+
+    @property
+    def profile_store(self) -> ProfileStore:
+        """Índice de perfis do diretório de perfis atual"""
+        if self._profile_store is None or self._profile_store.base_dir != self.user_profiles_dir:
+            self._profile_store = ProfileStore(self.user_profiles_dir)
+        return self._profile_store
+
+    async def collect_profiles(self) -> Dict[str, Any]:
+        """
+        Remove perfis órfãos e aplica o orçamento de disco, fora do event loop
+
+        Returns:
+            Uso de disco após a coleta
+        """
+        store = self.profile_store
+        store.max_bytes = self.profile_disk_budget_mb * 1024 * 1024
+        # Guias configuradas contam como ativas mesmo antes de serem (re)abertas
+        active = set(self.tabs) | set(range(1, self.num_tabs + 1))
+        stats = await asyncio.to_thread(store.collect, sorted(active))
+        removed = {Path(path) for path in stats.pop('removed', [])}
+        for path in removed:
+            self.session_store.forget(path / "session.json")
+        for tab_id, path in list(self.tab_profiles.items()):
+            if path in removed:
+                del self.tab_profiles[tab_id]
+        return stats
+
+    async def _profile_gc_loop(self):
+        try:
+            while True:
+                # Primeira coleta só após um intervalo: não concorre com a criação das guias
+                await asyncio.sleep(self.profile_gc_interval)
+                try:
+                    await self.collect_profiles()
+                except Exception as e:
+                    logger.error(f"Erro na coleta de perfis: {e}")
+        except asyncio.CancelledError:
+            pass
+
+    def get_profile_stats(self) -> Dict[str, Any]:
+        """
+        Uso de disco dos perfis das guias
+
+        Returns:
+            Total, orçamento, uso por guia e contadores de coleta
+        """
+        return self.profile_store.get_stats()
     
     def _create_user_profile(self, tab_id: int) -> Path:
         """
@@ -246,13 +633,11 @@ class BrowserManager:
             profile_path = self._get_profile_path(tab_id)
             session_file = profile_path / "session.json"
             
-            # Salvar estado da sessão
+            # Salvar estado da sessão (gravação em segundo plano)
             storage_state = await context.storage_state()
+            self.session_store.save(session_file, storage_state)
             
-            with open(session_file, 'w', encoding='utf-8') as f:
-                json.dump(storage_state, f, indent=2, ensure_ascii=False)
-            
-            logger.info(f"Dados de sessão salvos para guia {tab_id}")
+            logger.debug(f"Dados de sessão agendados para gravação na guia {tab_id}")
             return True
             
         except Exception as e:
@@ -288,10 +673,10 @@ class BrowserManager:
                     return False
             else:
                 # Limpar cache de todas as guias
-                success_count = 0
-                for tid in list(self.contexts.keys()):
-                    if await self.clear_cache_keep_login(tid):
-                        success_count += 1
+                results = await asyncio.gather(
+                    *(self.clear_cache_keep_login(tid) for tid in list(self.contexts.keys()))
+                )
+                success_count = sum(1 for result in results if result)
                 
                 logger.info(f"Cache limpo para {success_count} guias, mantendo logins")
                 return success_count > 0
@@ -300,6 +685,88 @@ class BrowserManager:
             logger.error(f"Erro ao limpar cache: {e}")
             return False
 
+    def _base_context_options(self) -> Dict[str, Any]:
+        """Opções comuns a todos os contextos de guia"""
+        return {
+            'viewport': self.mini_viewport if self.mini_window_mode else self.default_viewport,
+            'ignore_https_errors': True,
+            'java_script_enabled': True,
+            'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        }
+
+    async def _load_session_state(self, tab_id: int, profile_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Lê o session.json do perfil da guia
+
+        Args:
+            tab_id: ID da guia
+            profile_path: Caminho do perfil
+
+        Returns:
+            storage_state salvo ou None
+        """
+        if not self.keep_cookies:
+            return None
+        try:
+            storage_state = await self.session_store.load(profile_path / "session.json")
+            if storage_state is not None:
+                logger.info(f"Dados de sessão carregados para guia {tab_id}")
+            return storage_state
+        except Exception as e:
+            logger.warning(f"Erro ao carregar sessão para guia {tab_id}: {e}")
+            return None
+
+    async def _create_warm_context(self) -> PooledContext:
+        """
+        Cria um contexto com página, scripts stealth e rotas já configurados
+
+        Returns:
+            Contexto pronto para ser atribuído a uma guia
+        """
+        shard = pick_shard(self._get_shards())
+        if shard is None:
+            raise RuntimeError("Navegador não está rodando")
+
+        # Reservar antes de qualquer await para que reabastecimentos seguidos se distribuam
+        shard.reserved += 1
+        context = None
+        try:
+            context = await shard.browser.new_context(**self._base_context_options())
+            context.set_default_timeout(self.page_load_timeout)
+            resources = await self._install_resource_policy(context)
+            page = await context.new_page()
+            if self.enable_stealth:
+                await self._setup_stealth_mode(page)
+        except BaseException:
+            shard.reserved = max(0, shard.reserved - 1)
+            if context is not None:
+                await context.close()
+            raise
+        return PooledContext(context=context, page=page, resources=resources, shard=shard.index)
+
+    def _release_reservation(self, pooled: PooledContext):
+        """Libera a reserva do shard quando o contexto sai do pool"""
+        if pooled.shard < len(self.shards):
+            shard = self.shards[pooled.shard]
+            shard.reserved = max(0, shard.reserved - 1)
+
+    async def _apply_session_state(self, context: BrowserContext, storage_state: Dict[str, Any]):
+        """
+        Aplica cookies e localStorage salvos a um contexto já criado
+
+        Args:
+            context: Contexto pré-aquecido
+            storage_state: Estado salvo da sessão
+        """
+        cookies = storage_state.get('cookies') or []
+        if cookies:
+            await context.add_cookies(cookies)
+        origins = storage_state.get('origins') or []
+        if origins:
+            await context.add_init_script(
+                script=RESTORE_LOCAL_STORAGE_SCRIPT % json.dumps(origins, ensure_ascii=False)
+            )
+
     async def create_tab(self, tab_id: int, url: str = "about:blank", proxy: Optional[str] = None) -> Optional[TabInfo]:
         """
         Cria uma nova guia com perfil de usuário único
@@ -319,44 +786,50 @@ class BrowserManager:
             # Criar perfil único para esta guia
             profile_path = self._create_user_profile(tab_id)
             
-            # Configurar opções do contexto com perfil persistente
-            context_options = {
-                'viewport': self.mini_viewport if self.mini_window_mode else self.default_viewport,
-                'ignore_https_errors': True,
-                'java_script_enabled': True,
-                'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            }
+            storage_state = await self._load_session_state(tab_id, profile_path)
 
-            if proxy:
-                context_options['proxy'] = {"server": proxy}
-            
-            # Adicionar dados de sessão se existirem
-            if self.keep_cookies:
-                session_file = profile_path / "session.json"
-                if session_file.exists():
-                    try:
-                        with open(session_file, 'r', encoding='utf-8') as f:
-                            storage_state = json.load(f)
-                        context_options['storage_state'] = storage_state
-                        logger.info(f"Dados de sessão carregados para guia {tab_id}")
-                    except Exception as e:
-                        logger.warning(f"Erro ao carregar sessão para guia {tab_id}: {e}")
-            
-            # Criar contexto isolado
-            context = await self.browser.new_context(**context_options)
-            
-            # Configurar timeout
-            context.set_default_timeout(self.page_load_timeout)
-            
-            # Criar nova página
-            page = await context.new_page()
-            
-            # Aplicar modo stealth se habilitado
-            if self.enable_stealth:
-                await self._setup_stealth_mode(page)
-            
-            # Configurar eventos da página
-            await self._setup_page_events(page, tab_id)
+            # Contextos pré-aquecidos não têm proxy; guias com proxy seguem o caminho frio
+            pooled = self.context_pool.acquire() if self.context_pool and not proxy else None
+            if pooled:
+                shard = self._get_shards()[pooled.shard]
+                self._assign_shard(tab_id, shard)
+                context, page, resources = pooled.context, pooled.page, pooled.resources
+                if storage_state:
+                    await self._apply_session_state(context, storage_state)
+                self._setup_page_listeners(page, tab_id)
+            else:
+                # Configurar opções do contexto com perfil persistente
+                context_options = self._base_context_options()
+
+                if proxy:
+                    context_options['proxy'] = {"server": proxy}
+
+                # Adicionar dados de sessão se existirem
+                if storage_state:
+                    context_options['storage_state'] = storage_state
+
+                # Criar contexto isolado no navegador menos ocupado
+                shard = pick_shard(self._get_shards())
+                if shard is None:
+                    raise RuntimeError("Nenhum navegador disponível")
+                self._assign_shard(tab_id, shard)
+                context = await shard.browser.new_context(**context_options)
+
+                # Configurar timeout
+                context.set_default_timeout(self.page_load_timeout)
+
+                # Bloqueio de recursos registrado uma vez no contexto
+                resources = await self._install_resource_policy(context)
+
+                # Criar nova página
+                page = await context.new_page()
+
+                # Aplicar modo stealth se habilitado
+                if self.enable_stealth:
+                    await self._setup_stealth_mode(page)
+
+                # Configurar eventos da página
+                await self._setup_page_events(page, tab_id)
             
             # Criar informações da guia
             tab_info = TabInfo(
@@ -366,7 +839,10 @@ class BrowserManager:
                 url=url,
                 status='loading',
                 last_activity=datetime.now(),
-                proxy=proxy or ""
+                proxy=proxy or "",
+                pooled=pooled is not None,
+                resources=resources,
+                shard=shard.index
             )
             
             self.tabs[tab_id] = tab_info
@@ -383,6 +859,8 @@ class BrowserManager:
             
         except Exception as e:
             logger.error(f"Erro ao criar guia {tab_id}: {e}")
+            if tab_id not in self.tabs:
+                self._release_shard(tab_id)
             return None
     
     async def _setup_page_events(self, page: Page, tab_id: int):
@@ -394,24 +872,71 @@ class BrowserManager:
             tab_id: ID da guia
         """
         try:
-            # Event handler para console
-            page.on("console", lambda msg: logger.debug(f"Tab {tab_id} Console: {msg.text}"))
-            
-            # Event handler para erros
-            page.on("pageerror", lambda error: logger.error(f"Tab {tab_id} Page Error: {error}"))
-            
-            # Event handler para requests
-            async def handle_request(request):
-                # Bloquear recursos desnecessários para economizar banda
-                if request.resource_type in ['image', 'font', 'media']:
-                    await request.abort()
-                else:
-                    await request.continue_()
-            
-            await page.route("**/*", handle_request)
+            self._setup_page_listeners(page, tab_id)
             
         except Exception as e:
             logger.error(f"Erro ao configurar eventos da página {tab_id}: {e}")
+
+    def _setup_page_listeners(self, page: Page, tab_id: int):
+        """Registra handlers de console e erro identificados pela guia"""
+        # Event handler para console
+        page.on("console", lambda msg: logger.debug(f"Tab {tab_id} Console: {msg.text}"))
+        
+        # Event handler para erros
+        page.on("pageerror", lambda error: logger.error(f"Tab {tab_id} Page Error: {error}"))
+
+    async def _install_resource_policy(self, context: BrowserContext) -> Optional[ResourceCounters]:
+        """
+        Registra a política de recursos no contexto (vale para todas as suas páginas)
+
+        Args:
+            context: Contexto do navegador
+
+        Returns:
+            Contadores de bloqueio do contexto ou None se a otimização estiver desativada
+        """
+        if not self.optimize_resources:
+            return None
+        return await self.resource_policy.install(context)
+
+    def set_resource_policy(self, blocked_types: List[str], blocked_patterns: List[str]):
+        """
+        Atualiza a política de bloqueio de recursos
+
+        Vale para contextos criados a partir de agora; os contextos pré-aquecidos
+        são descartados para serem recriados com a nova política.
+
+        Args:
+            blocked_types: Tipos de recurso bloqueados
+            blocked_patterns: Padrões de URL bloqueados
+        """
+        self.resource_policy = ResourcePolicy(blocked_types, blocked_patterns)
+        if self.context_pool:
+            size = self.context_pool.size
+            self.context_pool.resize(0)
+            self.context_pool.resize(size)
+
+    def get_resource_stats(self) -> Dict[str, Any]:
+        """
+        Requisições bloqueadas e banda economizada por guia
+
+        Returns:
+            Política atual, contadores por guia e totais
+        """
+        by_tab = {
+            tab_id: tab_info.resources.to_dict()
+            for tab_id, tab_info in sorted(self.tabs.items())
+            if tab_info.resources
+        }
+        return {
+            'policy': self.resource_policy.to_dict(),
+            'enabled': self.optimize_resources,
+            'by_tab': by_tab,
+            'totals': {
+                'blocked': sum(c['blocked'] for c in by_tab.values()),
+                'bytes_saved': sum(c['bytes_saved'] for c in by_tab.values()),
+            },
+        }
     
     async def navigate_tab(self, tab_id: int, url: str) -> bool:
         """
@@ -454,12 +979,13 @@ class BrowserManager:
                 self.proxy_manager.report_failure(tab_id, str(e))
             return False
     
-    async def close_tab(self, tab_id: int) -> bool:
+    async def close_tab(self, tab_id: int, collect: bool = True) -> bool:
         """
         Fecha uma guia específica
         
         Args:
             tab_id: ID da guia
+            collect: Executar o coletor de lixo após fechar
             
         Returns:
             True se fechou com sucesso
@@ -479,13 +1005,14 @@ class BrowserManager:
 
 
             self.contexts.pop(tab_id, None)
+            self._cdp_sessions.pop(tab_id, None)
 
             tab_info.status = 'closed'
             del self.tabs[tab_id]
+            self._release_shard(tab_id)
 
-            gc.collect()
-            tab_info.status = 'closed'
-            del self.tabs[tab_id]
+            if collect:
+                gc.collect()
 
             if self.proxy_manager:
                 self.proxy_manager.release_proxy(tab_id)
@@ -512,17 +1039,20 @@ class BrowserManager:
             return False
         
         try:
+            started = asyncio.get_running_loop().time()
             tab_info = self.tabs[tab_id]
             original_url = tab_info.url
             
-            # Fechar guia atual
-            await self.close_tab(tab_id)
+            # Fechar guia atual (sem gc.collect, que bloqueia o event loop)
+            await self.close_tab(tab_id, collect=False)
             
             # Criar nova guia
             new_tab = await self.create_tab(tab_id, original_url, proxy or tab_info.proxy)
             
             if new_tab:
-                logger.info(f"Guia {tab_id} reiniciada com sucesso")
+                elapsed = asyncio.get_running_loop().time() - started
+                self.restart_latency['pooled' if new_tab.pooled else 'cold'].record(elapsed)
+                logger.info(f"Guia {tab_id} reiniciada com sucesso em {elapsed:.2f}s")
                 return True
             else:
                 logger.error(f"Falha ao reiniciar guia {tab_id}")
@@ -532,6 +1062,240 @@ class BrowserManager:
             logger.error(f"Erro ao reiniciar guia {tab_id}: {e}")
             return False
     
+    async def probe_tab(self, tab_id: int, expected_url: Optional[str] = None,
+                        timeout: Optional[float] = None) -> Optional[TabProbe]:
+        """
+        Sonda barata de vivacidade/prontidão: um evaluate mínimo com prazo curto
+
+        Args:
+            tab_id: ID da guia
+            expected_url: Página esperada (padrão: última URL navegada da guia)
+            timeout: Prazo da sonda em segundos (padrão: probe_timeout)
+
+        Returns:
+            Resultado da sonda ou None se a guia não tem página
+        """
+        tab_info = self.tabs.get(tab_id)
+        if not tab_info or not tab_info.page or tab_info.page.is_closed():
+            return None
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        ready_state = url = error = None
+        try:
+            ready_state, url = await asyncio.wait_for(
+                tab_info.page.evaluate(PROBE_SCRIPT), timeout or self.probe_timeout
+            )
+            alive = True
+        except Exception as e:
+            alive = False
+            error = str(e) or type(e).__name__
+        latency = loop.time() - started
+
+        tab_info.probe_latency.record(latency)
+        tab_info.responsive = alive
+
+        expected = expected_url or tab_info.url
+        on_page = alive and ready_state != 'loading' and same_page(url, expected)
+        return TabProbe(alive, on_page, ready_state, url, latency, error)
+
+    async def triage_tab(self, tab_id: int, expected_url: Optional[str] = None) -> str:
+        """
+        Decide, pela sonda, a ação mínima necessária para uma guia
+
+        Args:
+            tab_id: ID da guia
+            expected_url: Página esperada (padrão: última URL navegada da guia)
+
+        Returns:
+            'healthy' (nada a fazer), 'navigated' (bastou navegar) ou
+            'recover' (renderer não responde; é preciso recuperar a guia)
+        """
+        probe = await self.probe_tab(tab_id, expected_url)
+        if probe is None or not probe.alive:
+            return 'recover'
+
+        tab_info = self.tabs[tab_id]
+        if probe.on_page:
+            if tab_info.status == 'error':
+                tab_info.status = 'ready'
+            tab_info.last_activity = datetime.now()
+            return 'healthy'
+
+        target = expected_url or tab_info.url
+        if target and await self.navigate_tab(tab_id, target):
+            return 'navigated'
+        return 'recover'
+
+    async def recover_tab(self, tab_id: int, proxy: Optional[str] = None) -> Optional[str]:
+        """
+        Recupera uma guia com o menor custo possível
+
+        Tenta, em ordem: recarregar a página; substituir apenas a página dentro
+        do contexto existente (mantendo cookies e sessão); recriar o contexto.
+        A troca de proxy exige um novo contexto e vai direto ao último nível.
+
+        Args:
+            tab_id: ID da guia
+            proxy: Novo proxy para a guia (opcional)
+
+        Returns:
+            Nível que recuperou a guia ('reload', 'new_page', 'new_context') ou None
+        """
+        tab_info = self.tabs.get(tab_id)
+        if tab_info is None:
+            logger.error(f"Guia {tab_id} não encontrada para recuperar")
+            return None
+
+        tiers = [
+            ('reload', self._recover_by_reload),
+            ('new_page', self._recover_with_new_page),
+            ('new_context', self.restart_tab),
+        ]
+        if proxy and proxy != tab_info.proxy:
+            tiers = tiers[-1:]
+
+        loop = asyncio.get_running_loop()
+        for tier, action in tiers:
+            stats = self.recovery_stats[tier]
+            stats['attempts'] += 1
+            started = loop.time()
+            try:
+                if tier == 'new_context':
+                    recovered = await action(tab_id, proxy) if proxy else await action(tab_id)
+                else:
+                    recovered = await action(tab_id)
+            except Exception as e:
+                logger.warning(f"Recuperação '{tier}' da guia {tab_id} falhou: {e}")
+                recovered = False
+
+            if recovered:
+                elapsed = loop.time() - started
+                stats['successes'] += 1
+                stats['latency'].record(elapsed)
+                logger.info(f"Guia {tab_id} recuperada via '{tier}' em {elapsed:.2f}s")
+                return tier
+
+        logger.error(f"Não foi possível recuperar a guia {tab_id}")
+        return None
+
+    async def _recover_by_reload(self, tab_id: int) -> bool:
+        """Nível 1: recarrega a página atual"""
+        tab_info = self.tabs[tab_id]
+        if not tab_info.page or tab_info.page.is_closed() or tab_info.url == "about:blank":
+            return False
+
+        tab_info.status = 'loading'
+        await tab_info.page.reload(
+            wait_until='domcontentloaded',
+            timeout=self.recovery_reload_timeout * 1000,
+        )
+        tab_info.usage = TabUsage()
+        tab_info.status = 'ready'
+        tab_info.last_activity = datetime.now()
+        return True
+
+    async def _recover_with_new_page(self, tab_id: int) -> bool:
+        """Nível 2: troca a página mantendo o contexto (cookies e sessão em memória)"""
+        tab_info = self.tabs[tab_id]
+        context = tab_info.context
+        if context is None:
+            return False
+
+        old_page = tab_info.page
+        page = await asyncio.wait_for(context.new_page(), self.recovery_page_timeout)
+        try:
+            if self.enable_stealth:
+                await self._setup_stealth_mode(page)
+            await self._setup_page_events(page, tab_id)
+            if tab_info.url and tab_info.url != "about:blank":
+                await page.goto(
+                    tab_info.url,
+                    wait_until='domcontentloaded',
+                    timeout=self.recovery_page_timeout * 1000,
+                )
+        except Exception:
+            await page.close()
+            raise
+
+        tab_info.page = page
+        tab_info.status = 'ready'
+        tab_info.last_activity = datetime.now()
+        if tab_info.macro_recorder:
+            tab_info.macro_recorder = None
+
+        if old_page is not None:
+            try:
+                await old_page.close()
+            except Exception as e:
+                logger.debug(f"Erro ao fechar página antiga da guia {tab_id}: {e}")
+        return True
+
+    async def sample_tab_usage(self, tab_id: int) -> Optional[TabUsage]:
+        """
+        Coleta memória (heap JS) e CPU da página via CDP Performance.getMetrics
+
+        Args:
+            tab_id: ID da guia
+
+        Returns:
+            Consumo acumulado da guia ou None se não foi possível medir
+        """
+        tab_info = self.tabs.get(tab_id)
+        if not tab_info or not tab_info.page or not tab_info.context:
+            return None
+
+        page = tab_info.page
+        try:
+            cached = self._cdp_sessions.get(tab_id)
+            if cached is None or cached[0] is not page:
+                if cached is not None:
+                    # Página trocada pela recuperação: amostras antigas não se aplicam
+                    tab_info.usage = TabUsage()
+                session = await tab_info.context.new_cdp_session(page)
+                await session.send('Performance.enable')
+                self._cdp_sessions[tab_id] = (page, session)
+            else:
+                session = cached[1]
+
+            result = await session.send('Performance.getMetrics')
+        except Exception as e:
+            self._cdp_sessions.pop(tab_id, None)
+            logger.debug(f"Não foi possível medir a guia {tab_id}: {e}")
+            return None
+
+        metrics = {item['name']: item['value'] for item in result.get('metrics', [])}
+        tab_info.usage.add(time.monotonic(), metrics)
+        return tab_info.usage
+
+    async def sample_all_tabs(self) -> Dict[int, TabUsage]:
+        """
+        Coleta o consumo de todas as guias em paralelo
+
+        Returns:
+            Consumo por tab_id (apenas guias medidas com sucesso)
+        """
+        tab_ids = list(self.tabs.keys())
+        results = await asyncio.gather(*(self.sample_tab_usage(tab_id) for tab_id in tab_ids))
+        return {tab_id: usage for tab_id, usage in zip(tab_ids, results) if usage is not None}
+
+    def get_recovery_stats(self) -> Dict[str, Any]:
+        """
+        Estatísticas da escada de recuperação
+
+        Returns:
+            Tentativas, sucessos e latência de cada nível
+        """
+        return {
+            tier: {
+                'attempts': stats['attempts'],
+                'successes': stats['successes'],
+                'success_rate': round(stats['successes'] / stats['attempts'] * 100, 2) if stats['attempts'] else 0.0,
+                'latency': stats['latency'].to_dict(),
+            }
+            for tier, stats in self.recovery_stats.items()
+        }
+    
     async def clear_cache(self, preserve_login: bool = True) -> bool:
         """
         Limpa cache do navegador
@@ -563,33 +1327,25 @@ class BrowserManager:
             logger.error(f"Erro ao limpar cache: {e}")
             return False
     
-    async def stop_browser(self) -> bool:
+    async def stop_browser(self, keep_driver: Optional[bool] = None) -> bool:
         """
         Para o navegador e fecha todas as guias
         
+        Args:
+            keep_driver: Manter o driver do Playwright para o próximo start
+                (padrão: keep_driver do gerenciador)
+
         Returns:
             True se parou com sucesso
         """
+        if keep_driver is None:
+            keep_driver = self.keep_driver
         try:
-            # Fechar todas as guias
-            tabs_to_close = list(self.tabs.keys())
-            for tab_id in tabs_to_close:
-                await self.close_tab(tab_id)
-            
-            # Fechar navegador
-            if self.browser:
-                await self.browser.close()
-                self.browser = None
-            
-            # Parar Playwright
-            if self.playwright:
-                await self.playwright.stop()
-                self.playwright = None
-            
-            self.is_running = False
-            self.tabs.clear()
-            
-            logger.info("Navegador parado com sucesso")
+            report = await self._teardown(self.shutdown_timeout, keep_driver=keep_driver)
+            logger.info(
+                f"Navegador parado com sucesso em {report['duration']:.2f}s "
+                f"({report['tabs']} guias)"
+            )
             return True
             
         except Exception as e:
@@ -601,28 +1357,156 @@ class BrowserManager:
         try:
             logger.warning("🚨 PARADA DE EMERGÊNCIA ATIVADA")
             
-            # Parar tarefas em execução
-            for task in list(self.active_tasks):
-                if not task.done():
-                    task.cancel()
-                    try:
-                        await task
-                    except asyncio.CancelledError:
-                        pass
-            
-            self.active_tasks.clear()
+            report = await self._teardown(self.emergency_timeout, save_sessions=False)
             
-            # Fechar todas as instâncias
-            for browser_id in list(self.browsers.keys()):
-                await self.close_browser(browser_id)
-            
-            logger.info("Parada de emergência concluída")
+            logger.info(f"Parada de emergência concluída em {report['duration']:.2f}s")
             return True
             
         except Exception as e:
             logger.error(f"Erro na parada de emergência: {e}")
             return False
 
+    async def _teardown(self, timeout: float, save_sessions: bool = True,
+                        keep_driver: bool = False) -> Dict[str, Any]:
+        """
+        Encerra guias e navegadores em paralelo dentro de um prazo global
+
+        Contextos são fechados todos ao mesmo tempo; se o prazo esgotar, os
+        processos do navegador são finalizados à força. O driver do Playwright
+        sempre recebe driver_stop_grace segundos para encerrar, mesmo com o prazo
+        esgotado, e também é finalizado se não responder. A coleta de lixo roda
+        uma única vez, no final.
+
+        Args:
+            timeout: Prazo total do encerramento (segundos)
+            save_sessions: Gravar sessões pendentes antes de fechar
+            keep_driver: Manter o driver do Playwright rodando (descartado se o prazo estourar)
+
+        Returns:
+            Relatório do encerramento (duração, guias, etapas que estouraram o prazo)
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + timeout
+        timed_out: List[str] = []
+        tab_count = len(self.tabs)
+        killed = 0
+        self._stopping = True
+
+        async def bounded(step: str, aws: List[Any], grace: float = 0.0) -> bool:
+            if not aws:
+                return True
+            remaining = max(deadline - loop.time(), grace)
+            if remaining <= 0:
+                timed_out.append(step)
+                for aw in aws:
+                    aw.close()
+                return False
+            try:
+                await asyncio.wait_for(asyncio.gather(*aws, return_exceptions=True), remaining)
+                return True
+            except asyncio.TimeoutError:
+                timed_out.append(step)
+                logger.warning(f"Prazo de encerramento esgotado em '{step}'")
+                return False
+
+        try:
+            if self._profile_gc_task and not self._profile_gc_task.done():
+                self._profile_gc_task.cancel()
+            self._profile_gc_task = None
+
+            pool, self.context_pool = self.context_pool, None
+            closing = [self.close_tab(tab_id, collect=False) for tab_id in list(self.tabs.keys())]
+            if pool:
+                closing.append(pool.close())
+            await bounded('contexts', closing)
+
+            if save_sessions:
+                await bounded('sessions', [self.session_store.flush()])
+
+            if self._prewarm_task and not self._prewarm_task.done():
+                self._prewarm_task.cancel()
+            self._prewarm_task = None
+
+            browsers = [shard.browser for shard in self.shards if shard.browser]
+            if self.browser and self.browser not in browsers:
+                browsers.append(self.browser)
+            browsers += self._warm_browsers
+            self._warm_browsers, self._warm_options = [], None
+            await bounded('browsers', [browser.close() for browser in browsers])
+
+            if timed_out:
+                killed = await asyncio.to_thread(self._kill_browser_processes)
+                if killed:
+                    logger.warning(f"{killed} processos do navegador finalizados à força")
+
+            keep_driver = keep_driver and not timed_out
+            if self.playwright and not keep_driver:
+                # O driver sempre recebe uma chance de encerrar; se não der, é finalizado
+                stopped = await bounded('playwright', [self.playwright.stop()], grace=self.driver_stop_grace)
+                if not stopped:
+                    driver_killed = await asyncio.to_thread(self._kill_browser_processes, True)
+                    killed += driver_killed
+                    if driver_killed:
+                        logger.warning(f"Driver do Playwright finalizado à força ({driver_killed} processos)")
+        finally:
+            if not keep_driver:
+                self.playwright = None
+            self.shards = []
+            self.browser = None
+            self.is_running = False
+            self.tabs.clear()
+            self.contexts.clear()
+            self._cdp_sessions.clear()
+            self._stopping = False
+            gc.collect()
+
+        self.last_shutdown = {
+            'tabs': tab_count,
+            'duration': round(loop.time() - started, 3),
+            'timeout': timeout,
+            'timed_out': timed_out,
+            'killed_processes': killed,
+            'driver_kept': self.playwright is not None,
+        }
+        return self.last_shutdown
+
+    @staticmethod
+    def _kill_browser_processes(include_driver: bool = False) -> int:
+        """
+        Finaliza processos do Chrome/Chromium descendentes do bot
+
+        Args:
+            include_driver: Finalizar também o driver do Playwright (node)
+
+        Returns:
+            Quantidade de processos finalizados
+        """
+        killed = 0
+        try:
+            children = psutil.Process(os.getpid()).children(recursive=True)
+        except psutil.Error:
+            return 0
+        for child in children:
+            try:
+                name = child.name().lower()
+                if 'chrome' in name or 'chromium' in name:
+                    child.kill()
+                    killed += 1
+                elif include_driver and BrowserManager._is_driver_process(name, child.cmdline()):
+                    child.kill()
+                    killed += 1
+            except psutil.Error:
+                continue
+        return killed
+
+    @staticmethod
+    def _is_driver_process(name: str, cmdline: List[str]) -> bool:
+        """Processo do driver do Playwright (node executando o pacote playwright)"""
+        if 'playwright' in name:
+            return True
+        return name.startswith('node') and any('playwright' in part.lower() for part in cmdline)
+
 
     def get_tab_info(self, tab_id: int) -> Optional[TabInfo]:
         """
@@ -645,6 +1529,28 @@ class BrowserManager:
         """
         return [tab_info.to_dict() for tab_info in self.tabs.values()]
     
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Estatísticas do pool de contextos e latência de reinício das guias
+
+        Returns:
+            Uso do pool e percentis de reinício com e sem contexto pré-aquecido
+        """
+        pool = self.context_pool.get_stats() if self.context_pool else {'size': 0, 'available': 0}
+        return {
+            'pool': pool,
+            'restart_latency': {name: hist.to_dict() for name, hist in self.restart_latency.items()},
+        }
+
+    def set_context_pool_size(self, size: int):
+        """Atualiza o tamanho do pool de contextos pré-aquecidos"""
+        self.context_pool_size = size
+        if self.context_pool:
+            self.context_pool.resize(size)
+        elif self.is_running and self.browser and size > 0:
+            self.context_pool = ContextPool(self._create_warm_context, size, self._release_reservation)
+            self.context_pool.start()
+    
     def get_tab_count(self) -> int:
         """
         Retorna o número de guias ativas
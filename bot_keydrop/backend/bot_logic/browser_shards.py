@@ -0,0 +1,70 @@
+"""
+Shards de navegador
+Distribui as guias entre vários processos do Chromium para dividir carga e isolar falhas
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+# Limite do modo automático: cada shard é um processo de navegador completo
+MAX_AUTO_SHARDS = 4
+
+
+@dataclass
+class BrowserShard:
+    """Uma instância de navegador e as guias hospedadas nela"""
+    index: int
+    browser: Any = None
+    tab_ids: Set[int] = field(default_factory=set)
+    reserved: int = 0  # contextos pré-aquecidos no pool ainda sem guia
+    crashes: int = 0
+    restarting: bool = False
+
+    @property
+    def load(self) -> int:
+        return len(self.tab_ids) + self.reserved
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'index': self.index,
+            'connected': bool(self.browser and self.browser.is_connected()),
+            'tabs': sorted(self.tab_ids),
+            'reserved': self.reserved,
+            'crashes': self.crashes,
+            'restarting': self.restarting,
+        }
+
+
+def auto_shard_count(num_tabs: Optional[int] = None, cpu_count: Optional[int] = None) -> int:
+    """
+    Calcula o número de shards a partir dos núcleos disponíveis
+
+    Args:
+        num_tabs: Número de guias previstas (não faz sentido ter mais shards que guias)
+        cpu_count: Núcleos disponíveis (padrão: os.cpu_count())
+
+    Returns:
+        Quantidade de shards (mínimo 1)
+    """
+    cpus = cpu_count or os.cpu_count() or 1
+    count = max(1, min(MAX_AUTO_SHARDS, cpus // 2))
+    if num_tabs:
+        count = min(count, num_tabs)
+    return max(1, count)
+
+
+def pick_shard(shards: List[BrowserShard]) -> Optional[BrowserShard]:
+    """
+    Escolhe o shard conectado com menos guias (contando contextos reservados)
+
+    Args:
+        shards: Shards disponíveis
+
+    Returns:
+        Shard escolhido ou None se nenhum estiver disponível
+    """
+    candidates = [s for s in shards if s.browser is not None and not s.restarting]
+    if not candidates:
+        return None
+    return min(candidates, key=lambda s: (s.load, s.index))
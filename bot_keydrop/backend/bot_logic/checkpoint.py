@@ -0,0 +1,107 @@
+"""
+Checkpoint do agendador
+Persiste a tabela de tarefas em disco de forma compacta e atômica para retomada a quente
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Configuração de logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class SchedulerCheckpoint:
+    """Leitura e escrita atômica do checkpoint do agendador"""
+
+    VERSION = 1
+
+    def __init__(self, path: Path, max_age: float = 3600.0):
+        """
+        Inicializa o checkpoint
+
+        Args:
+            path: Arquivo de checkpoint
+            max_age: Idade máxima (segundos) para um checkpoint ser retomado
+        """
+        self.path = Path(path)
+        self.max_age = max_age
+        # Gravações podem vir de threads (asyncio.to_thread); uma por vez
+        self._lock = threading.Lock()
+
+    def save(self, state: Dict[str, Any]) -> bool:
+        """
+        Grava o estado em um arquivo temporário e o renomeia sobre o destino
+
+        Args:
+            state: Estado serializável do agendador
+
+        Returns:
+            True se gravou com sucesso
+        """
+        with self._lock:
+            return self._save(state)
+
+    def _save(self, state: Dict[str, Any]) -> bool:
+        payload = dict(state, version=self.VERSION, saved_at=time.time())
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, separators=(',', ':'), ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            return True
+        except Exception as e:
+            logger.error(f"Erro ao gravar checkpoint do agendador: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return False
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Lê o checkpoint se existir, for da versão atual e não estiver expirado
+
+        Returns:
+            Estado salvo ou None
+        """
+        if not self.path.exists():
+            return None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except Exception as e:
+            logger.warning(f"Checkpoint do agendador ilegível, ignorando: {e}")
+            return None
+
+        if state.get('version') != self.VERSION:
+            logger.info("Checkpoint do agendador em versão diferente, ignorando")
+            return None
+
+        age = time.time() - state.get('saved_at', 0)
+        if age > self.max_age:
+            logger.info(f"Checkpoint do agendador expirado ({age:.0f}s), ignorando")
+            return None
+
+        return state
+
+    def clear(self):
+        """Remove o checkpoint do disco"""
+        with self._lock:
+            self._clear()
+
+    def _clear(self):
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Erro ao remover checkpoint do agendador: {e}")
@@ -0,0 +1,197 @@
+"""
+Controle adaptativo de concorrência
+Limitador AIMD que ajusta o número de tarefas de guia simultâneas conforme CPU, memória e latência
+"""
+
+import asyncio
+import logging
+import statistics
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+# Configuração de logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveLimiter:
+    """
+    Semáforo com limite ajustável (aumento aditivo, redução multiplicativa)
+
+    Pode substituir ``asyncio.Semaphore`` via ``async with``. Reduzir o limite
+    não interrompe tarefas em andamento; apenas impede novas entradas até que
+    a ocupação caia abaixo do novo limite.
+    """
+
+    DECREASE_FACTOR = 0.7
+    CEILING_FACTOR = 0.5
+    LATENCY_TOLERANCE = 2.0  # mediana acima de 2x a linha de base indica saturação
+    MIN_LATENCY_SAMPLES = 5
+
+    def __init__(self, max_limit: int, min_limit: int = 1, initial: Optional[int] = None):
+        """
+        Inicializa o limitador
+
+        Args:
+            max_limit: Limite máximo de tarefas simultâneas
+            min_limit: Limite mínimo de tarefas simultâneas
+            initial: Limite inicial (padrão: max_limit)
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self._limit = float(initial if initial is not None else self.max_limit)
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._latencies: List[float] = []
+        self._saturated = False
+        self._baseline_latency: Optional[float] = None
+        self.decisions: Deque[Dict[str, Any]] = deque(maxlen=50)
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, min(self.max_limit, int(self._limit)))
+
+    def locked(self) -> bool:
+        return self.in_flight >= self.limit
+
+    async def acquire(self):
+        loop = asyncio.get_running_loop()
+        while self.in_flight >= self.limit:
+            self._saturated = True
+            waiter = loop.create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Repassar a vaga recebida para o próximo da fila
+                if waiter.done() and not waiter.cancelled():
+                    self._wake()
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self.in_flight += 1
+
+    def release(self):
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self):
+        free = self.limit - self.in_flight
+        for waiter in list(self._waiters):
+            if free <= 0:
+                break
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
+
+    def observe(self, latency: float):
+        """
+        Registra a duração de uma tarefa para o sinal de latência
+
+        Args:
+            latency: Duração em segundos
+        """
+        if len(self._latencies) < 1000:
+            self._latencies.append(latency)
+
+    def set_max_limit(self, max_limit: int):
+        """Atualiza o teto configurado, ajustando o limite atual se necessário"""
+        self.max_limit = max(self.min_limit, max_limit)
+        self._limit = min(self._limit, float(self.max_limit))
+        self._wake()
+
+    def adjust(self,
+               cpu_percent: Optional[float] = None,
+               memory_percent: Optional[float] = None,
+               bot_memory_mb: Optional[float] = None,
+               cpu_target: float = 80.0,
+               memory_target: float = 85.0,
+               memory_ceiling_mb: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Aplica uma rodada do controle AIMD
+
+        Args:
+            cpu_percent: Uso de CPU do sistema (%)
+            memory_percent: Uso de memória do sistema (%)
+            bot_memory_mb: Memória do bot e navegadores (MB)
+            cpu_target: CPU (%) acima da qual o limite é reduzido
+            memory_target: Memória (%) acima da qual o limite é reduzido
+            memory_ceiling_mb: Teto rígido de memória do bot (MB)
+
+        Returns:
+            Decisão tomada
+        """
+        previous = self.limit
+        latency = None
+        if len(self._latencies) >= self.MIN_LATENCY_SAMPLES:
+            latency = statistics.median(self._latencies)
+        self._latencies = []
+        saturated = self._saturated or self.in_flight >= self.limit
+        self._saturated = False
+
+        if memory_ceiling_mb and bot_memory_mb is not None and bot_memory_mb >= memory_ceiling_mb:
+            action, reason = 'decrease', 'memory_ceiling'
+            self._limit = max(self.min_limit, self._limit * self.CEILING_FACTOR)
+        elif cpu_percent is not None and cpu_percent > cpu_target:
+            action, reason = 'decrease', 'cpu_pressure'
+            self._limit = max(self.min_limit, self._limit * self.DECREASE_FACTOR)
+        elif memory_percent is not None and memory_percent > memory_target:
+            action, reason = 'decrease', 'memory_pressure'
+            self._limit = max(self.min_limit, self._limit * self.DECREASE_FACTOR)
+        elif (latency is not None and self._baseline_latency
+              and latency > self._baseline_latency * self.LATENCY_TOLERANCE):
+            action, reason = 'decrease', 'latency'
+            self._limit = max(self.min_limit, self._limit * self.DECREASE_FACTOR)
+        elif (memory_ceiling_mb and bot_memory_mb is not None
+              and bot_memory_mb >= memory_ceiling_mb * 0.9):
+            action, reason = 'hold', 'near_memory_ceiling'
+        elif saturated and self._limit < self.max_limit:
+            action, reason = 'increase', 'saturated'
+            self._limit = min(float(self.max_limit), self._limit + 1)
+        else:
+            action, reason = 'hold', 'steady'
+
+        # Linha de base acompanha a menor latência vista, subindo lentamente
+        if latency is not None:
+            if self._baseline_latency is None or latency < self._baseline_latency:
+                self._baseline_latency = latency
+            else:
+                self._baseline_latency *= 1.05
+
+        decision = {
+            'timestamp': time.time(),
+            'action': action,
+            'reason': reason,
+            'previous_limit': previous,
+            'limit': self.limit,
+            'in_flight': self.in_flight,
+            'cpu_percent': cpu_percent,
+            'memory_percent': memory_percent,
+            'bot_memory_mb': round(bot_memory_mb, 1) if bot_memory_mb is not None else None,
+            'median_latency': round(latency, 3) if latency is not None else None,
+        }
+        if action != 'hold':
+            self.decisions.append(decision)
+            logger.info(f"Concorrência {previous} -> {self.limit} ({reason})")
+            self._wake()
+        return decision
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Estado atual do controlador para a API"""
+        return {
+            'limit': self.limit,
+            'min_limit': self.min_limit,
+            'max_limit': self.max_limit,
+            'in_flight': self.in_flight,
+            'baseline_latency': round(self._baseline_latency, 3) if self._baseline_latency else None,
+            'decisions': list(self.decisions),
+        }
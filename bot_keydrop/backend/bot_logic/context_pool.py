@@ -0,0 +1,152 @@
+"""
+Pool de contextos pré-aquecidos
+Mantém BrowserContexts com página, scripts e rotas já configurados para reinícios quase instantâneos
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# Configuração de logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PooledContext:
+    """Contexto pré-aquecido aguardando uso"""
+    context: Any
+    page: Any
+    resources: Any = None  # ResourceCounters da política instalada no contexto
+    shard: int = 0  # índice do navegador que hospeda o contexto
+    created_at: datetime = field(default_factory=datetime.now)
+
+
+class ContextPool:
+    """
+    Pool de contextos reabastecido em segundo plano
+
+    ``acquire`` nunca espera pela criação de um contexto: se o pool estiver
+    vazio retorna None e quem chamou segue pelo caminho frio.
+    """
+
+    RETRY_DELAY = 5.0
+
+    def __init__(self, factory: Callable[[], Awaitable[PooledContext]], size: int,
+                 on_release: Optional[Callable[[PooledContext], None]] = None):
+        """
+        Inicializa o pool
+
+        Args:
+            factory: Corrotina que cria um contexto pré-aquecido
+            size: Quantidade de contextos mantidos prontos
+            on_release: Chamado sempre que um contexto sai do pool (uso, descarte ou fechamento)
+        """
+        self.factory = factory
+        self.size = size
+        self.on_release = on_release
+        self.available: List[PooledContext] = []
+        self.hits = 0
+        self.misses = 0
+        self.failures = 0
+        self._refill = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Inicia o reabastecimento em segundo plano"""
+        if self.size > 0 and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._replenish_loop())
+        self._refill.set()
+
+    def acquire(self) -> Optional[PooledContext]:
+        """
+        Retira um contexto pronto do pool
+
+        Returns:
+            Contexto pré-aquecido ou None se o pool estiver vazio
+        """
+        if not self.available:
+            self.misses += 1
+            self._refill.set()
+            return None
+        self.hits += 1
+        pooled = self._release(self.available.pop())
+        self._refill.set()
+        return pooled
+
+    def _release(self, pooled: PooledContext) -> PooledContext:
+        if self.on_release:
+            self.on_release(pooled)
+        return pooled
+
+    async def _replenish_loop(self):
+        try:
+            while True:
+                await self._refill.wait()
+                self._refill.clear()
+                while len(self.available) < self.size:
+                    try:
+                        self.available.append(await self.factory())
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as e:
+                        self.failures += 1
+                        logger.warning(f"Erro ao pré-aquecer contexto: {e}")
+                        await asyncio.sleep(self.RETRY_DELAY)
+        except asyncio.CancelledError:
+            pass
+
+    def discard(self, predicate: Callable[[PooledContext], bool]) -> int:
+        """
+        Descarta contextos ociosos (ex.: de um navegador que caiu) sem fechá-los
+
+        Args:
+            predicate: Retorna True para os contextos que devem sair do pool
+
+        Returns:
+            Quantidade de contextos descartados
+        """
+        kept, dropped = [], []
+        for pooled in self.available:
+            (dropped if predicate(pooled) else kept).append(pooled)
+        self.available = kept
+        for pooled in dropped:
+            self._release(pooled)
+        self._refill.set()
+        return len(dropped)
+
+    def resize(self, size: int):
+        """Altera a quantidade de contextos mantidos prontos"""
+        self.size = max(0, size)
+        while len(self.available) > self.size:
+            asyncio.create_task(self._release(self.available.pop()).context.close())
+        self.start()
+
+    async def close(self):
+        """Interrompe o reabastecimento e fecha os contextos ociosos"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+        idle, self.available = self.available, []
+        for pooled in idle:
+            self._release(pooled)
+        results = await asyncio.gather(
+            *(pooled.context.close() for pooled in idle), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.debug(f"Erro ao fechar contexto ocioso: {result}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Estatísticas de uso do pool"""
+        return {
+            'size': self.size,
+            'available': len(self.available),
+            'hits': self.hits,
+            'misses': self.misses,
+            'failures': self.failures,
+        }
@@ -0,0 +1,215 @@
+"""
+Barramento de eventos do agendador
+Publicação não bloqueante com filas limitadas e coalescência por assinante
+"""
+
+import asyncio
+import inspect
+import itertools
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+# Configuração de logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """Assinante com fila própria consumida em uma task dedicada"""
+
+    def __init__(self, topic: str, handler: Callable, name: str, max_queue: int):
+        self.topic = topic
+        self.handler = handler
+        self.name = name
+        self.max_queue = max_queue
+        # Chave de coalescência -> argumentos; a ordem de inserção é a ordem de entrega
+        self.pending: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.task: Optional[asyncio.Task] = None
+        self._ready = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self.delivered = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.errors = 0
+        self.max_depth = 0
+
+    def offer(self, key: Hashable, args: tuple):
+        """
+        Enfileira um evento sem bloquear
+
+        Args:
+            key: Chave de coalescência; um evento pendente com a mesma chave é substituído
+            args: Argumentos repassados ao handler
+        """
+        if key in self.pending:
+            # Mantém a posição original para não atrasar a entrega
+            self.pending[key] = args
+            self.coalesced += 1
+            return
+
+        if len(self.pending) >= self.max_queue:
+            self.pending.popitem(last=False)
+            self.dropped += 1
+
+        self.pending[key] = args
+        self.max_depth = max(self.max_depth, len(self.pending))
+        self._idle.clear()
+        self._ready.set()
+
+    async def run(self):
+        """Entrega eventos ao handler até ser cancelado"""
+        while True:
+            if not self.pending:
+                self._idle.set()
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+
+            _, args = self.pending.popitem(last=False)
+            try:
+                result = self.handler(*args)
+                if inspect.isawaitable(result):
+                    await result
+                self.delivered += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Erro no assinante '{self.name}' do evento {self.topic}: {e}")
+
+    async def wait_idle(self):
+        await self._idle.wait()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            'topic': self.topic,
+            'name': self.name,
+            'queue_depth': len(self.pending),
+            'max_depth': self.max_depth,
+            'delivered': self.delivered,
+            'coalesced': self.coalesced,
+            'dropped': self.dropped,
+            'errors': self.errors,
+        }
+
+
+class EventBus:
+    """
+    Barramento de eventos em processo
+
+    ``publish`` apenas enfileira; cada assinante consome em sua própria task,
+    de modo que um consumidor lento (ex.: WebSocket do dashboard) não atrasa
+    quem publica. Quando um assinante fica para trás, eventos com a mesma
+    chave são coalescidos e, no limite da fila, os mais antigos descartados.
+    """
+
+    def __init__(self, max_queue: int = 256):
+        """
+        Inicializa o barramento
+
+        Args:
+            max_queue: Tamanho máximo padrão da fila de cada assinante
+        """
+        self.max_queue = max_queue
+        self.subscriptions: Dict[str, List[Subscription]] = {}
+        self._unique = itertools.count()
+
+    def subscribe(self, topic: str, handler: Callable, name: Optional[str] = None,
+                  max_queue: Optional[int] = None) -> Subscription:
+        """
+        Registra um handler para um tópico
+
+        Args:
+            topic: Nome do evento
+            handler: Função ou corrotina chamada com os argumentos publicados
+            name: Nome do assinante para as métricas
+            max_queue: Tamanho da fila deste assinante
+
+        Returns:
+            Assinatura criada
+        """
+        subscription = Subscription(
+            topic,
+            handler,
+            name or getattr(handler, '__name__', repr(handler)),
+            max_queue or self.max_queue,
+        )
+        self.subscriptions.setdefault(topic, []).append(subscription)
+        return subscription
+
+    def publish(self, topic: str, *args, key: Optional[Hashable] = None):
+        """
+        Publica um evento sem bloquear
+
+        Args:
+            topic: Nome do evento
+            *args: Argumentos repassados aos handlers
+            key: Chave de coalescência (None para nunca coalescer)
+        """
+        subscriptions = self.subscriptions.get(topic)
+        if not subscriptions:
+            return
+
+        if key is None:
+            key = ('__unique__', next(self._unique))
+
+        for subscription in subscriptions:
+            subscription.offer(key, args)
+            self._ensure_consumer(subscription)
+
+    def _ensure_consumer(self, subscription: Subscription):
+        if subscription.task is not None and not subscription.task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Sem loop ativo: o consumidor é iniciado na próxima publicação
+            return
+        subscription.task = loop.create_task(subscription.run())
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Aguarda até que todas as filas sejam entregues
+
+        Args:
+            timeout: Tempo máximo de espera (segundos)
+
+        Returns:
+            True se todas as filas esvaziaram
+        """
+        waiters = [
+            subscription.wait_idle()
+            for subscriptions in self.subscriptions.values()
+            for subscription in subscriptions
+            if subscription.pending and subscription.task is not None
+        ]
+        if not waiters:
+            return True
+        try:
+            await asyncio.wait_for(asyncio.gather(*waiters), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def close(self):
+        """Cancela as tasks consumidoras"""
+        tasks = [
+            subscription.task
+            for subscriptions in self.subscriptions.values()
+            for subscription in subscriptions
+            if subscription.task is not None and not subscription.task.done()
+        ]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_metrics(self) -> List[Dict[str, Any]]:
+        """Profundidade de fila, coalescências e descartes por assinante"""
+        return [
+            subscription.get_metrics()
+            for subscriptions in self.subscriptions.values()
+            for subscription in subscriptions
+        ]
@@ -0,0 +1,108 @@
+"""
+Snapshot dos sorteios da página
+Lê todos os cards com um único evaluate e resolve o elemento apenas do card escolhido
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+# Executado no navegador: uma linha compacta por card, sem handles
+SNAPSHOT_SCRIPT = """
+([cardSel, linkSel, titleSel, amateurSel]) => Array.from(
+    document.querySelectorAll(cardSel),
+    (card, index) => {
+        const link = card.querySelector(linkSel);
+        const title = card.querySelector(titleSel);
+        return [
+            index,
+            (link && link.getAttribute('href')) || card.getAttribute('data-id') || card.id || '',
+            title ? title.innerText.trim() : '',
+            card.querySelector(amateurSel) !== null,
+            link !== null && !link.matches(':disabled') && !link.closest('[aria-disabled="true"]'),
+        ];
+    }
+)
+"""
+
+# Localiza o link do card pela chave estável; o índice só vale se a chave for vazia
+RESOLVE_SCRIPT = """
+([cardSel, linkSel, key, index]) => {
+    const cards = Array.from(document.querySelectorAll(cardSel));
+    const card = key
+        ? cards.find(c => {
+            const link = c.querySelector(linkSel);
+            return ((link && link.getAttribute('href')) || c.getAttribute('data-id') || c.id || '') === key;
+        })
+        : cards[index];
+    return card ? card.querySelector(linkSel) : null;
+}
+"""
+
+
+@dataclass
+class LotteryCard:
+    """Estado de um card de sorteio no momento do snapshot"""
+    index: int
+    key: str
+    title: str
+    is_amateur: bool
+    enabled: bool
+
+    @classmethod
+    def from_row(cls, row: List[Any]) -> 'LotteryCard':
+        index, key, title, amateur, enabled = row
+        amateur = bool(amateur) or 'amateur' in (title or '').lower()
+        return cls(int(index), key or '', title or '', amateur, bool(enabled))
+
+    @property
+    def info(self) -> Dict[str, Any]:
+        """Informações do sorteio no formato usado pelo histórico de participações"""
+        return {
+            'title': self.title,
+            'type': 'amateur' if self.is_amateur else 'unknown',
+            'is_amateur': self.is_amateur,
+        }
+
+
+async def snapshot_lotteries(page, selectors: Dict[str, str]) -> List[LotteryCard]:
+    """
+    Lê os cards de sorteio da página em um único round-trip
+
+    Args:
+        page: Página do Playwright
+        selectors: Seletores CSS da automação
+
+    Returns:
+        Cards encontrados, na ordem da página
+    """
+    rows = await page.evaluate(SNAPSHOT_SCRIPT, [
+        selectors['giveaway_card'],
+        selectors['join_link'],
+        selectors['lottery_title'],
+        selectors['amateur_lottery'],
+    ])
+    return [LotteryCard.from_row(row) for row in rows or []]
+
+
+async def resolve_join_link(page, card: LotteryCard, selectors: Dict[str, str]) -> Optional[Any]:
+    """
+    Obtém o ElementHandle do link de participação de um card
+
+    Args:
+        page: Página do Playwright
+        card: Card escolhido
+        selectors: Seletores CSS da automação
+
+    Returns:
+        Handle do link ou None se o card não está mais na página
+    """
+    handle = await page.evaluate_handle(RESOLVE_SCRIPT, [
+        selectors['giveaway_card'],
+        selectors['join_link'],
+        card.key,
+        card.index,
+    ])
+    element = handle.as_element()
+    if element is None:
+        await handle.dispose()
+    return element
@@ -0,0 +1,200 @@
+"""
+Métricas de latência do agendador
+Histogramas de memória fixa para atraso de despacho, espera no semáforo e duração das tarefas
+"""
+
+import bisect
+from typing import Any, Dict, List, Optional, Tuple
+
+# Limites superiores dos baldes (segundos), espaçados geometricamente de 1ms a ~30min
+BUCKET_BOUNDS: Tuple[float, ...] = tuple(round(0.001 * (1.5 ** i), 6) for i in range(37))
+
+
+class LatencyHistogram:
+    """
+    Histograma de latências com baldes fixos
+
+    A memória não cresce com o número de amostras e os percentis são
+    obtidos percorrendo poucas dezenas de contadores.
+    """
+
+    __slots__ = ('counts', 'count', 'total', 'max_value')
+
+    def __init__(self):
+        self.counts: List[int] = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max_value = 0.0
+
+    def record(self, value: float):
+        """
+        Registra uma amostra
+
+        Args:
+            value: Duração em segundos
+        """
+        value = max(0.0, value)
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max_value:
+            self.max_value = value
+
+    def percentile(self, q: float) -> float:
+        """
+        Retorna o limite superior do balde que contém o percentil
+
+        Args:
+            q: Percentil entre 0 e 100
+
+        Returns:
+            Latência estimada em segundos
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, int(round(q / 100 * self.count)))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                if index < len(BUCKET_BOUNDS):
+                    return min(BUCKET_BOUNDS[index], self.max_value)
+                return self.max_value
+        return self.max_value
+
+    def to_dict(self) -> Dict[str, float]:
+        """Resumo do histograma para a API"""
+        return {
+            'count': self.count,
+            'mean': round(self.total / self.count, 4) if self.count else 0.0,
+            'p50': round(self.percentile(50), 4),
+            'p95': round(self.percentile(95), 4),
+            'p99': round(self.percentile(99), 4),
+            'max': round(self.max_value, 4),
+        }
+
+
+class SchedulerMetrics:
+    """Histogramas de latência do agendador por guia e por resultado"""
+
+    STAGES = ('dispatch_lag', 'semaphore_wait', 'run_time')
+
+    def __init__(self):
+        self.by_tab: Dict[int, Dict[str, LatencyHistogram]] = {}
+        self.by_result: Dict[str, LatencyHistogram] = {}
+        self.totals: Dict[str, LatencyHistogram] = self._new_stages()
+
+    def _new_stages(self) -> Dict[str, LatencyHistogram]:
+        return {stage: LatencyHistogram() for stage in self.STAGES}
+
+    def record(self, tab_id: int, outcome: str, dispatch_lag: float,
+               semaphore_wait: float, run_time: Optional[float] = None):
+        """
+        Registra uma execução de tarefa
+
+        Args:
+            tab_id: ID da guia
+            outcome: Resultado da execução (valor de ParticipationResult ou motivo)
+            dispatch_lag: Atraso entre o prazo e o despacho (segundos)
+            semaphore_wait: Tempo aguardando o semáforo de tarefas (segundos)
+            run_time: Duração da participação (segundos), se houve
+        """
+        tab = self.by_tab.get(tab_id)
+        if tab is None:
+            tab = self.by_tab[tab_id] = self._new_stages()
+
+        samples = (dispatch_lag, semaphore_wait, run_time)
+        for stage, value in zip(self.STAGES, samples):
+            if value is None:
+                continue
+            tab[stage].record(value)
+            self.totals[stage].record(value)
+
+        result = self.by_result.get(outcome)
+        if result is None:
+            result = self.by_result[outcome] = LatencyHistogram()
+        result.record(run_time or 0.0)
+
+    def summary(self) -> Dict[str, Any]:
+        """Percentis agregados, usados em get_status()"""
+        return {stage: hist.to_dict() for stage, hist in self.totals.items()}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Todos os histogramas resumidos para a API"""
+        return {
+            'totals': self.summary(),
+            'by_tab': {
+                tab_id: {stage: hist.to_dict() for stage, hist in stages.items()}
+                for tab_id, stages in sorted(self.by_tab.items())
+            },
+            'by_result': {outcome: hist.to_dict() for outcome, hist in self.by_result.items()},
+        }
+
+    def reset(self):
+        """Descarta todas as amostras"""
+        self.by_tab.clear()
+        self.by_result.clear()
+        self.totals = self._new_stages()
+
+
+class RollingWindow:
+    """
+    Contador de sucessos/tentativas em janela deslizante de memória fixa
+
+    A janela é dividida em baldes circulares; baldes de épocas antigas são
+    reaproveitados ao serem tocados novamente.
+    """
+
+    __slots__ = ('span', 'width', 'epochs', 'successes', 'attempts')
+
+    def __init__(self, span: float, buckets: int = 60):
+        """
+        Inicializa a janela
+
+        Args:
+            span: Duração da janela (segundos)
+            buckets: Número de baldes
+        """
+        self.span = span
+        self.width = span / buckets
+        self.epochs: List[int] = [-1] * buckets
+        self.successes: List[int] = [0] * buckets
+        self.attempts: List[int] = [0] * buckets
+
+    def record(self, success: bool, timestamp: float):
+        """
+        Registra uma tentativa
+
+        Args:
+            success: Se a tentativa foi bem-sucedida
+            timestamp: Momento da tentativa (epoch em segundos)
+        """
+        epoch = int(timestamp // self.width)
+        slot = epoch % len(self.epochs)
+        if self.epochs[slot] != epoch:
+            self.epochs[slot] = epoch
+            self.successes[slot] = 0
+            self.attempts[slot] = 0
+        self.attempts[slot] += 1
+        if success:
+            self.successes[slot] += 1
+
+    def totals(self, timestamp: float) -> Tuple[int, int]:
+        """Retorna (sucessos, tentativas) dentro da janela"""
+        oldest = int(timestamp // self.width) - len(self.epochs)
+        successes = attempts = 0
+        for slot, epoch in enumerate(self.epochs):
+            if epoch > oldest:
+                successes += self.successes[slot]
+                attempts += self.attempts[slot]
+        return successes, attempts
+
+    def to_dict(self, timestamp: float) -> Dict[str, float]:
+        """Taxa de sucesso e vazão (participações/hora) da janela"""
+        successes, attempts = self.totals(timestamp)
+        return {
+            'attempts': attempts,
+            'successes': successes,
+            'success_rate': round(successes / attempts * 100, 2) if attempts else 0.0,
+            'participations_per_hour': round(successes * 3600 / self.span, 1),
+        }
@@ -0,0 +1,123 @@
+"""
+Frescor da página de sorteios
+Decide por guia entre reler a listagem, recarregá-la ou navegar de novo, e mede o que isso economiza
+"""
+
+import time
+from typing import Any, Dict, Optional, Set
+
+from .browser_manager import same_page
+from .metrics import LatencyHistogram
+
+# Bytes transferidos desde o início da navegação (documento + recursos)
+TRANSFER_SCRIPT = "() => performance.getEntries().reduce((total, e) => total + (e.transferSize || 0), 0)"
+
+
+class PageFreshness:
+    """
+    Estado da listagem de sorteios em cada guia
+
+    - ``reuse``: a guia está na listagem carregada há pouco; basta reler o DOM
+    - ``reload``: está na listagem, mas ela passou de ``max_age``
+    - ``goto``: está em outra página ou a última leitura falhou
+    """
+
+    ACTIONS = ('reuse', 'reload', 'goto')
+
+    def __init__(self, max_age: float = 30.0):
+        """
+        Inicializa o controle de frescor
+
+        Args:
+            max_age: Idade máxima da listagem antes de recarregar (segundos)
+        """
+        self.max_age = max_age
+        self._loaded_at: Dict[int, float] = {}
+        self._broken: Set[int] = set()
+        self.stats: Dict[str, Dict[str, Any]] = {
+            action: {'count': 0, 'bytes': 0, 'latency': LatencyHistogram()}
+            for action in self.ACTIONS
+        }
+
+    def decide(self, tab_id: int, current_url: Optional[str], listing_url: str) -> str:
+        """
+        Escolhe a ação mínima para ter a listagem atualizada na guia
+
+        Args:
+            tab_id: ID da guia
+            current_url: URL atual da página
+            listing_url: URL da listagem de sorteios
+
+        Returns:
+            'reuse', 'reload' ou 'goto'
+        """
+        loaded_at = self._loaded_at.get(tab_id)
+        if (tab_id in self._broken or loaded_at is None
+                or not current_url or not same_page(current_url, listing_url)):
+            return 'goto'
+        if time.monotonic() - loaded_at > self.max_age:
+            return 'reload'
+        return 'reuse'
+
+    def mark_loaded(self, tab_id: int):
+        """A listagem acabou de ser carregada na guia"""
+        self._loaded_at[tab_id] = time.monotonic()
+        self._broken.discard(tab_id)
+
+    def expire(self, tab_id: int):
+        """A listagem deve ser recarregada na próxima tentativa"""
+        if tab_id in self._loaded_at:
+            self._loaded_at[tab_id] = float('-inf')
+
+    def mark_broken(self, tab_id: int):
+        """A próxima tentativa precisa de navegação completa"""
+        self._broken.add(tab_id)
+
+    def forget(self, tab_id: int):
+        """Descarta o estado da guia (fechada, reiniciada ou recuperada com outra página)"""
+        self._loaded_at.pop(tab_id, None)
+        self._broken.discard(tab_id)
+
+    def record(self, action: str, duration: float, transferred: int = 0):
+        """
+        Registra o custo de uma ação
+
+        Args:
+            action: Ação executada
+            duration: Duração (segundos)
+            transferred: Bytes transferidos pela página
+        """
+        stats = self.stats[action]
+        stats['count'] += 1
+        stats['bytes'] += transferred
+        stats['latency'].record(duration)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Contagem e custo de cada ação e economia estimada
+
+        A economia compara cada releitura/recarga com o custo médio de uma
+        navegação completa medida nesta mesma sessão.
+        """
+        goto = self.stats['goto']
+        avoided = [self.stats['reuse'], self.stats['reload']]
+        saved_seconds = saved_bytes = None
+        if goto['count']:
+            count = sum(stats['count'] for stats in avoided)
+            saved_seconds = max(0.0, count * goto['latency'].total / goto['count']
+                                - sum(stats['latency'].total for stats in avoided))
+            saved_bytes = max(0, int(count * goto['bytes'] / goto['count']
+                                     - sum(stats['bytes'] for stats in avoided)))
+        return {
+            'max_age': self.max_age,
+            'actions': {
+                action: {
+                    'count': stats['count'],
+                    'bytes': stats['bytes'],
+                    'latency': stats['latency'].to_dict(),
+                }
+                for action, stats in self.stats.items()
+            },
+            'saved_seconds': round(saved_seconds, 3) if saved_seconds is not None else None,
+            'saved_bytes': saved_bytes,
+        }
@@ -0,0 +1,188 @@
+"""
+Histórico de participações em colunas
+Arrays paralelos com busca binária por tempo e contagens acumuladas por resultado
+"""
+
+import bisect
+from array import array
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class ParticipationStore:
+    """
+    Armazena tentativas de participação em arrays paralelos
+
+    Timestamps (epoch), guias, número da tentativa e códigos de resultado e
+    tipo ficam em ``array``; título e mensagem de erro, quase sempre vazios,
+    em listas. Para cada resultado é mantida uma soma acumulada, de modo
+    que contar uma janela de tempo custa duas buscas binárias.
+
+    Ao passar da capacidade, o quarto mais antigo é descartado de uma vez
+    (custo amortizado constante por inserção).
+    """
+
+    def __init__(self, capacity: int = 100_000):
+        """
+        Inicializa o armazenamento
+
+        Args:
+            capacity: Número máximo de tentativas mantidas
+        """
+        self.capacity = capacity
+        self.timestamps = array('d')
+        self.tab_ids = array('i')
+        self.attempt_numbers = array('i')
+        self.results = array('B')
+        self.types = array('B')
+        self.titles: List[Optional[str]] = []
+        self.errors: List[Optional[str]] = []
+        # Códigos compactos para resultados e tipos de sorteio (0 = sem tipo)
+        self._result_labels: List[str] = []
+        self._result_codes: Dict[str, int] = {}
+        self._type_labels: List[Optional[str]] = [None]
+        self._type_codes: Dict[Optional[str], int] = {None: 0}
+        # Soma acumulada por resultado; _base guarda o valor antes do descarte
+        self._cumulative: List[array] = []
+        self._base: List[int] = []
+        self.totals: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def _result_code(self, result: str) -> int:
+        code = self._result_codes.get(result)
+        if code is None:
+            code = self._result_codes[result] = len(self._result_labels)
+            self._result_labels.append(result)
+            # Resultado novo: nenhuma ocorrência nas linhas já existentes
+            self._cumulative.append(array('I', [0]) * len(self))
+            self._base.append(0)
+            self.totals[result] = 0
+        return code
+
+    def _type_code(self, lottery_type: Optional[str]) -> int:
+        code = self._type_codes.get(lottery_type)
+        if code is None:
+            code = self._type_codes[lottery_type] = len(self._type_labels)
+            self._type_labels.append(lottery_type)
+        return code
+
+    def append(self, timestamp: datetime, tab_id: int, result: str, attempt_number: int = 1,
+               lottery_type: Optional[str] = None, lottery_title: Optional[str] = None,
+               error_message: Optional[str] = None):
+        """
+        Registra uma tentativa
+
+        Args:
+            timestamp: Momento da tentativa
+            tab_id: ID da guia
+            result: Valor de ParticipationResult
+            attempt_number: Número da tentativa
+            lottery_type: Tipo do sorteio
+            lottery_title: Título do sorteio
+            error_message: Mensagem de erro
+        """
+        code = self._result_code(result)
+        epoch = timestamp.timestamp()
+        if self.timestamps and epoch < self.timestamps[-1]:
+            # Mantém a coluna ordenada mesmo se o relógio voltar
+            epoch = self.timestamps[-1]
+
+        self.timestamps.append(epoch)
+        self.tab_ids.append(tab_id)
+        self.attempt_numbers.append(attempt_number)
+        self.results.append(code)
+        self.types.append(self._type_code(lottery_type))
+        self.titles.append(lottery_title)
+        self.errors.append(error_message)
+        for index, column in enumerate(self._cumulative):
+            previous = column[-1] if column else self._base[index]
+            column.append(previous + (index == code))
+        self.totals[result] += 1
+
+        if len(self) > self.capacity:
+            # Excedente (a capacidade pode ter sido reduzida) mais um quarto de folga
+            self._drop(len(self) - self.capacity + self.capacity // 4)
+
+    def resize(self, capacity: int):
+        """
+        Altera a capacidade, descartando na hora as tentativas mais antigas que sobrarem
+
+        Args:
+            capacity: Novo número máximo de tentativas mantidas
+        """
+        self.capacity = capacity
+        if len(self) > capacity:
+            self._drop(len(self) - capacity)
+
+    def _drop(self, count: int):
+        count = min(count, len(self))
+        if count <= 0:
+            return
+        for index, column in enumerate(self._cumulative):
+            self._base[index] = column[count - 1]
+            del column[:count]
+        for column in (self.timestamps, self.tab_ids, self.attempt_numbers,
+                       self.results, self.types, self.titles, self.errors):
+            del column[:count]
+
+    def window(self, since: Optional[datetime] = None) -> Tuple[int, int]:
+        """Índices [início, fim) das tentativas a partir de ``since`` (busca binária)"""
+        start = bisect.bisect_left(self.timestamps, since.timestamp()) if since else 0
+        return start, len(self)
+
+    def counts(self, since: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Tentativas por resultado desde ``since``
+
+        Args:
+            since: Início da janela (None = todo o histórico mantido)
+
+        Returns:
+            Contagem por resultado e total
+        """
+        start, end = self.window(since)
+        counts = {'total': end - start}
+        for index, label in enumerate(self._result_labels):
+            column = self._cumulative[index]
+            if start >= end:
+                counts[label] = 0
+                continue
+            before = column[start - 1] if start else self._base[index]
+            counts[label] = column[end - 1] - before
+        return counts
+
+    def last_timestamp(self, since: Optional[datetime] = None) -> Optional[datetime]:
+        """Momento da tentativa mais recente dentro da janela"""
+        start, end = self.window(since)
+        if start >= end:
+            return None
+        return datetime.fromtimestamp(self.timestamps[end - 1])
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Uma tentativa no formato de ParticipationAttempt.to_dict"""
+        return {
+            'tab_id': self.tab_ids[index],
+            'attempt_number': self.attempt_numbers[index],
+            'timestamp': datetime.fromtimestamp(self.timestamps[index]).isoformat(),
+            'result': self._result_labels[self.results[index]],
+            'error_message': self.errors[index],
+            'lottery_type': self._type_labels[self.types[index]],
+            'lottery_title': self.titles[index],
+        }
+
+    def page(self, limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        Página do histórico em ordem cronológica, contada a partir do fim
+
+        Args:
+            limit: Quantidade de tentativas (None = todas)
+            offset: Quantas tentativas mais recentes pular
+
+        Returns:
+            Tentativas serializadas; só as linhas da página são lidas
+        """
+        end = max(0, len(self) - max(0, offset))
+        start = max(0, end - limit) if limit else 0
+        return [self.row(index) for index in range(start, end)]
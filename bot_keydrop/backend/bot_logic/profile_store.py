@@ -0,0 +1,216 @@
+"""
+Armazenamento de perfis das guias
+Mapeamento estável guia -> diretório persistido em índice, coleta de órfãos e orçamento de disco com LRU
+"""
+
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+# Configuração de logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def directory_size(path: Path) -> int:
+    """Soma o tamanho dos arquivos de um diretório (recursivo)"""
+    total = 0
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(Path(entry.path))
+                        else:
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total
+
+
+def _is_profile_dir(name: str) -> bool:
+    """Somente diretórios criados pelo bot (nome UUID) são candidatos à coleta"""
+    try:
+        uuid.UUID(name)
+        return True
+    except ValueError:
+        return False
+
+
+class ProfileStore:
+    """
+    Índice de perfis em ``profiles/index.json``
+
+    Cada guia reutiliza sempre o mesmo diretório entre reinícios e sessões.
+    ``collect`` remove diretórios que não constam no índice e, se o total
+    passar do orçamento, os perfis usados há mais tempo (exceto os ativos).
+    """
+
+    VERSION = 1
+    INDEX_NAME = "index.json"
+
+    def __init__(self, base_dir: Path, max_bytes: int = 0):
+        """
+        Inicializa o armazenamento
+
+        Args:
+            base_dir: Diretório base dos perfis
+            max_bytes: Orçamento de disco (0 = sem limite)
+        """
+        self.base_dir = Path(base_dir)
+        self.max_bytes = max_bytes
+        self.index_path = self.base_dir / self.INDEX_NAME
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.total_bytes: Optional[int] = None
+        self.sizes: Dict[str, int] = {}
+        self.orphans_removed = 0
+        self.evicted = 0
+        self.last_collect: Optional[float] = None
+        # collect roda em thread; o lock protege o índice, não a varredura do disco
+        self._lock = threading.Lock()
+        # Quantas vezes cada guia pediu o perfil (detecta uso durante a coleta)
+        self._claims: Dict[str, int] = {}
+        self._load()
+
+    def _load(self):
+        if not self.index_path.exists():
+            return
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == self.VERSION:
+                self.entries = data.get('tabs', {})
+        except Exception as e:
+            logger.warning(f"Índice de perfis ilegível, recriando: {e}")
+
+    def save(self) -> bool:
+        """Grava o índice atomicamente"""
+        with self._lock:
+            payload = {'version': self.VERSION, 'tabs': {k: dict(v) for k, v in self.entries.items()}}
+        tmp_path = self.index_path.with_name(self.INDEX_NAME + ".tmp")
+        try:
+            self.base_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, separators=(',', ':'))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.index_path)
+            return True
+        except Exception as e:
+            logger.error(f"Erro ao gravar índice de perfis: {e}")
+            return False
+
+    def path_for(self, tab_id: int) -> Path:
+        """
+        Retorna o diretório do perfil da guia, criando a entrada se necessário
+
+        Args:
+            tab_id: ID da guia
+
+        Returns:
+            Caminho do perfil
+        """
+        key = str(tab_id)
+        with self._lock:
+            entry = self.entries.get(key)
+            # Perfil sendo despejado nunca é entregue: a guia recebe um diretório novo
+            created = entry is None or entry.get('evicting')
+            self._claims[key] = self._claims.get(key, 0) + 1
+            if created:
+                entry = self.entries[key] = {'dir': str(uuid.uuid4()), 'last_used': time.time()}
+            else:
+                entry['last_used'] = time.time()
+            path = self.base_dir / entry['dir']
+        if created:
+            self.save()
+        return path
+
+    def collect(self, active_tab_ids: Iterable[int] = ()) -> Dict[str, Any]:
+        """
+        Remove perfis órfãos e aplica o orçamento de disco (operação bloqueante)
+
+        Args:
+            active_tab_ids: Guias abertas, cujos perfis nunca são removidos
+
+        Returns:
+            Estatísticas após a coleta
+        """
+        with self._lock:
+            entries = {key: dict(entry) for key, entry in self.entries.items()}
+            claims = dict(self._claims)
+        removed = []
+        if self.base_dir.exists():
+            for child in self.base_dir.iterdir():
+                if not child.is_dir() or not _is_profile_dir(child.name):
+                    continue
+                with self._lock:
+                    # Consulta o índice atual: um perfil pode ter sido criado após a cópia
+                    referenced = any(e['dir'] == child.name for e in self.entries.values())
+                if not referenced:
+                    shutil.rmtree(child, ignore_errors=True)
+                    removed.append(child)
+        self.orphans_removed += len(removed)
+
+        sizes = {
+            key: directory_size(self.base_dir / entry['dir'])
+            for key, entry in entries.items()
+        }
+        total = sum(sizes.values())
+
+        if self.max_bytes and total > self.max_bytes:
+            active = {str(tab_id) for tab_id in active_tab_ids}
+            candidates = sorted(
+                (key for key in entries if key not in active),
+                key=lambda key: entries[key].get('last_used', 0),
+            )
+            for key in candidates:
+                if total <= self.max_bytes:
+                    break
+                with self._lock:
+                    current = self.entries.get(key)
+                    # Reutilizado durante a varredura: deixa de ser candidato
+                    if (current is None or current['dir'] != entries[key]['dir']
+                            or self._claims.get(key, 0) != claims.get(key, 0)):
+                        continue
+                    # A partir daqui path_for não entrega mais este diretório
+                    current['evicting'] = True
+                shutil.rmtree(self.base_dir / entries[key]['dir'], ignore_errors=True)
+                with self._lock:
+                    if self.entries.get(key) is current:
+                        del self.entries[key]
+                total -= sizes.pop(key, 0)
+                removed.append(self.base_dir / entries[key]['dir'])
+                self.evicted += 1
+
+        self.sizes = sizes
+        self.total_bytes = total
+        self.last_collect = time.time()
+        self.save()
+        if removed:
+            logger.info(f"{len(removed)} perfis removidos; uso atual {total / 1024 / 1024:.1f}MB")
+        stats = self.get_stats()
+        stats['removed'] = [str(path) for path in removed]
+        return stats
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Uso de disco dos perfis (medido na última coleta)"""
+        return {
+            'profiles': len(self.entries),
+            'total_mb': round(self.total_bytes / 1024 / 1024, 1) if self.total_bytes is not None else None,
+            'budget_mb': round(self.max_bytes / 1024 / 1024, 1) if self.max_bytes else None,
+            'by_tab_mb': {key: round(size / 1024 / 1024, 2) for key, size in sorted(self.sizes.items())},
+            'orphans_removed': self.orphans_removed,
+            'evicted': self.evicted,
+            'last_collect': self.last_collect,
+        }
@@ -0,0 +1,129 @@
+"""
+Política de recursos das guias
+Bloqueio declarativo de tipos de recurso e padrões de URL, aplicado uma vez por contexto
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional, Pattern
+
+# Configuração de logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Extensões de URL que identificam cada tipo de recurso bloqueável
+RESOURCE_EXTENSIONS: Dict[str, tuple] = {
+    'image': ('png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'svg', 'ico', 'bmp'),
+    'font': ('woff', 'woff2', 'ttf', 'otf', 'eot'),
+    'media': ('mp4', 'webm', 'ogg', 'ogv', 'mp3', 'wav', 'm4a', 'm3u8'),
+    'stylesheet': ('css',),
+}
+
+# Tamanho médio estimado por tipo (bytes); a requisição é abortada antes da resposta
+ESTIMATED_BYTES: Dict[str, int] = {
+    'image': 40_000,
+    'font': 60_000,
+    'media': 500_000,
+    'stylesheet': 30_000,
+}
+DEFAULT_ESTIMATED_BYTES = 20_000
+
+
+@dataclass
+class ResourceCounters:
+    """Requisições bloqueadas em um contexto"""
+    blocked: int = 0
+    bytes_saved: int = 0
+    by_type: Dict[str, int] = field(default_factory=dict)
+
+    def record(self, resource_type: str):
+        """
+        Registra uma requisição bloqueada
+
+        Args:
+            resource_type: Tipo de recurso informado pelo navegador
+        """
+        self.blocked += 1
+        self.bytes_saved += ESTIMATED_BYTES.get(resource_type, DEFAULT_ESTIMATED_BYTES)
+        self.by_type[resource_type] = self.by_type.get(resource_type, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'blocked': self.blocked,
+            'bytes_saved': self.bytes_saved,
+            'by_type': dict(self.by_type),
+        }
+
+
+class ResourcePolicy:
+    """
+    Regras de bloqueio compiladas em uma única expressão regular
+
+    A rota é registrada no contexto com essa expressão, então o Playwright só
+    intercepta as URLs que casam com ela; requisições permitidas seguem direto
+    no navegador, sem passar pelo Python.
+    """
+
+    def __init__(self, blocked_types: Iterable[str] = ('image', 'font', 'media'),
+                 blocked_patterns: Iterable[str] = ()):
+        """
+        Inicializa a política
+
+        Args:
+            blocked_types: Tipos de recurso bloqueados (image, font, media, stylesheet)
+            blocked_patterns: Padrões de URL bloqueados ('*' casa qualquer trecho)
+        """
+        self.blocked_types = [t for t in blocked_types if t]
+        self.blocked_patterns = [p for p in blocked_patterns if p]
+        self.pattern = self._compile()
+
+    def _compile(self) -> Optional[Pattern]:
+        parts = []
+        extensions = []
+        for resource_type in self.blocked_types:
+            if resource_type not in RESOURCE_EXTENSIONS:
+                logger.warning(f"Tipo de recurso sem regra de bloqueio: {resource_type}")
+                continue
+            extensions.extend(RESOURCE_EXTENSIONS[resource_type])
+        if extensions:
+            parts.append(r"\.(?:%s)(?:[?#]|$)" % "|".join(sorted(set(extensions))))
+
+        for url_pattern in self.blocked_patterns:
+            parts.append(re.escape(url_pattern).replace(r"\*", ".*"))
+
+        if not parts:
+            return None
+        # Sintaxe compatível com RegExp do JavaScript: o filtro é avaliado pelo Playwright
+        return re.compile("|".join(parts), re.IGNORECASE)
+
+    def blocks(self, url: str) -> bool:
+        """Indica se a URL seria bloqueada pela política"""
+        return bool(self.pattern and self.pattern.search(url))
+
+    async def install(self, context: Any) -> ResourceCounters:
+        """
+        Registra a política em um contexto do navegador
+
+        Args:
+            context: BrowserContext do Playwright
+
+        Returns:
+            Contadores de bloqueio deste contexto
+        """
+        counters = ResourceCounters()
+        if self.pattern is None:
+            return counters
+
+        async def block(route):
+            counters.record(route.request.resource_type)
+            await route.abort()
+
+        await context.route(self.pattern, block)
+        return counters
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'blocked_types': list(self.blocked_types),
+            'blocked_patterns': list(self.blocked_patterns),
+        }
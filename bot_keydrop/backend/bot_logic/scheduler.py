@@ -4,13 +4,23 @@ Gerencia a execução assíncrona das tarefas em cada guia e controla o ciclo en
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
-from typing import Dict, List, Optional, Any, Callable
-from dataclasses import dataclass
+import math
+import time
+from typing import Dict, List, Optional, Any, Callable, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from pathlib import Path
 
+from .checkpoint import SchedulerCheckpoint
+from .concurrency import AdaptiveLimiter
+from .event_bus import EventBus
+from .metrics import RollingWindow, SchedulerMetrics
 from ..tools import PerformanceHistory, SessionRecord
+from ..system_monitor.monitor import system_monitor
 
 # Configuração de logging
 logging.basicConfig(level=logging.INFO)
@@ -53,9 +63,25 @@ class ScheduledTask:
     last_result: Optional[str] = None
     error_message: Optional[str] = None
     
+    def __setattr__(self, name: str, value: Any):
+        # Invalida o dicionário em cache e mantém os contadores da TaskTable
+        table = self.__dict__.get('_table')
+        if table is not None:
+            if name == 'status':
+                table._transition(self.__dict__.get('status'), value)
+            table._dirty = True
+        self.__dict__['_cached_dict'] = None
+        object.__setattr__(self, name, value)
+
     def to_dict(self) -> Dict[str, Any]:
-        """Converte para dicionário"""
-        return {
+        """Converte para dicionário (cópia do cache, reaproveitado enquanto a tarefa não mudar)"""
+        return dict(self._cached_row())
+
+    def _cached_row(self) -> Dict[str, Any]:
+        cached = self.__dict__.get('_cached_dict')
+        if cached is not None:
+            return cached
+        cached = self.__dict__['_cached_dict'] = {
             'task_id': self.task_id,
             'tab_id': self.tab_id,
             'task_type': self.task_type,
@@ -68,6 +94,100 @@ class ScheduledTask:
             'last_result': self.last_result,
             'error_message': self.error_message
         }
+        return cached
+
+
+# Diferença (segundos) entre o relógio de parede e o monotônico que indica salto de relógio
+CLOCK_JUMP_THRESHOLD = 2.0
+
+
+class TaskTable(dict):
+    """
+    Dicionário de tarefas com contadores incrementais por status
+
+    Mantém a contagem por ``TaskStatus`` e a lista serializada das tarefas
+    sem precisar percorrer a tabela a cada consulta.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.counts: Dict[TaskStatus, int] = {status: 0 for status in TaskStatus}
+        self._dirty = True
+        self._snapshot: List[Dict[str, Any]] = []
+
+    def _transition(self, old: Optional[TaskStatus], new: TaskStatus):
+        if old is not None:
+            self.counts[old] -= 1
+        self.counts[new] += 1
+
+    def _attach(self, task: ScheduledTask):
+        task.__dict__['_table'] = self
+        self.counts[task.status] += 1
+
+    def _detach(self, task: ScheduledTask):
+        if task.__dict__.get('_table') is self:
+            task.__dict__['_table'] = None
+            self.counts[task.status] -= 1
+
+    def __setitem__(self, key: str, task: ScheduledTask):
+        previous = self.get(key)
+        if previous is not None:
+            self._detach(previous)
+        super().__setitem__(key, task)
+        self._attach(task)
+        self._dirty = True
+
+    def __delitem__(self, key: str):
+        self._detach(self[key])
+        super().__delitem__(key)
+        self._dirty = True
+
+    def pop(self, key: str, *default):
+        if key in self:
+            self._detach(self[key])
+            self._dirty = True
+        return super().pop(key, *default)
+
+    # dict não encaminha estes métodos para __setitem__/__delitem__
+    def update(self, *args, **kwargs):
+        for key, task in dict(*args, **kwargs).items():
+            self[key] = task
+
+    def setdefault(self, key: str, default: ScheduledTask = None) -> ScheduledTask:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def popitem(self) -> Tuple[str, ScheduledTask]:
+        key, task = super().popitem()
+        self._detach(task)
+        self._dirty = True
+        return key, task
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self):
+        for task in self.values():
+            self._detach(task)
+        super().clear()
+        self._dirty = True
+
+    @property
+    def active_count(self) -> int:
+        """Tarefas não canceladas"""
+        return len(self) - self.counts[TaskStatus.CANCELLED]
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Lista serializada das tarefas (cópias), reconstruída apenas após mudanças"""
+        if self._dirty:
+            self._snapshot = [task._cached_row() for task in self.values()]
+            self._dirty = False
+        return [dict(row) for row in self._snapshot]
+
+    def counts_dict(self) -> Dict[str, int]:
+        return {status.value: count for status, count in self.counts.items()}
 
 
 @dataclass
@@ -80,9 +200,33 @@ class BotStatistics:
     active_tabs: int = 0
     current_cycle: int = 0
     last_activity: Optional[datetime] = None
+    time_to_all_tabs_ready: Optional[float] = None  # segundos
+    windows: Dict[str, RollingWindow] = field(default_factory=lambda: {
+        '1m': RollingWindow(60),
+        '15m': RollingWindow(15 * 60),
+        '1h': RollingWindow(60 * 60),
+    }, repr=False)
+
+    def record_result(self, success: bool, timestamp: Optional[float] = None):
+        """
+        Contabiliza a execução de uma tarefa
+
+        Args:
+            success: Se a tarefa foi bem-sucedida
+            timestamp: Momento da execução (epoch em segundos)
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        self.total_tasks_executed += 1
+        if success:
+            self.successful_tasks += 1
+        else:
+            self.failed_tasks += 1
+        for window in self.windows.values():
+            window.record(success, timestamp)
     
     def to_dict(self) -> Dict[str, Any]:
         """Converte para dicionário"""
+        now = time.time()
         uptime = datetime.now() - self.start_time if self.start_time else timedelta(0)
         success_rate = (self.successful_tasks / self.total_tasks_executed * 100) if self.total_tasks_executed > 0 else 0
         
@@ -95,7 +239,9 @@ class BotStatistics:
             'success_rate': round(success_rate, 2),
             'active_tabs': self.active_tabs,
             'current_cycle': self.current_cycle,
-            'last_activity': self.last_activity.isoformat() if self.last_activity else None
+            'last_activity': self.last_activity.isoformat() if self.last_activity else None,
+            'time_to_all_tabs_ready': round(self.time_to_all_tabs_ready, 2) if self.time_to_all_tabs_ready is not None else None,
+            'windows': {name: window.to_dict(now) for name, window in self.windows.items()}
         }
 
 
@@ -116,8 +262,21 @@ class BotScheduler:
         self.config_manager = config_manager
         self.proxy_manager = proxy_manager
         
+        # Relógio do agendador: hora de parede projetada pelo relógio monotônico,
+        # imune a ajustes de NTP/horário de verão (substituível em simulações)
+        self._wall_anchor = datetime.now()
+        self._mono_anchor = time.monotonic()
+        self._now: Callable[[], datetime] = self._monotonic_now
+
+        # Grade de fases: guia N executa em anchor + (N-1)*iteration_delay + k*intervalo
+        self._schedule_anchor = self._now()
+        self._catchup_cursor: Optional[datetime] = None
+
+        # Fonte de leituras de CPU/memória (None desativa o controle de pressão)
+        self.resource_monitor = system_monitor
+
         self.status = BotStatus.STOPPED
-        self.tasks: Dict[str, ScheduledTask] = {}
+        self.tasks: TaskTable = TaskTable()
         self.statistics = BotStatistics()
 
         # Histórico de falhas por aba
@@ -132,11 +291,33 @@ class BotScheduler:
         self.is_running = False
         self.should_stop = False
         self.main_task: Optional[asyncio.Task] = None
-        self.task_semaphore = asyncio.Semaphore(10)  # Limitar tarefas concorrentes
+        self.task_semaphore = AdaptiveLimiter(self.max_concurrent_tasks)  # Limite adaptativo de tarefas concorrentes
+        self._concurrency_task: Optional[asyncio.Task] = None
+        self._dispatch_mode = self.scheduler_mode
+
+        # Workers de longa duração por guia (modo 'per_tab')
+        self._tab_workers: Dict[int, asyncio.Task] = {}
+        self._tab_wakeups: Dict[int, asyncio.Event] = {}
+
+        # Fila de prontos ordenada pelo horário de execução (heap com remoção preguiçosa)
+        self._ready_queue: List[Tuple[datetime, int, str]] = []
+        self._queued_seq: Dict[str, int] = {}
+        self._queue_counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        
+        # Histogramas de latência por guia e por resultado
+        self.metrics = SchedulerMetrics()
+
+        # Checkpoint em disco para retomada a quente
+        self.checkpoint = SchedulerCheckpoint(self._checkpoint_path(), self.checkpoint_max_age)
+        self._checkpoint_task: Optional[asyncio.Task] = None
+        self._checkpoint_write: Optional[asyncio.Future] = None
+        self._resume_tasks: Dict[str, List[Any]] = {}
+        # Início real da sessão atual (nunca vem do checkpoint)
+        self._session_start: Optional[datetime] = None
         
-        # Callbacks
-        self.status_callbacks: List[Callable] = []
-        self.task_callbacks: List[Callable] = []
+        # Callbacks são entregues pelo barramento, fora do caminho das tarefas
+        self.events = EventBus()
         
         logger.info("Bot Scheduler inicializado")
     
@@ -155,6 +336,26 @@ class BotScheduler:
             self.proxy_manager.timeout = self.proxy_timeout
         self.failure_threshold = self.config.failure_reschedule_threshold
         self.reschedule_delay = self.config.failure_reschedule_delay
+        self.scheduler_mode = self.config.scheduler_mode
+        self.max_concurrent_tasks = self.config.max_concurrent_tasks
+        self.adaptive_concurrency = self.config.adaptive_concurrency
+        self.concurrency_interval = self.config.concurrency_interval
+        self.concurrency_cpu_target = self.config.concurrency_cpu_target
+        self.concurrency_memory_target = self.config.concurrency_memory_target
+        self.max_memory_usage_mb = self.config.max_memory_usage_mb
+        if hasattr(self, 'task_semaphore'):
+            self.task_semaphore.set_max_limit(self.max_concurrent_tasks)
+        self.startup_concurrency = self.config.startup_concurrency
+        self.startup_pacing = self.config.startup_pacing
+        self.startup_cpu_limit = self.config.startup_cpu_limit
+        self.startup_memory_limit = self.config.startup_memory_limit
+        self.checkpoint_enabled = self.config.checkpoint_enabled
+        self.checkpoint_interval = self.config.checkpoint_interval
+        self.checkpoint_max_age = self.config.checkpoint_max_age
+        self.fixed_rate = self.config.fixed_rate_scheduling
+        self.catchup_threshold = self.config.catchup_threshold
+        if hasattr(self, 'checkpoint'):
+            self.checkpoint.max_age = self.checkpoint_max_age
 
         logger.info("Configurações do agendador atualizadas")
     
@@ -176,13 +377,23 @@ class BotScheduler:
             
             # Atualizar configurações
             self.update_config()
+            self._dispatch_mode = self.scheduler_mode
+            self.task_semaphore = AdaptiveLimiter(self.max_concurrent_tasks)
 
             # Resetar histórico de falhas
             self.last_lottery_type.clear()
             self.consecutive_failures.clear()
 
-            # Inicializar estatísticas
-            self.statistics = BotStatistics(start_time=datetime.now())
+            # Inicializar estatísticas e a grade de fases das guias
+            self.statistics = BotStatistics(start_time=self._now())
+            self._session_start = self.statistics.start_time
+            self.tasks.clear()
+            self._schedule_anchor = self._now()
+            self._catchup_cursor = None
+
+            # Retomar tarefas, contadores e estatísticas do último checkpoint
+            if self.checkpoint_enabled:
+                self._restore_checkpoint()
             
             # Iniciar navegador se não estiver rodando
             if not self.browser_manager.is_running:
@@ -210,11 +421,16 @@ class BotScheduler:
             
             # Criar guias e tarefas
             await self._create_tabs_and_tasks()
+            self._resume_tasks.clear()
             
             # Iniciar loop principal
             self.is_running = True
             self.should_stop = False
             self.main_task = asyncio.create_task(self._main_loop())
+            if self.checkpoint_enabled:
+                self._checkpoint_task = asyncio.create_task(self._checkpoint_loop())
+            if self.adaptive_concurrency:
+                self._concurrency_task = asyncio.create_task(self._concurrency_loop())
             
             self.status = BotStatus.RUNNING
             await self._notify_status_change()
@@ -228,12 +444,14 @@ class BotScheduler:
             await self._notify_status_change()
             return False
     
-    async def stop_bot(self, emergency: bool = False) -> bool:
+    async def stop_bot(self, emergency: bool = False, keep_checkpoint: bool = False) -> bool:
         """
         Para o bot
         
         Args:
             emergency: Parada de emergência
+            keep_checkpoint: Grava o checkpoint para retomar no próximo início
+                (encerramento do backend); caso contrário ele é removido
             
         Returns:
             True se parou com sucesso
@@ -250,6 +468,7 @@ class BotScheduler:
             # Parar loop principal
             self.should_stop = True
             self.is_running = False
+            self._wakeup.set()
             
             if self.main_task and not self.main_task.done():
                 self.main_task.cancel()
@@ -257,6 +476,23 @@ class BotScheduler:
                     await self.main_task
                 except asyncio.CancelledError:
                     pass
+
+            await self._stop_tab_workers()
+
+            # Parar laços auxiliares e gravar checkpoint final antes de cancelar as tarefas
+            for helper in (self._checkpoint_task, self._concurrency_task):
+                if helper and not helper.done():
+                    helper.cancel()
+                    await asyncio.gather(helper, return_exceptions=True)
+            if self._checkpoint_write:
+                # Gravação periódica ainda em andamento na thread
+                await asyncio.gather(self._checkpoint_write, return_exceptions=True)
+            if self.checkpoint_enabled:
+                if keep_checkpoint:
+                    await self.save_checkpoint_async()
+                else:
+                    # Parada pelo usuário: a próxima sessão começa do zero
+                    self.checkpoint.clear()
             
             # Cancelar todas as tarefas
             await self._cancel_all_tasks()
@@ -271,15 +507,17 @@ class BotScheduler:
             try:
                 if self.automation_engine:
                     history = PerformanceHistory("default")
-                    sessions = self.automation_engine.get_participation_history()
-                    successes = len([a for a in sessions if a['result'] == 'success'])
-                    failures = len([a for a in sessions if a['result'] == 'failed'])
+                    # Contagens da sessão por busca binária, sem serializar o histórico
+                    session_start = self._session_start or self._now()
+                    counts = self.automation_engine.get_participation_counts(session_start)
+                    successes = counts.get('success', 0)
+                    failures = counts.get('failed', 0)
                     profit = sum(w['amount'] for w in self.automation_engine.get_winnings_history())
-                    active_time = (datetime.now() - self.statistics.start_time).total_seconds() if self.statistics.start_time else 0
+                    active_time = (self._now() - session_start).total_seconds()
                     record = SessionRecord(
-                        start_time=self.statistics.start_time.isoformat() if self.statistics.start_time else datetime.now().isoformat(),
-                        end_time=datetime.now().isoformat(),
-                        participations=len(sessions),
+                        start_time=session_start.isoformat(),
+                        end_time=self._now().isoformat(),
+                        participations=counts['total'],
                         successes=successes,
                         failures=failures,
                         profit=profit,
@@ -314,6 +552,9 @@ class BotScheduler:
             await self._notify_status_change()
             
             self.is_running = False
+            self._wakeup.set()
+            for event in self._tab_wakeups.values():
+                event.set()
             
             self.status = BotStatus.PAUSED
             await self._notify_status_change()
@@ -361,6 +602,34 @@ class BotScheduler:
         Returns:
             True se reiniciou com sucesso
         """
+        return await self._recycle_tab(tab_id, self.browser_manager.restart_tab, proxy)
+
+    async def recover_tab(self, tab_id: int, proxy: Optional[str] = None) -> bool:
+        """
+        Recupera uma guia com falha pela escada de recuperação
+        (recarregar -> nova página -> novo contexto)
+        
+        Args:
+            tab_id: ID da guia
+            proxy: Novo proxy para a guia (opcional)
+            
+        Returns:
+            True se a guia foi recuperada
+        """
+        return await self._recycle_tab(tab_id, self.browser_manager.recover_tab, proxy)
+
+    async def _recycle_tab(self, tab_id: int, action: Callable, proxy: Optional[str]) -> bool:
+        """
+        Suspende as tarefas da guia, executa a ação no navegador e as recria
+        
+        Args:
+            tab_id: ID da guia
+            action: Método do BrowserManager que reinicia/recupera a guia
+            proxy: Novo proxy para a guia (opcional)
+            
+        Returns:
+            True se a ação teve sucesso
+        """
         try:
             # Cancelar tarefas da guia
             tasks_to_cancel = [
@@ -369,15 +638,16 @@ class BotScheduler:
             ]
             
             for task in tasks_to_cancel:
-                task.status = TaskStatus.CANCELLED
+                self._unschedule_task(task)
 
             # Reiniciar guia no navegador
             if proxy is None:
-                success = await self.browser_manager.restart_tab(tab_id)
+                success = await action(tab_id)
             else:
-                success = await self.browser_manager.restart_tab(
-                    tab_id, proxy=proxy
-                )
+                success = await action(tab_id, proxy=proxy)
+
+            # A página antiga não vale mais, mesmo se a ação falhou no meio
+            self.automation_engine.forget_tab(tab_id)
 
             if success:
                 # Recriar tarefas para a guia
@@ -386,7 +656,7 @@ class BotScheduler:
                 self.last_lottery_type.pop(tab_id, None)
                 logger.info(f"Guia {tab_id} reiniciada com sucesso")
             
-            return success
+            return bool(success)
             
         except Exception as e:
             logger.error(f"Erro ao reiniciar guia {tab_id}: {e}")
@@ -413,30 +683,96 @@ class BotScheduler:
             return False
     
     async def _create_tabs_and_tasks(self):
-        """Cria guias e tarefas iniciais"""
-        logger.info(f"Criando {self.num_tabs} guias e tarefas...")
-        
-        for tab_id in range(1, self.num_tabs + 1):
-            proxy = None
-            if self.proxy_manager:
-                proxy = self.proxy_manager.get_proxy(tab_id)
-            else:
-                proxy = self.tab_proxies.get(tab_id)
+        """
+        Cria guias e tarefas iniciais
 
-            tab_info = await self.browser_manager.create_tab(tab_id, proxy=proxy)
-            if tab_info:
-                self.statistics.active_tabs += 1
-                
-                # Navegar para página de sorteios
-                await self.automation_engine.navigate_to_lotteries(tab_id)
-                
-                # Criar tarefas para a guia
-                await self._create_tasks_for_tab(tab_id)
-                
-                # Delay entre criação de guias para evitar sobrecarga
-                await asyncio.sleep(self.action_delay / self.execution_speed)
-            else:
-                logger.error(f"Falha ao criar guia {tab_id}")
+        As guias são criadas em ondas paralelas limitadas por
+        ``startup_concurrency`` e espaçadas por ``startup_pacing``. Enquanto
+        CPU ou memória estiverem acima do teto configurado, novos lançamentos
+        aguardam as guias em andamento terminarem.
+        """
+        total = self.num_tabs
+        logger.info(f"Criando {total} guias e tarefas (até {self.startup_concurrency} em paralelo)...")
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        slots = asyncio.Semaphore(self.startup_concurrency)
+        progress = {'total': total, 'ready': 0, 'failed': 0, 'in_flight': 0}
+        pacing = self.startup_pacing / self.execution_speed
+
+        async def bootstrap(tab_id: int):
+            try:
+                if self.proxy_manager:
+                    proxy = self.proxy_manager.get_proxy(tab_id)
+                else:
+                    proxy = self.tab_proxies.get(tab_id)
+
+                tab_info = await self.browser_manager.create_tab(tab_id, proxy=proxy)
+                if tab_info:
+                    self.statistics.active_tabs += 1
+
+                    # Navegar para página de sorteios
+                    await self.automation_engine.navigate_to_lotteries(tab_id)
+
+                    # Criar tarefas para a guia
+                    await self._create_tasks_for_tab(tab_id)
+                    progress['ready'] += 1
+                else:
+                    logger.error(f"Falha ao criar guia {tab_id}")
+                    progress['failed'] += 1
+            except Exception as e:
+                logger.error(f"Erro ao inicializar guia {tab_id}: {e}")
+                progress['failed'] += 1
+            finally:
+                progress['in_flight'] -= 1
+                slots.release()
+                await self._notify_startup_progress(dict(progress, tab_id=tab_id, elapsed=loop.time() - started))
+
+        pending = []
+        for tab_id in range(1, total + 1):
+            await slots.acquire()
+            await self._wait_for_startup_headroom(lambda: progress['in_flight'])
+            progress['in_flight'] += 1
+            pending.append(asyncio.create_task(bootstrap(tab_id)))
+
+            # Espaçar lançamentos para evitar picos de carga
+            if pacing and tab_id < total:
+                await asyncio.sleep(pacing)
+
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        self.statistics.time_to_all_tabs_ready = loop.time() - started
+        logger.info(
+            f"{progress['ready']}/{total} guias prontas em "
+            f"{self.statistics.time_to_all_tabs_ready:.1f}s ({progress['failed']} falhas)"
+        )
+
+    async def _wait_for_startup_headroom(self, in_flight: Callable[[], int]):
+        """
+        Aguarda CPU e memória ficarem abaixo dos tetos de inicialização
+
+        Se nenhuma guia estiver em criação a espera é liberada, para que a
+        inicialização avance uma guia por vez mesmo sob carga externa.
+
+        Args:
+            in_flight: Função que retorna o número de guias em criação
+        """
+        if self.resource_monitor is None:
+            return
+
+        while True:
+            pressure = self.resource_monitor.get_resource_pressure()
+            if (pressure['cpu_percent'] <= self.startup_cpu_limit
+                    and pressure['memory_percent'] <= self.startup_memory_limit):
+                return
+            if in_flight() == 0:
+                logger.warning(
+                    f"Recursos acima do limite (CPU {pressure['cpu_percent']:.0f}%, "
+                    f"memória {pressure['memory_percent']:.0f}%) - criando guias uma por vez"
+                )
+                return
+            await asyncio.sleep(1.0)
     
     async def _create_tasks_for_tab(self, tab_id: int):
         """
@@ -445,48 +781,411 @@ class BotScheduler:
         Args:
             tab_id: ID da guia
         """
+        task_id = f"participate_{tab_id}"
+        interval = timedelta(seconds=self.amateur_wait_time)
+
         # Calcular próxima execução com base no delay de iteração configurado
         base_delay = (tab_id - 1) * self.iteration_delay
-        next_execution = datetime.now() + timedelta(seconds=base_delay)
+        if task_id not in self.tasks:
+            # Primeira criação: fase da guia ancorada ao início do ciclo
+            next_execution = self._schedule_anchor + timedelta(seconds=base_delay)
+        elif self.fixed_rate:
+            # Recriação (ex.: guia reiniciada): retomar a mesma fase da grade
+            next_execution = self._phase_slot(tab_id, interval, self._now())
+        else:
+            next_execution = self._now() + timedelta(seconds=base_delay)
+        retry_count = 0
+        last_result = None
+
+        # Retomada a quente: preservar prazo e retentativas do checkpoint
+        saved = self._resume_tasks.pop(task_id, None)
+        if saved:
+            next_execution = datetime.fromtimestamp(saved[3])
+            retry_count = saved[4]
+            last_result = saved[5]
         
         # Criar tarefa de participação
-        task_id = f"participate_{tab_id}"
         participate_task = ScheduledTask(
             task_id=task_id,
             tab_id=tab_id,
             task_type="participate",
             next_execution=next_execution,
-            interval=timedelta(seconds=self.amateur_wait_time),
-            max_retries=self.retry_attempts
+            interval=interval,
+            retry_count=retry_count,
+            max_retries=self.retry_attempts,
+            last_result=last_result
         )
         
         self.tasks[task_id] = participate_task
+        self._schedule_task(participate_task)
         logger.debug(f"Tarefa {task_id} criada para execução em {next_execution}")
-    
+
+    def _monotonic_now(self) -> datetime:
+        """Hora de parede derivada do relógio monotônico"""
+        return self._wall_anchor + timedelta(seconds=time.monotonic() - self._mono_anchor)
+
+    def _resync_clock(self) -> float:
+        """
+        Realinha o relógio do agendador após um salto do relógio do sistema
+
+        Todos os prazos são deslocados pelo mesmo valor, preservando o
+        espaçamento entre as guias em vez de disparar todas de uma vez.
+
+        Returns:
+            Deslocamento aplicado (segundos)
+        """
+        if self._now != self._monotonic_now:
+            return 0.0  # relógio injetado (simulação)
+
+        drift = (datetime.now() - self._now()).total_seconds()
+        if abs(drift) < CLOCK_JUMP_THRESHOLD:
+            return 0.0
+
+        logger.warning(f"Salto de {drift:.1f}s no relógio do sistema detectado; realinhando prazos")
+        shift = timedelta(seconds=drift)
+        self._wall_anchor += shift
+        self._schedule_anchor += shift
+        if self._catchup_cursor is not None:
+            self._catchup_cursor += shift
+        for task in self.tasks.values():
+            task.next_execution += shift
+        # Deslocamento uniforme mantém a ordem do heap
+        self._ready_queue = [(due + shift, seq, task_id) for due, seq, task_id in self._ready_queue]
+        for event in self._tab_wakeups.values():
+            event.set()
+        return drift
+
+    def _phase_slot(self, tab_id: int, interval: timedelta, after: datetime) -> datetime:
+        """
+        Próximo horário da grade de fases da guia estritamente após ``after``
+
+        Args:
+            tab_id: ID da guia
+            interval: Período da tarefa
+            after: Instante de referência
+
+        Returns:
+            Horário do próximo slot da guia
+        """
+        first = self._schedule_anchor + timedelta(seconds=(tab_id - 1) * self.iteration_delay)
+        if after < first:
+            return first
+        period = interval.total_seconds()
+        slots = math.floor((after - first).total_seconds() / period) + 1
+        return first + timedelta(seconds=slots * period)
+
+    def _catchup_slot(self, task: ScheduledTask, current_time: datetime) -> Optional[datetime]:
+        """
+        Política de recuperação para tarefas muito atrasadas (ex.: após suspensão)
+
+        Tarefas com atraso acima de ``catchup_threshold`` são liberadas uma a
+        uma, separadas por ``iteration_delay``, na ordem dos prazos originais.
+
+        Args:
+            task: Tarefa pronta para execução
+            current_time: Momento atual
+
+        Returns:
+            Novo horário se a tarefa deve ser adiada, None se pode executar agora
+        """
+        if not self.catchup_threshold:
+            return None
+        if (current_time - task.next_execution).total_seconds() <= self.catchup_threshold:
+            return None
+
+        slot = current_time
+        if self._catchup_cursor is not None and self._catchup_cursor > current_time:
+            slot = self._catchup_cursor
+        self._catchup_cursor = slot + timedelta(seconds=self.iteration_delay)
+        return None if slot == current_time else slot
+
+    def _checkpoint_path(self) -> Path:
+        """Retorna o caminho do checkpoint, ao lado das configurações"""
+        config_dir = getattr(self.config_manager, 'config_dir', None)
+        base_dir = config_dir if isinstance(config_dir, Path) else Path('.')
+        return base_dir / "scheduler_checkpoint.json"
+
+    def _checkpoint_state(self) -> Dict[str, Any]:
+        """Serializa a tabela de tarefas em formato compacto (linhas em lista)"""
+        # Realinhar antes de ler os prazos: linhas e âncora na mesma base de tempo
+        self._resync_clock()
+        tasks = [
+            [task.task_id, task.tab_id, task.task_type, task.next_execution.timestamp(),
+             task.retry_count, task.last_result]
+            for task in self.tasks.values()
+            if task.status != TaskStatus.CANCELLED
+        ]
+        stats = self.statistics
+        return {
+            'anchor': self._schedule_anchor.timestamp(),
+            'fields': ['task_id', 'tab_id', 'task_type', 'next_execution', 'retry_count', 'last_result'],
+            'tasks': tasks,
+            # Cópias: a serialização pode ocorrer em outra thread
+            'consecutive_failures': dict(self.consecutive_failures),
+            'last_lottery_type': dict(self.last_lottery_type),
+            'statistics': [
+                stats.start_time.timestamp() if stats.start_time else None,
+                stats.total_tasks_executed,
+                stats.successful_tasks,
+                stats.failed_tasks,
+                stats.current_cycle,
+            ],
+        }
+
+    def save_checkpoint(self) -> bool:
+        """
+        Grava o checkpoint do agendador
+
+        Returns:
+            True se gravou com sucesso
+        """
+        return self.checkpoint.save(self._checkpoint_state())
+
+    async def save_checkpoint_async(self) -> bool:
+        """
+        Grava o checkpoint fora do event loop (json.dump + fsync em thread)
+
+        O estado é serializado no loop; apenas a escrita vai para a thread.
+        A escrita não é interrompida se quem aguarda for cancelado.
+
+        Returns:
+            True se gravou com sucesso
+        """
+        state = self._checkpoint_state()
+        self._checkpoint_write = asyncio.ensure_future(asyncio.to_thread(self.checkpoint.save, state))
+        return await asyncio.shield(self._checkpoint_write)
+
+    def _restore_checkpoint(self) -> bool:
+        """
+        Carrega o checkpoint e prepara a retomada das tarefas
+
+        Tarefas cujo prazo já passou durante a parada são espalhadas a partir
+        de agora, na ordem original, separadas por ``iteration_delay`` para não
+        disparar todas as guias de uma vez.
+
+        Returns:
+            True se havia checkpoint válido
+        """
+        state = self.checkpoint.load()
+        if not state:
+            return False
+
+        # Validar tudo antes de aplicar: um checkpoint corrompido não pode impedir o início
+        try:
+            now = self._now().timestamp()
+            rows = sorted(
+                ([str(row[0]), int(row[1]), str(row[2]), float(row[3]), int(row[4]), row[5]]
+                 for row in state.get('tasks', [])),
+                key=lambda row: row[3],
+            )
+            overdue = 0
+            for row in rows:
+                if row[3] < now:
+                    row[3] = now + overdue * self.iteration_delay
+                    overdue += 1
+                datetime.fromtimestamp(row[3])
+
+            consecutive_failures = {
+                int(k): int(v) for k, v in state.get('consecutive_failures', {}).items()
+            }
+            last_lottery_type = {
+                int(k): v for k, v in state.get('last_lottery_type', {}).items()
+            }
+            anchor = datetime.fromtimestamp(state['anchor']) if state.get('anchor') else None
+
+            start_time, executed, successful, failed, cycle = state['statistics']
+            start_time = datetime.fromtimestamp(start_time) if start_time else None
+            executed, successful, failed, cycle = int(executed), int(successful), int(failed), int(cycle)
+        except (KeyError, TypeError, ValueError, IndexError, OverflowError, AttributeError) as e:
+            logger.error(f"Checkpoint do agendador inválido, iniciando do zero: {e}")
+            self.checkpoint.clear()
+            return False
+
+        for row in rows:
+            self._resume_tasks[row[0]] = row
+        self.consecutive_failures.update(consecutive_failures)
+        self.last_lottery_type.update(last_lottery_type)
+        if anchor:
+            self._schedule_anchor = anchor
+
+        if start_time:
+            self.statistics.start_time = start_time
+        self.statistics.total_tasks_executed = executed
+        self.statistics.successful_tasks = successful
+        self.statistics.failed_tasks = failed
+        self.statistics.current_cycle = cycle
+
+        logger.info(f"Checkpoint retomado: {len(rows)} tarefas ({overdue} atrasadas reespaçadas)")
+        return True
+
+    async def _concurrency_loop(self):
+        """Ajusta periodicamente o limite de tarefas concorrentes"""
+        try:
+            while not self.should_stop:
+                await asyncio.sleep(self.concurrency_interval)
+                if self.is_running:
+                    await self._adjust_concurrency()
+        except asyncio.CancelledError:
+            pass
+
+    async def _adjust_concurrency(self) -> Dict[str, Any]:
+        """
+        Executa uma rodada do controle de concorrência
+
+        Returns:
+            Decisão do controlador
+        """
+        cpu = memory = bot_memory = None
+        if self.resource_monitor is not None:
+            pressure = self.resource_monitor.get_resource_pressure()
+            cpu = pressure.get('cpu_percent')
+            memory = pressure.get('memory_percent')
+            # Varre processos filhos (navegadores); fora do event loop
+            bot_memory = await asyncio.to_thread(self.resource_monitor.get_bot_memory_mb)
+
+        return self.task_semaphore.adjust(
+            cpu_percent=cpu,
+            memory_percent=memory,
+            bot_memory_mb=bot_memory,
+            cpu_target=self.concurrency_cpu_target,
+            memory_target=self.concurrency_memory_target,
+            memory_ceiling_mb=self.max_memory_usage_mb,
+        )
+
+    async def _checkpoint_loop(self):
+        """Grava o checkpoint periodicamente enquanto o bot estiver ativo"""
+        try:
+            while not self.should_stop:
+                await asyncio.sleep(self.checkpoint_interval)
+                await self.save_checkpoint_async()
+        except asyncio.CancelledError:
+            pass
+
+    def _schedule_task(self, task: ScheduledTask):
+        """
+        Insere a tarefa na fila de prontos e acorda o loop principal
+
+        Entradas antigas da mesma tarefa ficam obsoletas e são descartadas
+        quando chegam ao topo do heap.
+
+        Args:
+            task: Tarefa agendada
+        """
+        seq = next(self._queue_counter)
+        self._queued_seq[task.task_id] = seq
+
+        if self._dispatch_mode == "per_tab":
+            # O worker da guia aguarda o próprio prazo; o loop principal só
+            # precisa garantir que o worker exista (ex.: após restart_tab)
+            event = self._tab_wakeups.get(task.tab_id)
+            if event:
+                event.set()
+            worker = self._tab_workers.get(task.tab_id)
+            if worker is None or worker.done():
+                self._wakeup.set()
+            return
+
+        heapq.heappush(self._ready_queue, (task.next_execution, seq, task.task_id))
+
+        # Compactar heap quando houver muitas entradas obsoletas
+        if len(self._ready_queue) > 2 * len(self._queued_seq) + 64:
+            self._ready_queue = [
+                entry for entry in self._ready_queue
+                if self._queued_seq.get(entry[2]) == entry[1]
+            ]
+            heapq.heapify(self._ready_queue)
+
+        self._wakeup.set()
+
+    def _unschedule_task(self, task: ScheduledTask):
+        """
+        Cancela uma tarefa e invalida sua entrada na fila de prontos
+
+        Args:
+            task: Tarefa a cancelar
+        """
+        task.status = TaskStatus.CANCELLED
+        self._queued_seq.pop(task.task_id, None)
+        event = self._tab_wakeups.get(task.tab_id)
+        if event:
+            event.set()
+        self._wakeup.set()
+
+    def _pop_ready_tasks(self, current_time: datetime, limit: int) -> List[ScheduledTask]:
+        """
+        Remove da fila as tarefas cujo horário de execução já passou
+
+        Args:
+            current_time: Horário de referência
+            limit: Número máximo de tarefas retornadas
+
+        Returns:
+            Tarefas prontas em ordem de horário de execução
+        """
+        ready: List[ScheduledTask] = []
+        while self._ready_queue and len(ready) < limit:
+            when, seq, task_id = self._ready_queue[0]
+            if self._queued_seq.get(task_id) != seq:
+                heapq.heappop(self._ready_queue)
+                continue
+            if when > current_time:
+                break
+            heapq.heappop(self._ready_queue)
+            del self._queued_seq[task_id]
+            task = self.tasks.get(task_id)
+            if task and task.status == TaskStatus.PENDING:
+                ready.append(task)
+        return ready
+
+    def _seconds_until_next_task(self, current_time: datetime) -> Optional[float]:
+        """Retorna segundos até a próxima tarefa válida ou None se a fila estiver vazia"""
+        while self._ready_queue:
+            when, seq, task_id = self._ready_queue[0]
+            if self._queued_seq.get(task_id) == seq:
+                return max(0.0, (when - current_time).total_seconds())
+            heapq.heappop(self._ready_queue)
+        return None
+
+    async def _wait_for_wakeup(self, timeout: Optional[float]):
+        """Dorme até o próximo prazo ou até a fila ser alterada"""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
     async def _main_loop(self):
         """Loop principal do agendador"""
         logger.info("Loop principal do agendador iniciado")
         
         try:
             while self.is_running and not self.should_stop:
-                current_time = datetime.now()
-                
-                # Processar tarefas pendentes
-                ready_tasks = [
-                    task for task in self.tasks.values()
-                    if task.status == TaskStatus.PENDING and task.next_execution <= current_time
-                ]
-                
-                # Executar tarefas prontas
-                if ready_tasks:
-                    await self._execute_tasks(ready_tasks)
+                self._wakeup.clear()
+                self._resync_clock()
+                current_time = self._now()
+                timeout: Optional[float] = None
+
+                if self._dispatch_mode == "per_tab":
+                    # Cada guia é conduzida pelo próprio worker
+                    self._ensure_tab_workers()
+                else:
+                    # Retirar tarefas prontas da fila (O(log n) por tarefa)
+                    ready_tasks = self._pop_ready_tasks(current_time, limit=self.task_semaphore.limit)
+                    ready_tasks = self._defer_overdue(ready_tasks, current_time)
+
+                    # Executar tarefas prontas
+                    if ready_tasks:
+                        await self._execute_tasks(ready_tasks)
                 
                 # Atualizar estatísticas
                 self.statistics.last_activity = current_time
                 self.statistics.active_tabs = self.browser_manager.get_tab_count()
                 
-                # Aguardar antes da próxima verificação
-                await asyncio.sleep(1.0 / self.execution_speed)
+                # Dormir exatamente até o próximo prazo (ou até ser acordado)
+                if not self.is_running or self.should_stop:
+                    break
+                if self._dispatch_mode != "per_tab":
+                    timeout = self._seconds_until_next_task(self._now())
+                await self._wait_for_wakeup(timeout)
                 
         except asyncio.CancelledError:
             logger.info("Loop principal cancelado")
@@ -495,6 +1194,27 @@ class BotScheduler:
             self.status = BotStatus.ERROR
             await self._notify_status_change()
     
+    def _defer_overdue(self, tasks: List[ScheduledTask], current_time: datetime) -> List[ScheduledTask]:
+        """
+        Reagenda as tarefas atrasadas demais conforme a política de recuperação
+
+        Args:
+            tasks: Tarefas retiradas da fila de prontos
+            current_time: Momento atual
+
+        Returns:
+            Tarefas que devem executar agora
+        """
+        run_now = []
+        for task in tasks:
+            slot = self._catchup_slot(task, current_time)
+            if slot is None:
+                run_now.append(task)
+            else:
+                task.next_execution = slot
+                self._schedule_task(task)
+        return run_now
+
     async def _execute_tasks(self, tasks: List[ScheduledTask]):
         """
         Executa uma lista de tarefas
@@ -502,10 +1222,10 @@ class BotScheduler:
         Args:
             tasks: Lista de tarefas para executar
         """
-        # Limitar número de tarefas concorrentes
+        # A concorrência efetiva é controlada por task_semaphore
         semaphore_tasks = []
         
-        for task in tasks[:10]:  # Máximo 10 tarefas por vez
+        for task in tasks:
             semaphore_task = asyncio.create_task(
                 self._execute_single_task(task)
             )
@@ -515,6 +1235,71 @@ class BotScheduler:
         if semaphore_tasks:
             await asyncio.gather(*semaphore_tasks, return_exceptions=True)
     
+    def _ensure_tab_workers(self):
+        """Cria um worker para cada guia com tarefa ativa que ainda não possui um"""
+        for task in self.tasks.values():
+            if task.status == TaskStatus.CANCELLED:
+                continue
+            worker = self._tab_workers.get(task.tab_id)
+            if worker is None or worker.done():
+                self._tab_wakeups.setdefault(task.tab_id, asyncio.Event())
+                self._tab_workers[task.tab_id] = asyncio.create_task(
+                    self._tab_worker(task.tab_id)
+                )
+
+    async def _tab_worker(self, tab_id: int):
+        """
+        Worker de longa duração que conduz uma única guia
+
+        Cada worker aguarda o prazo da própria tarefa e disputa apenas o
+        semáforo global, de modo que uma guia lenta não atrasa as demais.
+
+        Args:
+            tab_id: ID da guia
+        """
+        wakeup = self._tab_wakeups[tab_id]
+        task_id = f"participate_{tab_id}"
+        try:
+            while self.is_running and not self.should_stop:
+                wakeup.clear()
+                task = self.tasks.get(task_id)
+                if task is None or task.status == TaskStatus.CANCELLED:
+                    break
+                if task.status != TaskStatus.PENDING:
+                    await wakeup.wait()
+                    continue
+
+                delay = (task.next_execution - self._now()).total_seconds()
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(wakeup.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                slot = self._catchup_slot(task, self._now())
+                if slot is not None:
+                    task.next_execution = slot
+                    continue
+
+                self._queued_seq.pop(task_id, None)
+                await self._execute_single_task(task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            if self._tab_workers.get(tab_id) is asyncio.current_task():
+                del self._tab_workers[tab_id]
+
+    async def _stop_tab_workers(self):
+        """Cancela todos os workers de guia"""
+        workers = list(self._tab_workers.values())
+        for worker in workers:
+            worker.cancel()
+        if workers:
+            await asyncio.gather(*workers, return_exceptions=True)
+        self._tab_workers.clear()
+        self._tab_wakeups.clear()
+
     async def _execute_single_task(self, task: ScheduledTask):
         """
         Executa uma única tarefa
@@ -522,10 +1307,15 @@ class BotScheduler:
         Args:
             task: Tarefa a ser executada
         """
+        loop = asyncio.get_running_loop()
+        dispatch_lag = max(0.0, (self._now() - task.next_execution).total_seconds())
+        wait_started = loop.time()
         async with self.task_semaphore:
+            semaphore_wait = loop.time() - wait_started
+            run_started = None
             try:
                 task.status = TaskStatus.RUNNING
-                task.last_execution = datetime.now()
+                task.last_execution = self._now()
                 
                 logger.debug(f"Executando tarefa {task.task_id}")
                 
@@ -534,12 +1324,18 @@ class BotScheduler:
                 if task.task_type == "participate":
                     # Verificar se a guia está pronta
                     if self.browser_manager.is_tab_ready(task.tab_id):
+                        run_started = loop.time()
                         result = await self.automation_engine.participate_in_lottery(
                             task.tab_id,
                             max_retries=1  # Uma tentativa por execução da tarefa
                         )
                         success = result.result.value == "success"
                         task.last_result = result.result.value
+                        run_time = loop.time() - run_started
+                        self.metrics.record(task.tab_id, task.last_result, dispatch_lag,
+                                            semaphore_wait, run_time)
+                        self.task_semaphore.observe(run_time)
+                        run_started = None
 
                         # Atualizar histórico de falhas para reagendamento inteligente
                         lot_type = result.lottery_type
@@ -557,89 +1353,116 @@ class BotScheduler:
                             task.error_message = result.error_message
                     else:
                         task.error_message = "Guia não está pronta"
+                        self.metrics.record(task.tab_id, "tab_not_ready", dispatch_lag, semaphore_wait)
                 
                 # Atualizar estatísticas
-                self.statistics.total_tasks_executed += 1
+                self.statistics.record_result(success, self._now().timestamp())
                 
                 if success:
                     task.status = TaskStatus.COMPLETED
                     task.retry_count = 0
-                    self.statistics.successful_tasks += 1
 
-                    # Agendar próxima execução
-                    task.next_execution = datetime.now() + task.interval
+                    # Agendar próxima execução: taxa fixa segue a grade de fases da
+                    # guia; caso contrário, o intervalo conta a partir do fim da execução
+                    if self.fixed_rate:
+                        task.next_execution = self._phase_slot(task.tab_id, task.interval, self._now())
+                    else:
+                        task.next_execution = self._now() + task.interval
                     task.status = TaskStatus.PENDING
+                    self._schedule_task(task)
 
                 else:
                     task.retry_count += 1
-                    self.statistics.failed_tasks += 1
 
+                    recovered = False
                     if task.retry_count >= task.max_retries:
-                        # Reiniciar guia após múltiplas falhas
-                        logger.warning(
-                            f"Reiniciando guia {task.tab_id} após {task.retry_count} falhas"
-                        )
                         new_proxy = None
                         if self.proxy_manager:
                             new_proxy = self.proxy_manager.report_failure(
                                 task.tab_id, task.error_message or ""
                             )
-                        await self.restart_tab(task.tab_id, proxy=new_proxy)
-                    else:
+                        # Troca de proxy exige novo contexto; sem ela, a sonda decide
+                        # se a guia precisa mesmo ser recuperada
+                        action = 'recover' if new_proxy else await self.browser_manager.triage_tab(task.tab_id)
+                        if action == 'recover':
+                            logger.warning(
+                                f"Recuperando guia {task.tab_id} após {task.retry_count} falhas"
+                            )
+                            await self.recover_tab(task.tab_id, proxy=new_proxy)
+                            recovered = True
+                        else:
+                            logger.info(
+                                f"Guia {task.tab_id} responde ({action}) após "
+                                f"{task.retry_count} falhas; recuperação dispensada"
+                            )
+
+                    if not recovered:
                         # Verificar falhas consecutivas para reagendar com atraso maior
                         fail_count = self.consecutive_failures.get(task.tab_id, 0)
                         if fail_count >= self.failure_threshold:
-                            task.next_execution = datetime.now() + timedelta(seconds=self.reschedule_delay)
+                            task.next_execution = self._now() + timedelta(seconds=self.reschedule_delay)
                             self.consecutive_failures[task.tab_id] = 0
                         else:
                             retry_delay = timedelta(seconds=30 * task.retry_count)
-                            task.next_execution = datetime.now() + retry_delay
+                            task.next_execution = self._now() + retry_delay
                         task.status = TaskStatus.PENDING
+                        self._schedule_task(task)
+                        if task.retry_count >= task.max_retries:
+                            # Guia saudável: recomeça o ciclo de tentativas
+                            task.retry_count = 0
                 
                 # Notificar callbacks
                 await self._notify_task_completion(task)
                 
             except Exception as e:
                 logger.error(f"Erro ao executar tarefa {task.task_id}: {e}")
+                if run_started is not None:
+                    self.metrics.record(task.tab_id, "error", dispatch_lag,
+                                        semaphore_wait, loop.time() - run_started)
                 task.status = TaskStatus.FAILED
                 task.error_message = str(e)
                 task.retry_count += 1
                 
                 if task.retry_count < task.max_retries:
-                    task.next_execution = datetime.now() + timedelta(seconds=60)
+                    task.next_execution = self._now() + timedelta(seconds=60)
                     task.status = TaskStatus.PENDING
+                    self._schedule_task(task)
     
     async def _cancel_all_tasks(self):
         """Cancela todas as tarefas ativas"""
         for task in self.tasks.values():
             if task.status in [TaskStatus.PENDING, TaskStatus.RUNNING]:
                 task.status = TaskStatus.CANCELLED
+
+        self._ready_queue.clear()
+        self._queued_seq.clear()
+        self._wakeup.set()
         
         logger.info("Todas as tarefas canceladas")
     
     async def _notify_status_change(self):
-        """Notifica mudança de status para callbacks"""
-        for callback in self.status_callbacks:
-            try:
-                await callback(self.status, self.statistics)
-            except Exception as e:
-                logger.error(f"Erro em callback de status: {e}")
+        """Publica mudança de status (coalescida para o estado mais recente)"""
+        self.events.publish("status", self.status, self.statistics, key="status")
     
     async def _notify_task_completion(self, task: ScheduledTask):
-        """Notifica conclusão de tarefa para callbacks"""
-        for callback in self.task_callbacks:
-            try:
-                await callback(task)
-            except Exception as e:
-                logger.error(f"Erro em callback de tarefa: {e}")
+        """Publica conclusão de tarefa (coalescida por guia)"""
+        self.events.publish("task_completed", task, key=task.tab_id)
+    
+    async def _notify_startup_progress(self, progress: Dict[str, Any]):
+        """Publica progresso da criação de guias"""
+        self.events.publish("startup_progress", progress)
     
     def add_status_callback(self, callback: Callable):
         """Adiciona callback para mudanças de status"""
-        self.status_callbacks.append(callback)
+        self.events.subscribe("status", callback)
     
     def add_task_callback(self, callback: Callable):
         """Adiciona callback para conclusão de tarefas"""
-        self.task_callbacks.append(callback)
+        self.events.subscribe("task_completed", callback)
+
+    def add_progress_callback(self, callback: Callable):
+        """Adiciona callback para o progresso de criação das guias"""
+        self.events.subscribe("startup_progress", callback)
     
     def get_status(self) -> Dict[str, Any]:
         """Retorna status atual do bot"""
@@ -647,7 +1470,15 @@ class BotScheduler:
             'status': self.status.value,
             'is_running': self.is_running,
             'statistics': self.statistics.to_dict(),
-            'active_tasks': len([t for t in self.tasks.values() if t.status != TaskStatus.CANCELLED]),
+            'active_tasks': self.tasks.active_count,
+            'tasks_by_status': self.tasks.counts_dict(),
+            'latency': self.metrics.summary(),
+            'event_bus': self.events.get_metrics(),
+            'concurrency': {
+                'limit': self.task_semaphore.limit,
+                'in_flight': self.task_semaphore.in_flight,
+                'max_limit': self.task_semaphore.max_limit,
+            },
             'config': {
                 'num_tabs': self.num_tabs,
                 'execution_speed': self.execution_speed,
@@ -655,9 +1486,18 @@ class BotScheduler:
             }
         }
     
+    def get_concurrency_status(self) -> Dict[str, Any]:
+        """Retorna o limite atual de concorrência e as últimas decisões do controlador"""
+        return dict(self.task_semaphore.to_dict(), adaptive=self.adaptive_concurrency,
+                    memory_ceiling_mb=self.max_memory_usage_mb)
+    
+    def get_latency_metrics(self) -> Dict[str, Any]:
+        """Retorna os histogramas de latência por guia e por resultado"""
+        return self.metrics.to_dict()
+    
     def get_tasks_status(self) -> List[Dict[str, Any]]:
         """Retorna status de todas as tarefas"""
-        return [task.to_dict() for task in self.tasks.values()]
+        return self.tasks.snapshot()
     
     def get_tabs_status(self) -> List[Dict[str, Any]]:
         """Retorna status de todas as guias"""
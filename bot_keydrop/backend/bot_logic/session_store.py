@@ -0,0 +1,184 @@
+"""
+Persistência de sessões das guias
+Gravação em segundo plano, com debounce por arquivo, escrita atômica e cache de leitura
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# Configuração de logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class SessionStore:
+    """
+    Armazena o storage_state de cada perfil em session.json
+
+    ``save`` apenas agenda a gravação: salvamentos repetidos do mesmo arquivo
+    dentro do intervalo de debounce são coalescidos. Serialização, hash e
+    escrita rodam em thread, fora do event loop, e estados idênticos ao
+    último gravado não são reescritos.
+    """
+
+    def __init__(self, debounce: float = 2.0):
+        """
+        Inicializa o armazenamento
+
+        Args:
+            debounce: Tempo de espera antes de gravar (segundos)
+        """
+        self.debounce = debounce
+        # Caminho -> (mtime_ns, hash, estado) do último conteúdo lido ou gravado
+        self._cache: Dict[Path, Tuple[int, str, Dict[str, Any]]] = {}
+        self._pending: Dict[Path, Dict[str, Any]] = {}
+        self._timers: Dict[Path, asyncio.Task] = {}
+        self._locks: Dict[Path, asyncio.Lock] = {}
+        self.writes = 0
+        self.unchanged = 0
+        self.coalesced = 0
+        self.reads = 0
+        self.cache_hits = 0
+        self.errors = 0
+
+    def save(self, path: Path, storage_state: Dict[str, Any]):
+        """
+        Agenda a gravação de um storage_state
+
+        Args:
+            path: Arquivo session.json do perfil
+            storage_state: Estado retornado por context.storage_state()
+        """
+        path = Path(path)
+        if path in self._pending:
+            self.coalesced += 1
+        self._pending[path] = storage_state
+
+        timer = self._timers.get(path)
+        if timer is None or timer.done():
+            self._timers[path] = asyncio.create_task(self._delayed_flush(path))
+
+    async def _delayed_flush(self, path: Path):
+        try:
+            await asyncio.sleep(self.debounce)
+            await self._flush_path(path)
+        except asyncio.CancelledError:
+            pass
+
+    async def _flush_path(self, path: Path) -> bool:
+        lock = self._locks.setdefault(path, asyncio.Lock())
+        async with lock:
+            storage_state = self._pending.pop(path, None)
+            if storage_state is None:
+                return True
+            cached = self._cache.get(path)
+            try:
+                entry = await asyncio.to_thread(
+                    self._write, path, storage_state, cached[1] if cached else None
+                )
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Erro ao salvar sessão em {path}: {e}")
+                return False
+
+            if entry is None:
+                self.unchanged += 1
+            else:
+                self.writes += 1
+                self._cache[path] = entry
+            return True
+
+    @staticmethod
+    def _write(path: Path, storage_state: Dict[str, Any],
+               previous_hash: Optional[str]) -> Optional[Tuple[int, str, Dict[str, Any]]]:
+        """Serializa e grava atomicamente; retorna None se o conteúdo não mudou"""
+        data = json.dumps(storage_state, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        digest = hashlib.sha1(data).hexdigest()
+        if digest == previous_hash and path.exists():
+            return None
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        return path.stat().st_mtime_ns, digest, storage_state
+
+    async def load(self, path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Lê um session.json, reaproveitando o cache se o arquivo não mudou
+
+        Args:
+            path: Arquivo session.json do perfil
+
+        Returns:
+            storage_state salvo ou None
+        """
+        path = Path(path)
+        pending = self._pending.get(path)
+        if pending is not None:
+            self.cache_hits += 1
+            return pending
+
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        cached = self._cache.get(path)
+        if cached and cached[0] == mtime:
+            self.cache_hits += 1
+            return cached[2]
+
+        entry = await asyncio.to_thread(self._read, path)
+        self.reads += 1
+        self._cache[path] = entry
+        return entry[2]
+
+    @staticmethod
+    def _read(path: Path) -> Tuple[int, str, Dict[str, Any]]:
+        data = path.read_bytes()
+        mtime = path.stat().st_mtime_ns
+        storage_state = json.loads(data.decode('utf-8'))
+        # Hash do formato compacto, para comparar com gravações futuras
+        compact = json.dumps(storage_state, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        return mtime, hashlib.sha1(compact).hexdigest(), storage_state
+
+    async def flush(self, path: Optional[Path] = None):
+        """
+        Grava imediatamente o que estiver pendente
+
+        Args:
+            path: Arquivo específico ou None para todos
+        """
+        paths = [Path(path)] if path is not None else list(self._pending)
+        for target in paths:
+            timer = self._timers.pop(target, None)
+            if timer and not timer.done():
+                timer.cancel()
+        if paths:
+            await asyncio.gather(*(self._flush_path(target) for target in paths))
+
+    def forget(self, path: Path):
+        """Remove um arquivo do cache (ex.: perfil apagado)"""
+        self._cache.pop(Path(path), None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Contadores de gravação e leitura"""
+        return {
+            'pending': len(self._pending),
+            'cached': len(self._cache),
+            'writes': self.writes,
+            'unchanged': self.unchanged,
+            'coalesced': self.coalesced,
+            'reads': self.reads,
+            'cache_hits': self.cache_hits,
+            'errors': self.errors,
+        }
@@ -0,0 +1,95 @@
+"""
+Consumo de recursos por guia
+Amostras de memória e CPU obtidas via CDP (Performance.getMetrics) e orçamentos por guia
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Optional, Tuple
+
+MB = 1024 * 1024
+
+
+@dataclass
+class TabUsage:
+    """Histórico curto de amostras de uma guia"""
+    samples: Deque[Tuple[float, float, float]] = field(default_factory=lambda: deque(maxlen=12))
+    nodes: int = 0
+
+    def add(self, timestamp: float, metrics: Dict[str, float]):
+        """
+        Registra uma amostra de Performance.getMetrics
+
+        Args:
+            timestamp: Momento da amostra (segundos, relógio monotônico)
+            metrics: Métricas do CDP indexadas pelo nome
+        """
+        heap_mb = metrics.get('JSHeapTotalSize', 0.0) / MB
+        task_duration = metrics.get('TaskDuration', 0.0)
+        self.samples.append((timestamp, heap_mb, task_duration))
+        self.nodes = int(metrics.get('Nodes', 0))
+
+    @property
+    def memory_mb(self) -> Optional[float]:
+        return self.samples[-1][1] if self.samples else None
+
+    @property
+    def cpu_percent(self) -> Optional[float]:
+        """Tempo de CPU da thread principal da página entre as duas últimas amostras"""
+        if len(self.samples) < 2:
+            return None
+        (t0, _, busy0), (t1, _, busy1) = self.samples[-2], self.samples[-1]
+        if t1 <= t0:
+            return None
+        return max(0.0, (busy1 - busy0) / (t1 - t0) * 100)
+
+    @property
+    def memory_trend(self) -> Optional[float]:
+        """Crescimento de memória em MB/min (regressão linear sobre as amostras)"""
+        if len(self.samples) < 3:
+            return None
+        times = [s[0] for s in self.samples]
+        values = [s[1] for s in self.samples]
+        mean_t = sum(times) / len(times)
+        mean_v = sum(values) / len(values)
+        var_t = sum((t - mean_t) ** 2 for t in times)
+        if var_t == 0:
+            return None
+        slope = sum((t - mean_t) * (v - mean_v) for t, v in zip(times, values)) / var_t
+        return slope * 60
+
+    def to_dict(self) -> Dict[str, Any]:
+        memory, cpu, trend = self.memory_mb, self.cpu_percent, self.memory_trend
+        return {
+            'memory_mb': round(memory, 1) if memory is not None else None,
+            'cpu_percent': round(cpu, 1) if cpu is not None else None,
+            'memory_trend_mb_min': round(trend, 2) if trend is not None else None,
+            'dom_nodes': self.nodes,
+        }
+
+
+@dataclass
+class TabBudget:
+    """Limites de consumo de uma guia antes da reciclagem"""
+    memory_mb: float = 150.0
+    cpu_percent: float = 60.0
+    growth_mb_per_min: float = 20.0
+
+    def check(self, usage: TabUsage) -> Optional[str]:
+        """
+        Verifica se a guia está acima do orçamento
+
+        Args:
+            usage: Consumo da guia
+
+        Returns:
+            Motivo da violação ou None
+        """
+        memory, cpu, trend = usage.memory_mb, usage.cpu_percent, usage.memory_trend
+        if memory is not None and self.memory_mb and memory > self.memory_mb:
+            return f"memória {memory:.0f}MB acima de {self.memory_mb:.0f}MB"
+        if cpu is not None and self.cpu_percent and cpu > self.cpu_percent:
+            return f"CPU {cpu:.0f}% acima de {self.cpu_percent:.0f}%"
+        if trend is not None and self.growth_mb_per_min and trend > self.growth_mb_per_min:
+            return f"memória crescendo {trend:.1f}MB/min"
+        return None
@@ -1,19 +1,19 @@
 import asyncio
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 
 from .browser_manager import BrowserManager
 from .scheduler import BotScheduler, BotStatus
+from .tab_metrics import TabBudget
 from ..notifications import send_telegram_message
 from ..discord_integration import send_discord_notification
-from ..system_monitor.monitor import system_monitor
 
 logger = logging.getLogger(__name__)
 
 
 class TabWatchdog:
-    """Monitora abas inativas e reinicia automaticamente."""
+    """Monitora abas inativas ou acima do orçamento de recursos e as recupera automaticamente."""
 
     def __init__(self,
                  browser_manager: BrowserManager,
@@ -22,7 +22,11 @@ class TabWatchdog:
                  enabled: bool = True,
                  telegram_token: str = "",
                  telegram_chat_id: str = "",
-                 discord_notifications: bool = False):
+                 discord_notifications: bool = False,
+                 memory_budget_mb: float = 150.0,
+                 cpu_budget_percent: float = 80.0,
+                 memory_growth_mb_min: float = 20.0,
+                 budget_strikes: int = 3):
         self.browser_manager = browser_manager
         self.bot_scheduler = bot_scheduler
         self.timeout_seconds = timeout_seconds
@@ -30,6 +34,13 @@ class TabWatchdog:
         self.telegram_token = telegram_token
         self.telegram_chat_id = telegram_chat_id
         self.discord_notifications = discord_notifications
+        self.budget = TabBudget(
+            memory_mb=memory_budget_mb,
+            cpu_percent=cpu_budget_percent,
+            growth_mb_per_min=memory_growth_mb_min,
+        )
+        self.budget_strikes = budget_strikes
+        self._strikes: Dict[int, int] = {}  # verificações seguidas acima do orçamento
         self._task: Optional[asyncio.Task] = None
         self._running = False
 
@@ -38,7 +49,11 @@ class TabWatchdog:
                       enabled: Optional[bool] = None,
                       telegram_token: Optional[str] = None,
                       telegram_chat_id: Optional[str] = None,
-                      discord_notifications: Optional[bool] = None):
+                      discord_notifications: Optional[bool] = None,
+                      memory_budget_mb: Optional[float] = None,
+                      cpu_budget_percent: Optional[float] = None,
+                      memory_growth_mb_min: Optional[float] = None,
+                      budget_strikes: Optional[int] = None):
         if timeout_seconds is not None:
             self.timeout_seconds = timeout_seconds
         if enabled is not None:
@@ -49,6 +64,14 @@ class TabWatchdog:
             self.telegram_chat_id = telegram_chat_id
         if discord_notifications is not None:
             self.discord_notifications = discord_notifications
+        if memory_budget_mb is not None:
+            self.budget.memory_mb = memory_budget_mb
+        if cpu_budget_percent is not None:
+            self.budget.cpu_percent = cpu_budget_percent
+        if memory_growth_mb_min is not None:
+            self.budget.growth_mb_per_min = memory_growth_mb_min
+        if budget_strikes is not None:
+            self.budget_strikes = budget_strikes
 
     def start(self):
         if not self._running:
@@ -81,26 +104,63 @@ class TabWatchdog:
     async def _check_tabs(self):
         now = datetime.now()
 
-        chrome_processes = system_monitor.get_chrome_processes()
-        for proc in chrome_processes:
-            if proc.get("memory_mb", 0) > 180:
-                for tab_id in list(self.browser_manager.tabs.keys()):
-                    await self.browser_manager.restart_tab(tab_id)
-                break
+        recycled = await self._check_budgets()
 
         for tab_id, info in list(self.browser_manager.tabs.items()):
+            if tab_id in recycled:
+                continue
             inactivity = (now - info.last_activity).total_seconds()
             if inactivity > self.timeout_seconds and info.status != "closed":
                 await self._restart_tab(tab_id, inactivity)
 
+    async def _check_budgets(self) -> set:
+        """
+        Mede cada guia via CDP e recicla apenas as que estouram o orçamento
+
+        Returns:
+            IDs das guias recicladas
+        """
+        usages = await self.browser_manager.sample_all_tabs()
+        for tab_id in list(self._strikes):
+            if tab_id not in usages:
+                del self._strikes[tab_id]
+
+        recycled = set()
+        for tab_id, usage in usages.items():
+            reason = self.budget.check(usage)
+            if reason is None:
+                self._strikes.pop(tab_id, None)
+                continue
+
+            strikes = self._strikes.get(tab_id, 0) + 1
+            self._strikes[tab_id] = strikes
+            info = self.browser_manager.tabs.get(tab_id)
+            # Não interromper uma participação em andamento; tenta na próxima verificação
+            if strikes < self.budget_strikes or (info and info.status == "participating"):
+                continue
+
+            self._strikes.pop(tab_id, None)
+            recycled.add(tab_id)
+            await self._recover_tab(tab_id, f"Guia {tab_id} reciclada: {reason}")
+        return recycled
+
     async def _restart_tab(self, tab_id: int, inactivity: float):
-        msg = f"Guia {tab_id} reiniciada após {int(inactivity)}s de inatividade"
-        logger.warning(f"{msg} - reinício forçado pelo watchdog")
+        # Inatividade sozinha não prova que a guia travou: a sonda decide
+        action = await self.browser_manager.triage_tab(tab_id)
+        if action != 'recover':
+            logger.info(f"Guia {tab_id} inativa há {int(inactivity)}s mas responde ({action})")
+            return
+        await self._recover_tab(
+            tab_id, f"Guia {tab_id} recuperada após {int(inactivity)}s de inatividade"
+        )
+
+    async def _recover_tab(self, tab_id: int, msg: str):
+        logger.warning(f"{msg} - recuperação forçada pelo watchdog")
         restarted = False
         if self.bot_scheduler and self.bot_scheduler.status != BotStatus.STOPPED:
-            restarted = await self.bot_scheduler.restart_tab(tab_id)
+            restarted = await self.bot_scheduler.recover_tab(tab_id)
         else:
-            restarted = await self.browser_manager.restart_tab(tab_id)
+            restarted = await self.browser_manager.recover_tab(tab_id) is not None
         if restarted:
             if self.discord_notifications:
                 await send_discord_notification("🚨 Aba Reiniciada", msg, "warning")
@@ -0,0 +1,147 @@
+"""
+Localização do botão de participação por imagem
+Template em cache (tons de cinza), screenshot decodificado em memória e busca em duas escalas
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .metrics import LatencyHistogram
+
+
+class TemplateMatcher:
+    """
+    Procura um template em screenshots PNG
+
+    A busca começa pela região do último acerto da mesma guia; se não
+    encontrar, compara as imagens reduzidas por ``scale`` e refina em
+    resolução total só ao redor do melhor candidato. ``match`` é
+    bloqueante e deve rodar em thread (asyncio.to_thread).
+
+    OpenCV e NumPy são opcionais e importados somente no primeiro uso.
+    """
+
+    def __init__(self, template_path: Path, threshold: float = 0.8,
+                 scale: float = 0.5, margin: int = 8):
+        """
+        Inicializa o localizador
+
+        Args:
+            template_path: Imagem do botão
+            threshold: Correlação mínima para considerar encontrado
+            scale: Fator de redução da busca grossa
+            margin: Folga ao redor do candidato no refinamento (pixels)
+        """
+        self.template_path = Path(template_path)
+        self.threshold = threshold
+        self.scale = scale
+        self.margin = margin
+        self._template = None
+        self._lock = threading.Lock()
+        self._last_hit: Dict[Any, Tuple[int, int]] = {}
+        self.latency = LatencyHistogram()
+        self.calls = 0
+        self.hits = 0
+        self.region_hits = 0
+
+    def template(self):
+        """Template em resolução total e reduzida, carregado uma única vez"""
+        with self._lock:
+            if self._template is None:
+                import cv2
+
+                full = cv2.imread(str(self.template_path), cv2.IMREAD_GRAYSCALE)
+                if full is None:
+                    raise FileNotFoundError(str(self.template_path))
+                small = cv2.resize(full, None, fx=self.scale, fy=self.scale,
+                                   interpolation=cv2.INTER_AREA)
+                self._template = (full, small)
+            return self._template
+
+    def match(self, screenshot: bytes, key: Any = None) -> Optional[Tuple[float, float, float]]:
+        """
+        Procura o template em um screenshot
+
+        Args:
+            screenshot: PNG retornado por page.screenshot()
+            key: Identificador da guia, para reaproveitar a região do último acerto
+
+        Returns:
+            Centro (x, y) do template e correlação, ou None se não encontrado
+        """
+        import cv2
+        import numpy as np
+
+        started = time.perf_counter()
+        try:
+            full, small = self.template()
+            image = cv2.imdecode(np.frombuffer(screenshot, np.uint8), cv2.IMREAD_GRAYSCALE)
+            if image is None:
+                raise ValueError("screenshot inválido")
+
+            found = None
+            hint = self._last_hit.get(key)
+            if hint is not None:
+                found = self._refine(image, full, hint, self.margin)
+                if found and found[2] >= self.threshold:
+                    self.region_hits += 1
+                else:
+                    found = None
+            if found is None:
+                found = self._coarse_to_fine(image, full, small)
+
+            self.calls += 1
+            if found is None or found[2] < self.threshold:
+                return None
+            x, y, score = found
+            self._last_hit[key] = (x, y)
+            self.hits += 1
+            height, width = full.shape
+            return x + width / 2, y + height / 2, score
+        finally:
+            self.latency.record(time.perf_counter() - started)
+
+    def _coarse_to_fine(self, image, full, small) -> Optional[Tuple[int, int, float]]:
+        import cv2
+
+        height, width = image.shape
+        if min(small.shape) < 8 or self.scale >= 1:
+            # Template pequeno demais para reduzir: busca direta
+            return self._refine(image, full, (0, 0), max(height, width))
+
+        reduced = cv2.resize(image, None, fx=self.scale, fy=self.scale, interpolation=cv2.INTER_AREA)
+        if reduced.shape[0] < small.shape[0] or reduced.shape[1] < small.shape[1]:
+            return None
+        result = cv2.matchTemplate(reduced, small, cv2.TM_CCOEFF_NORMED)
+        _, _, _, (x, y) = cv2.minMaxLoc(result)
+        # A posição reduzida tem erro de até 1/scale pixels em cada eixo
+        margin = self.margin + int(round(1 / self.scale))
+        return self._refine(image, full, (int(x / self.scale), int(y / self.scale)), margin)
+
+    @staticmethod
+    def _refine(image, template, origin: Tuple[int, int], margin: int) -> Optional[Tuple[int, int, float]]:
+        """Busca em resolução total numa janela ao redor de ``origin``"""
+        import cv2
+
+        height, width = image.shape
+        t_height, t_width = template.shape
+        x0, y0 = max(0, origin[0] - margin), max(0, origin[1] - margin)
+        x1 = min(width, origin[0] + t_width + margin)
+        y1 = min(height, origin[1] + t_height + margin)
+        if x1 - x0 < t_width or y1 - y0 < t_height:
+            return None
+        result = cv2.matchTemplate(image[y0:y1, x0:x1], template, cv2.TM_CCOEFF_NORMED)
+        _, score, _, (x, y) = cv2.minMaxLoc(result)
+        return x0 + x, y0 + y, float(score)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Chamadas, acertos e tempo de CPU de cada busca"""
+        return {
+            'template_loaded': self._template is not None,
+            'calls': self.calls,
+            'hits': self.hits,
+            'region_hits': self.region_hits,
+            'latency': self.latency.to_dict(),
+        }
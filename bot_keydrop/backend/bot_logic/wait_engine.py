@@ -0,0 +1,157 @@
+"""
+Esperas orientadas por condição
+Substitui pausas fixas por condições da página, com piso de ritmo por guia e registro do tempo economizado
+"""
+
+import asyncio
+import secrets
+from typing import Any, Awaitable, Dict, Iterable
+
+from .metrics import LatencyHistogram
+
+
+class WaitStats:
+    """Tempo real de uma espera comparado à pausa fixa que ela substituiu"""
+
+    __slots__ = ('actual', 'actual_total', 'fixed_total', 'met', 'timeouts')
+
+    def __init__(self):
+        self.actual = LatencyHistogram()
+        self.actual_total = 0.0
+        self.fixed_total = 0.0
+        self.met = 0
+        self.timeouts = 0
+
+    def record(self, elapsed: float, fixed: float, met: bool):
+        self.actual.record(elapsed)
+        self.actual_total += elapsed
+        self.fixed_total += fixed
+        if met:
+            self.met += 1
+        else:
+            self.timeouts += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.actual.count,
+            'met': self.met,
+            'timeouts': self.timeouts,
+            'actual': self.actual.to_dict(),
+            'actual_seconds': round(self.actual_total, 3),
+            'fixed_seconds': round(self.fixed_total, 3),
+            'saved_seconds': round(self.fixed_total - self.actual_total, 3),
+        }
+
+
+class WaitEngine:
+    """
+    Aguarda condições concretas em vez de tempos fixos
+
+    ``until`` termina assim que a primeira condição é satisfeita, ou no prazo
+    (o maior valor da pausa antiga), e nunca demora mais que ela. ``pace``
+    mantém um intervalo mínimo entre ações de uma mesma guia no site, para
+    que esperas mais curtas não aumentem a taxa de requisições; ``hold``
+    estende esse intervalo após ações que antes eram seguidas de uma pausa
+    fixa maior que o piso.
+    """
+
+    def __init__(self, pacing_floor: float = 1.0, pacing_jitter: float = 0.5):
+        """
+        Inicializa o motor de esperas
+
+        Args:
+            pacing_floor: Intervalo mínimo entre ações de uma guia (segundos)
+            pacing_jitter: Variação aleatória somada ao piso (segundos)
+        """
+        self.pacing_floor = pacing_floor
+        self.pacing_jitter = pacing_jitter
+        self.stats: Dict[str, WaitStats] = {}
+        self.paced_seconds = 0.0
+        # Momento a partir do qual cada guia pode agir de novo (relógio do loop)
+        self._ready_at: Dict[Any, float] = {}
+
+    async def until(self, name: str, conditions: Iterable[Awaitable], timeout: float,
+                    fixed: float) -> bool:
+        """
+        Aguarda a primeira condição satisfeita
+
+        Condições que falham (ex.: timeout do Playwright) são ignoradas; as
+        demais continuam valendo até o prazo.
+
+        Args:
+            name: Nome da espera nas estatísticas
+            conditions: Awaitables que terminam quando a condição ocorre
+            timeout: Prazo máximo (segundos)
+            fixed: Pausa fixa que esta espera substitui (segundos)
+
+        Returns:
+            True se alguma condição foi satisfeita dentro do prazo
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + timeout
+        tasks = [asyncio.ensure_future(condition) for condition in conditions]
+        pending = set(tasks)
+        met = False
+        try:
+            while pending and not met:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                met = any(not task.cancelled() and task.exception() is None for task in done)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        self.stats.setdefault(name, WaitStats()).record(loop.time() - started, fixed, met)
+        return met
+
+    async def pace(self, key: Any) -> float:
+        """
+        Garante o piso de ritmo desde a última ação da mesma guia
+
+        Args:
+            key: Identificador da guia
+
+        Returns:
+            Tempo aguardado (segundos)
+        """
+        loop = asyncio.get_running_loop()
+        delay = max(0.0, self._ready_at.get(key, 0.0) - loop.time())
+        if delay:
+            await asyncio.sleep(delay)
+        gap = 0.0
+        if self.pacing_floor > 0:
+            gap = self.pacing_floor + secrets.SystemRandom().uniform(0, self.pacing_jitter)
+        self._ready_at[key] = loop.time() + gap
+        self.paced_seconds += delay
+        return delay
+
+    def hold(self, key: Any, seconds: float):
+        """
+        Impede nova ação da guia por ``seconds`` a partir de agora
+
+        Chamado logo após a ação, reproduz o limite inferior da pausa fixa
+        que vinha depois dela (ex.: 4s após o clique de participação).
+
+        Args:
+            key: Identificador da guia
+            seconds: Intervalo mínimo até a próxima ação (segundos)
+        """
+        loop = asyncio.get_running_loop()
+        self._ready_at[key] = max(self._ready_at.get(key, 0.0), loop.time() + seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Tempo real vs. pausa fixa de cada espera e tempo gasto no piso de ritmo"""
+        waits = {name: stats.to_dict() for name, stats in sorted(self.stats.items())}
+        return {
+            'pacing_floor': self.pacing_floor,
+            'paced_seconds': round(self.paced_seconds, 3),
+            'saved_seconds': round(sum(w['saved_seconds'] for w in waits.values()), 3),
+            'waits': waits,
+        }
@@ -75,6 +75,30 @@ class BotConfig(BaseModel):
         le=3600,
         description="Tempo de inatividade antes do reinício da aba (segundos)",
     )
+    tab_memory_budget_mb: int = Field(
+        default=150,
+        ge=0,
+        le=4096,
+        description="Heap JS máximo por aba antes da reciclagem (MB, 0 desativa)",
+    )
+    tab_cpu_budget_percent: int = Field(
+        default=80,
+        ge=0,
+        le=400,
+        description="CPU máxima por aba antes da reciclagem (%, 0 desativa)",
+    )
+    tab_memory_growth_mb_min: float = Field(
+        default=20.0,
+        ge=0,
+        le=1024,
+        description="Crescimento de memória por aba que indica vazamento (MB/min, 0 desativa)",
+    )
+    tab_budget_strikes: int = Field(
+        default=3,
+        ge=1,
+        le=20,
+        description="Verificações seguidas acima do orçamento antes de reciclar a aba",
+    )
 
     # URLs de destino
     keydrop_url: str = Field(
@@ -111,6 +135,51 @@ class BotConfig(BaseModel):
         le=120,
         description="Timeout para carregamento de páginas (segundos)",
     )
+    recovery_reload_timeout: int = Field(
+        default=15,
+        ge=5,
+        le=120,
+        description="Timeout para recuperar uma guia recarregando a página (segundos)",
+    )
+    probe_timeout: float = Field(
+        default=2.0,
+        ge=0.2,
+        le=30.0,
+        description="Prazo da sonda de vivacidade das guias (segundos)",
+    )
+    wait_pacing_floor: float = Field(
+        default=1.0,
+        ge=0.5,
+        le=30.0,
+        description="Intervalo mínimo entre ações de uma guia no site, mesmo com a página pronta (segundos); "
+                    "após navegação e clique de participação valem as pausas antigas, se maiores",
+    )
+    listing_max_age: int = Field(
+        default=30,
+        ge=0,
+        le=600,
+        description="Idade máxima da listagem de sorteios antes de recarregá-la (segundos)",
+    )
+    participation_history_size: int = Field(
+        default=100_000,
+        ge=1_000,
+        le=1_000_000,
+        description="Número máximo de tentativas de participação mantidas em memória",
+    )
+    recovery_page_timeout: int = Field(
+        default=20,
+        ge=5,
+        le=120,
+        description="Timeout para recuperar uma guia com nova página no mesmo contexto (segundos)",
+    )
+    blocked_resource_types: List[str] = Field(
+        default_factory=lambda: ["image", "font", "media"],
+        description="Tipos de recurso bloqueados nas guias (image, font, media, stylesheet)",
+    )
+    blocked_url_patterns: List[str] = Field(
+        default_factory=list,
+        description="Padrões de URL bloqueados nas guias ('*' casa qualquer trecho)",
+    )
     proxy_pool: List[str] = Field(
         default_factory=list,
         description="Lista de proxies disponíveis para rotacao",
@@ -136,6 +205,95 @@ class BotConfig(BaseModel):
         description="Aguardar (segundos) antes de reagendar após falhas",
     )
 
+    # Agendador
+    scheduler_mode: str = Field(
+        default="batch",
+        pattern="^(batch|per_tab)$",
+        description="Modo de despacho: 'batch' (lotes) ou 'per_tab' (um worker por guia)",
+    )
+    max_concurrent_tasks: int = Field(
+        default=10,
+        ge=1,
+        le=100,
+        description="Máximo de tarefas de guia executando ao mesmo tempo",
+    )
+    adaptive_concurrency: bool = Field(
+        default=True,
+        description="Ajustar a concorrência conforme CPU, memória e latência das tarefas",
+    )
+    concurrency_interval: float = Field(
+        default=5.0,
+        ge=1.0,
+        le=60.0,
+        description="Intervalo entre ajustes do controle de concorrência (segundos)",
+    )
+    concurrency_cpu_target: float = Field(
+        default=80.0,
+        ge=10.0,
+        le=100.0,
+        description="Uso de CPU (%) acima do qual a concorrência é reduzida",
+    )
+    concurrency_memory_target: float = Field(
+        default=85.0,
+        ge=10.0,
+        le=100.0,
+        description="Uso de memória (%) acima do qual a concorrência é reduzida",
+    )
+
+    fixed_rate_scheduling: bool = Field(
+        default=False,
+        description="Executar cada guia em horários fixos (fase + k*intervalo) em vez de contar o intervalo após cada execução",
+    )
+    catchup_threshold: float = Field(
+        default=60.0,
+        ge=0.0,
+        le=3600.0,
+        description="Atraso (segundos) acima do qual tarefas atrasadas são espaçadas em vez de disparadas juntas (0 desativa)",
+    )
+
+    # Checkpoint do agendador
+    checkpoint_enabled: bool = Field(
+        default=True, description="Gravar checkpoint das tarefas para retomada após reinício"
+    )
+    checkpoint_interval: int = Field(
+        default=30,
+        ge=5,
+        le=600,
+        description="Intervalo entre gravações do checkpoint (segundos)",
+    )
+    checkpoint_max_age: int = Field(
+        default=3600,
+        ge=60,
+        le=86400,
+        description="Idade máxima de um checkpoint para ser retomado (segundos)",
+    )
+
+    # Inicialização das guias
+    startup_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=50,
+        description="Guias criadas em paralelo durante a inicialização",
+    )
+    startup_pacing: float = Field(
+        default=0.5,
+        ge=0.0,
+        le=30.0,
+        description="Intervalo entre o lançamento de guias na inicialização (segundos)",
+    )
+    startup_cpu_limit: float = Field(
+        default=85.0,
+        ge=10.0,
+        le=100.0,
+        description="Uso de CPU (%) acima do qual a criação de guias aguarda",
+    )
+    startup_memory_limit: float = Field(
+        default=85.0,
+        ge=10.0,
+        le=100.0,
+        description="Uso de memória (%) acima do qual a criação de guias aguarda",
+    )
+
     # Múltiplas contas
     accounts: List[str] = Field(
         default_factory=list,
@@ -143,6 +301,47 @@ class BotConfig(BaseModel):
     )
     
 
+    shutdown_timeout: int = Field(
+        default=5,
+        ge=1,
+        le=60,
+        description="Prazo para fechar guias e navegadores antes de finalizá-los à força (segundos)",
+    )
+
+    # Perfis das guias
+    profile_disk_budget_mb: int = Field(
+        default=1024,
+        ge=0,
+        le=102400,
+        description="Espaço máximo em disco dos perfis das guias (MB, 0 = sem limite)",
+    )
+
+    # Pré-aquecimento do navegador
+    prewarm_browser: bool = Field(
+        default=False,
+        description="Iniciar driver e navegador em segundo plano ao abrir a API",
+    )
+    keep_driver_warm: bool = Field(
+        default=True,
+        description="Manter o driver do Playwright rodando entre parar e iniciar o bot",
+    )
+
+    # Shards de navegador
+    browser_shards: int = Field(
+        default=1,
+        ge=0,
+        le=8,
+        description="Processos de navegador entre os quais as guias são distribuídas (0 = automático)",
+    )
+
+    # Pool de contextos do navegador
+    context_pool_size: int = Field(
+        default=2,
+        ge=0,
+        le=20,
+        description="Contextos do navegador pré-aquecidos para reinícios e novas guias (0 desativa)",
+    )
+
     # Configurações de sistema
     max_memory_usage_mb: int = Field(
         default=2048, ge=512, le=8192, description="Uso máximo de memória (MB)"
@@ -143,6 +143,28 @@ class ConfigUpdateRequest(BaseModel):
     authorized_chat_ids: Optional[List[int]] = None
     watchdog_enabled: Optional[bool] = None
     watchdog_timeout: Optional[int] = None
+    tab_memory_budget_mb: Optional[int] = None
+    tab_cpu_budget_percent: Optional[int] = None
+    tab_memory_growth_mb_min: Optional[float] = None
+    tab_budget_strikes: Optional[int] = None
+    scheduler_mode: Optional[str] = None
+    max_concurrent_tasks: Optional[int] = None
+    adaptive_concurrency: Optional[bool] = None
+    max_memory_usage_mb: Optional[int] = None
+    context_pool_size: Optional[int] = None
+    wait_pacing_floor: Optional[float] = None
+    listing_max_age: Optional[int] = None
+    participation_history_size: Optional[int] = None
+    browser_shards: Optional[int] = None
+    prewarm_browser: Optional[bool] = None
+    keep_driver_warm: Optional[bool] = None
+    profile_disk_budget_mb: Optional[int] = None
+    blocked_resource_types: Optional[List[str]] = None
+    blocked_url_patterns: Optional[List[str]] = None
+    startup_concurrency: Optional[int] = None
+    startup_pacing: Optional[float] = None
+    startup_cpu_limit: Optional[float] = None
+    startup_memory_limit: Optional[float] = None
 
 
 class BotControlRequest(BaseModel):
@@ -193,6 +215,16 @@ async def startup_event():
     proxy_manager = ProxyManager(config.proxy_pool, timeout=config.proxy_timeout)
     browser_manager.proxy_manager = proxy_manager
     browser_manager.page_load_timeout = config.page_load_timeout * 1000
+    browser_manager.context_pool_size = config.context_pool_size
+    browser_manager.browser_shards = config.browser_shards
+    browser_manager.shutdown_timeout = config.shutdown_timeout
+    browser_manager.profile_disk_budget_mb = config.profile_disk_budget_mb
+    browser_manager.num_tabs = config.num_tabs
+    browser_manager.recovery_reload_timeout = config.recovery_reload_timeout
+    browser_manager.recovery_page_timeout = config.recovery_page_timeout
+    browser_manager.probe_timeout = config.probe_timeout
+    browser_manager.keep_driver = config.keep_driver_warm
+    browser_manager.set_resource_policy(config.blocked_resource_types, config.blocked_url_patterns)
 
     # Carregar permissoes do usuario se houver sessao
     session_file = Path("user_session.json")
@@ -216,6 +248,9 @@ async def startup_event():
 
     # Criar instâncias do bot
     automation_engine = create_keydrop_automation(browser_manager)
+    automation_engine.waits.pacing_floor = config.wait_pacing_floor
+    automation_engine.freshness.max_age = config.listing_max_age
+    automation_engine.participation_history.resize(config.participation_history_size)
     bot_scheduler = create_bot_scheduler(
         browser_manager, automation_engine, config_manager, proxy_manager
     )
@@ -229,6 +264,10 @@ async def startup_event():
         telegram_token=config.telegram_bot_token,
         telegram_chat_id=config.telegram_chat_id,
         discord_notifications=config.discord_notifications,
+        memory_budget_mb=config.tab_memory_budget_mb,
+        cpu_budget_percent=config.tab_cpu_budget_percent,
+        memory_growth_mb_min=config.tab_memory_growth_mb_min,
+        budget_strikes=config.tab_budget_strikes,
     )
     tab_watchdog.start()
 
@@ -251,6 +290,7 @@ async def startup_event():
     # Configurar callbacks
     bot_scheduler.add_status_callback(on_bot_status_change)
     bot_scheduler.add_task_callback(on_task_completion)
+    bot_scheduler.add_progress_callback(on_startup_progress)
 
     # Configurar Discord webhook
     if config.discord_webhook_url:
@@ -259,6 +299,10 @@ async def startup_event():
     # Iniciar monitoramento de sistema
     asyncio.create_task(start_monitoring_loop())
 
+    # Pré-aquecer driver e navegador para o primeiro start
+    if config.prewarm_browser:
+        browser_manager.start_prewarm(config.mini_window_mode)
+
     logger.info("API iniciada com sucesso")
 
 
@@ -269,7 +313,13 @@ async def shutdown_event():
 
     # Parar bot se estiver rodando
     if bot_scheduler and bot_scheduler.status != BotStatus.STOPPED:
-        await bot_scheduler.stop_bot()
+        # Mantém o checkpoint para retomar as guias quando o backend voltar
+        await bot_scheduler.stop_bot(keep_checkpoint=True)
+
+    # Entregar eventos pendentes aos WebSockets e encerrar consumidores
+    if bot_scheduler:
+        await bot_scheduler.events.drain(timeout=2)
+        await bot_scheduler.events.close()
 
     if tab_watchdog:
         await tab_watchdog.stop()
@@ -277,6 +327,9 @@ async def shutdown_event():
     if telegram_bot:
         await telegram_bot.stop()
 
+    # Encerrar driver e navegadores mantidos entre ciclos
+    await browser_manager.release_driver()
+
     # Parar monitoramento
     stop_system_monitoring()
 
@@ -303,6 +356,11 @@ async def on_task_completion(task: Any):
     await manager.broadcast({"type": "task_completed", "data": task.to_dict()})
 
 
+async def on_startup_progress(progress: Dict[str, Any]):
+    """Callback para o progresso de criação das guias"""
+    await manager.broadcast({"type": "startup_progress", "data": progress})
+
+
 # Loop de monitoramento
 async def start_monitoring_loop():
     """Inicia loop de monitoramento de sistema"""
@@ -339,6 +397,7 @@ def health_check():
             bot_scheduler.status.value if bot_scheduler else "not_initialized"
         ),
         "browser_running": browser_manager.is_running,
+        "browser_warm": browser_manager.get_warm_status(),
         "active_tabs": browser_manager.get_tab_count(),
     }
 
@@ -374,6 +433,41 @@ async def update_configuration(request: ConfigUpdateRequest):
                     telegram_token=updates.get("telegram_bot_token"),
                     telegram_chat_id=updates.get("telegram_chat_id"),
                     discord_notifications=updates.get("discord_notifications"),
+                    memory_budget_mb=updates.get("tab_memory_budget_mb"),
+                    cpu_budget_percent=updates.get("tab_cpu_budget_percent"),
+                    memory_growth_mb_min=updates.get("tab_memory_growth_mb_min"),
+                    budget_strikes=updates.get("tab_budget_strikes"),
+                )
+
+            if "browser_shards" in updates:
+                # Vale a partir do próximo início do navegador
+                browser_manager.browser_shards = updates["browser_shards"]
+
+            if "keep_driver_warm" in updates:
+                browser_manager.keep_driver = updates["keep_driver_warm"]
+
+            if "profile_disk_budget_mb" in updates:
+                browser_manager.profile_disk_budget_mb = updates["profile_disk_budget_mb"]
+
+            if "num_tabs" in updates:
+                browser_manager.num_tabs = updates["num_tabs"]
+
+            if "context_pool_size" in updates:
+                browser_manager.set_context_pool_size(updates["context_pool_size"])
+
+            if "wait_pacing_floor" in updates and automation_engine:
+                automation_engine.waits.pacing_floor = updates["wait_pacing_floor"]
+
+            if "listing_max_age" in updates and automation_engine:
+                automation_engine.freshness.max_age = updates["listing_max_age"]
+
+            if "participation_history_size" in updates and automation_engine:
+                automation_engine.participation_history.resize(updates["participation_history_size"])
+
+            if "blocked_resource_types" in updates or "blocked_url_patterns" in updates:
+                config = get_config()
+                browser_manager.set_resource_policy(
+                    config.blocked_resource_types, config.blocked_url_patterns
                 )
 
             # Atualizar configuração do agendador se estiver rodando
@@ -575,12 +669,66 @@ def get_bot_tasks():
     return bot_scheduler.get_tasks_status()
 
 
+@app.get("/bot/latency")
+def get_bot_latency():
+    """Obtém histogramas de latência do agendador por guia e por resultado"""
+    if not bot_scheduler:
+        return {}
+
+    return bot_scheduler.get_latency_metrics()
+
+
+@app.get("/bot/concurrency")
+def get_bot_concurrency():
+    """Obtém limite adaptativo de concorrência e decisões do controlador"""
+    if not bot_scheduler:
+        return {}
+
+    return bot_scheduler.get_concurrency_status()
+
+
 @app.get("/bot/tabs")
 def get_bot_tabs():
     """Obtém status das guias do bot"""
     return browser_manager.get_all_tabs_info()
 
 
+@app.get("/bot/tabs/pool")
+def get_context_pool():
+    """Obtém uso do pool de contextos e latência de reinício das guias"""
+    return browser_manager.get_pool_stats()
+
+
+@app.get("/bot/browser/shards")
+def get_browser_shards():
+    """Obtém a distribuição das guias entre os processos de navegador"""
+    return browser_manager.get_shard_stats()
+
+
+@app.get("/bot/profiles")
+def get_profiles_usage():
+    """Obtém o uso de disco dos perfis das guias"""
+    return browser_manager.get_profile_stats()
+
+
+@app.post("/bot/profiles/collect")
+async def collect_profiles():
+    """Remove perfis órfãos e aplica o orçamento de disco"""
+    return await browser_manager.collect_profiles()
+
+
+@app.get("/bot/tabs/recovery")
+def get_tab_recovery():
+    """Obtém tentativas, sucessos e latência de cada nível de recuperação das guias"""
+    return browser_manager.get_recovery_stats()
+
+
+@app.get("/bot/tabs/resources")
+def get_tab_resources():
+    """Obtém requisições bloqueadas e banda economizada por guia"""
+    return browser_manager.get_resource_stats()
+
+
 # Endpoints de controle de guias
 @app.post("/tabs/control")
 async def control_tab(request: TabControlRequest):
@@ -605,6 +753,8 @@ async def control_tab(request: TabControlRequest):
 
         elif action == "close":
             success = await browser_manager.close_tab(tab_id)
+            if success and automation_engine:
+                automation_engine.forget_tab(tab_id)
             return {
                 "success": success,
                 "message": (
@@ -670,14 +820,41 @@ def get_participation_stats():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/stats/participation/waits")
+def get_participation_waits():
+    """Obtém o tempo real das esperas de participação comparado às pausas fixas"""
+    if not automation_engine:
+        return {"error": "Bot não inicializado"}
+
+    return automation_engine.get_wait_stats()
+
+
+@app.get("/stats/participation/navigation")
+def get_participation_navigation():
+    """Obtém releituras, recargas e navegações da listagem e a economia estimada"""
+    if not automation_engine:
+        return {"error": "Bot não inicializado"}
+
+    return automation_engine.get_navigation_stats()
+
+
+@app.get("/stats/participation/image")
+def get_participation_image_match():
+    """Obtém o tempo da busca do botão por imagem"""
+    if not automation_engine:
+        return {"error": "Bot não inicializado"}
+
+    return automation_engine.get_image_match_stats()
+
+
 @app.get("/stats/participation/history")
-def get_participation_history(limit: Optional[int] = 100):
-    """Obtém histórico de participações"""
+def get_participation_history(limit: Optional[int] = 100, offset: int = 0):
+    """Obtém histórico de participações (offset pula as mais recentes)"""
     if not automation_engine:
         return []
 
     try:
-        return automation_engine.get_participation_history(limit)
+        return automation_engine.get_participation_history(limit, offset)
     except Exception as e:
         logger.error(f"Erro ao obter histórico de participação: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -188,6 +188,43 @@ class SystemMonitor:
                 process_memory_mb=0.0
             )
     
+    def get_resource_pressure(self) -> Dict[str, float]:
+        """
+        Leitura rápida de CPU e memória, sem bloquear o event loop
+
+        Returns:
+            Dicionário com 'cpu_percent' e 'memory_percent'
+        """
+        try:
+            return {
+                'cpu_percent': psutil.cpu_percent(interval=None),
+                'memory_percent': psutil.virtual_memory().percent,
+            }
+        except Exception as e:
+            logger.error(f"Erro ao ler pressão de recursos: {e}")
+            return {'cpu_percent': 0.0, 'memory_percent': 0.0}
+    
+    def get_bot_memory_mb(self) -> float:
+        """
+        Memória residente do processo do bot somada à dos processos filhos
+        (driver do Playwright e navegadores)
+
+        Returns:
+            Memória total em MB
+        """
+        try:
+            process = psutil.Process(os.getpid())
+            total = process.memory_info().rss
+            for child in process.children(recursive=True):
+                try:
+                    total += child.memory_info().rss
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            return total / (1024 * 1024)
+        except Exception as e:
+            logger.error(f"Erro ao ler memória do bot: {e}")
+            return 0.0
+    
     def _add_to_history(self, metrics: SystemMetrics) -> None:
         """
         Adiciona métricas ao histórico
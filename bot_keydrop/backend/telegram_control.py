@@ -185,11 +185,14 @@ class TelegramControl:
             return
         if self.scheduler:
             stats = self.scheduler.statistics.to_dict()
+            last_hour = stats.get('windows', {}).get('1h', {})
             text = (
                 "📊 Relatório Atual\n"
                 f"Tarefas executadas: {stats.get('total_tasks_executed')}\n"
                 f"Sucessos: {stats.get('successful_tasks')}\n"
                 f"Falhas: {stats.get('failed_tasks')}\n"
+                f"Última hora: {last_hour.get('success_rate', 0)}% de sucesso, "
+                f"{last_hour.get('participations_per_hour', 0)} participações/h\n"
                 f"Uptime: {stats.get('uptime')}"
             )
         else:
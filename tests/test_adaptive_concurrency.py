@@ -0,0 +1,107 @@
+import sys
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bot_keydrop.backend.bot_logic.concurrency import AdaptiveLimiter
+from bot_keydrop.backend.bot_logic.scheduler import BotScheduler
+from bot_keydrop.backend.config.config_manager import ConfigManager
+from tests.test_bot_scheduler import DummyAutomation, DummyBrowserManager
+
+
+class TestAdaptiveLimiter(unittest.IsolatedAsyncioTestCase):
+    async def test_limits_concurrent_holders(self):
+        limiter = AdaptiveLimiter(max_limit=2)
+        state = {'now': 0, 'max': 0}
+
+        async def worker():
+            async with limiter:
+                state['now'] += 1
+                state['max'] = max(state['max'], state['now'])
+                await asyncio.sleep(0.01)
+                state['now'] -= 1
+
+        await asyncio.gather(*(worker() for _ in range(6)))
+        self.assertEqual(state['max'], 2)
+        self.assertEqual(limiter.in_flight, 0)
+
+    async def test_additive_increase_when_saturated(self):
+        limiter = AdaptiveLimiter(max_limit=4, initial=2)
+        await limiter.acquire()
+        await limiter.acquire()
+        decision = limiter.adjust(cpu_percent=20.0, memory_percent=30.0)
+        self.assertEqual(decision['action'], 'increase')
+        self.assertEqual(limiter.limit, 3)
+
+    async def test_multiplicative_decrease_on_pressure(self):
+        limiter = AdaptiveLimiter(max_limit=10)
+        decision = limiter.adjust(cpu_percent=95.0, memory_percent=30.0)
+        self.assertEqual(decision['reason'], 'cpu_pressure')
+        self.assertEqual(limiter.limit, 7)
+
+        limiter.adjust(cpu_percent=20.0, memory_percent=30.0, bot_memory_mb=3000, memory_ceiling_mb=2048)
+        self.assertEqual(limiter.limit, 3)
+        self.assertEqual(limiter.decisions[-1]['reason'], 'memory_ceiling')
+
+    async def test_never_increases_near_memory_ceiling(self):
+        limiter = AdaptiveLimiter(max_limit=10, initial=2)
+        await limiter.acquire()
+        await limiter.acquire()
+        decision = limiter.adjust(bot_memory_mb=1900, memory_ceiling_mb=2048)
+        self.assertEqual(decision['action'], 'hold')
+        self.assertEqual(limiter.limit, 2)
+
+    async def test_latency_growth_reduces_limit(self):
+        limiter = AdaptiveLimiter(max_limit=10)
+        for _ in range(5):
+            limiter.observe(1.0)
+        limiter.adjust()
+        for _ in range(5):
+            limiter.observe(5.0)
+        decision = limiter.adjust()
+        self.assertEqual(decision['reason'], 'latency')
+        self.assertLess(limiter.limit, 10)
+
+    async def test_raising_limit_wakes_waiters(self):
+        limiter = AdaptiveLimiter(max_limit=2, initial=1)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+
+        limiter.adjust()  # saturado -> aumenta para 2
+        await asyncio.wait_for(waiter, 0.5)
+        self.assertEqual(limiter.in_flight, 2)
+
+
+class TestSchedulerConcurrencyControl(unittest.IsolatedAsyncioTestCase):
+    async def test_scheduler_applies_memory_ceiling(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        config = ConfigManager(config_dir=tmp.name)
+        config.update_config(max_concurrent_tasks=8, max_memory_usage_mb=1024)
+        scheduler = BotScheduler(DummyBrowserManager(), DummyAutomation(), config)
+
+        class Monitor:
+            def get_resource_pressure(self):
+                return {'cpu_percent': 10.0, 'memory_percent': 10.0}
+
+            def get_bot_memory_mb(self):
+                return 1500.0
+
+        scheduler.resource_monitor = Monitor()
+        decision = await scheduler._adjust_concurrency()
+
+        self.assertEqual(decision['reason'], 'memory_ceiling')
+        status = scheduler.get_concurrency_status()
+        self.assertEqual(status['limit'], 4)
+        self.assertEqual(status['memory_ceiling_mb'], 1024)
+        self.assertEqual(scheduler.get_status()['concurrency']['limit'], 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
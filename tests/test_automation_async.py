@@ -36,6 +36,7 @@ from bot_keydrop.backend.config.config_manager import BotConfig
 async def test_participate_in_lottery_success(mocker):
     browser_manager = mocker.Mock()
     page = mocker.Mock()
+    page.url = 'about:blank'
     page.goto = AsyncMock()
     tab_info = types.SimpleNamespace(
         page=page,
@@ -64,6 +65,7 @@ async def test_participate_in_lottery_success(mocker):
 async def test_participate_in_lottery_button_failure(mocker):
     browser_manager = mocker.Mock()
     page = mocker.Mock()
+    page.url = 'about:blank'
     page.goto = AsyncMock()
     tab_info = types.SimpleNamespace(
         page=page,
@@ -117,6 +119,30 @@ async def test_restart_tab_recreates_tasks(mocker):
     create_tasks.assert_called_once_with(1)
 
 
+@pytest.mark.asyncio
+async def test_recover_tab_uses_recovery_ladder(mocker):
+    browser_manager = mocker.Mock()
+    browser_manager.recover_tab = AsyncMock(return_value='reload')
+
+    config = BotConfig()
+    config_manager = mocker.Mock()
+    config_manager.get_config.return_value = config
+
+    automation_engine = mocker.Mock()
+    scheduler = BotScheduler(browser_manager, automation_engine, config_manager)
+    scheduler.consecutive_failures[1] = 3
+
+    create_tasks = mocker.patch.object(scheduler, '_create_tasks_for_tab', AsyncMock())
+
+    result = await scheduler.recover_tab(1)
+
+    assert result is True
+    browser_manager.recover_tab.assert_called_once_with(1)
+    browser_manager.restart_tab.assert_not_called()
+    create_tasks.assert_called_once_with(1)
+    assert 1 not in scheduler.consecutive_failures
+
+
 @pytest.mark.asyncio
 async def test_learn_participation(mocker):
     browser_manager = mocker.Mock()
@@ -8,7 +8,7 @@ ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
 from bot_keydrop.backend.config.config_manager import ConfigManager
-from bot_keydrop.backend.bot_logic.scheduler import BotScheduler, BotStatus
+from bot_keydrop.backend.bot_logic.scheduler import BotScheduler, BotStatus, ScheduledTask, TaskStatus
 from bot_keydrop.backend.bot_logic.automation_tasks import ParticipationAttempt, ParticipationResult
 
 
@@ -44,6 +44,12 @@ class DummyBrowserManager:
     async def restart_tab(self, tab_id):
         return True
 
+    async def triage_tab(self, tab_id, expected_url=None):
+        return 'recover'
+
+    async def recover_tab(self, tab_id, proxy=None):
+        return 'reload'
+
     async def clear_cache(self, preserve_login=True):
         return True
 
@@ -64,6 +70,12 @@ class DummyBrowserManager:
 
 
 class DummyAutomation:
+    def __init__(self):
+        self.forgotten = []
+
+    def forget_tab(self, tab_id):
+        self.forgotten.append(tab_id)
+
     async def navigate_to_lotteries(self, tab_id):
         return True
 
@@ -107,6 +119,162 @@ class TestBotScheduler(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(self.scheduler.status, BotStatus.STOPPED)
         self.assertFalse(self.browser.is_running)
 
+    async def test_ready_queue_pops_in_deadline_order(self):
+        from datetime import datetime, timedelta
+        now = datetime.now()
+        for tab_id, offset in ((1, 5), (2, -2), (3, -1)):
+            task = ScheduledTask(
+                task_id=f"participate_{tab_id}",
+                tab_id=tab_id,
+                task_type="participate",
+                next_execution=now + timedelta(seconds=offset),
+                interval=timedelta(seconds=60),
+            )
+            self.scheduler.tasks[task.task_id] = task
+            self.scheduler._schedule_task(task)
+
+        # Reagendar a guia 3 para o futuro invalida a entrada antiga
+        rescheduled = self.scheduler.tasks["participate_3"]
+        rescheduled.next_execution = now + timedelta(seconds=10)
+        self.scheduler._schedule_task(rescheduled)
+
+        ready = self.scheduler._pop_ready_tasks(now, limit=10)
+        self.assertEqual([t.tab_id for t in ready], [2])
+        self.assertAlmostEqual(self.scheduler._seconds_until_next_task(now), 5, places=3)
+
+    async def test_main_loop_wakes_when_task_added(self):
+        from datetime import datetime, timedelta
+        self.scheduler.is_running = True
+        loop_task = asyncio.create_task(self.scheduler._main_loop())
+        await asyncio.sleep(0.01)
+
+        task = ScheduledTask(
+            task_id="participate_1",
+            tab_id=1,
+            task_type="participate",
+            next_execution=datetime.now(),
+            interval=timedelta(seconds=60),
+        )
+        self.scheduler.tasks[task.task_id] = task
+        self.scheduler._schedule_task(task)
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(self.scheduler.statistics.successful_tasks, 1)
+        self.assertEqual(task.status, TaskStatus.PENDING)
+        self.assertGreater(task.next_execution, datetime.now() + timedelta(seconds=50))
+
+        self.scheduler.is_running = False
+        self.scheduler._wakeup.set()
+        await asyncio.wait_for(loop_task, 1)
+
+    async def test_per_tab_workers_avoid_head_of_line_blocking(self):
+        from datetime import datetime, timedelta
+        calls = {1: 0, 2: 0}
+
+        async def participate(tab_id, max_retries=1):
+            calls[tab_id] += 1
+            if tab_id == 1:
+                await asyncio.sleep(0.5)  # guia lenta
+            return ParticipationAttempt(
+                tab_id=tab_id,
+                attempt_number=1,
+                timestamp=datetime.now(),
+                result=ParticipationResult.SUCCESS
+            )
+
+        self.automation.participate_in_lottery = participate
+        self.config.update_config(scheduler_mode="per_tab")
+        self.scheduler.update_config()
+        self.scheduler._dispatch_mode = "per_tab"
+        self.scheduler.is_running = True
+
+        for tab_id in (1, 2):
+            task = ScheduledTask(
+                task_id=f"participate_{tab_id}",
+                tab_id=tab_id,
+                task_type="participate",
+                next_execution=datetime.now(),
+                interval=timedelta(seconds=0.02),
+            )
+            self.scheduler.tasks[task.task_id] = task
+            self.scheduler._schedule_task(task)
+
+        loop_task = asyncio.create_task(self.scheduler._main_loop())
+        await asyncio.sleep(0.3)
+
+        self.assertEqual(calls[1], 1)
+        self.assertGreater(calls[2], 3)
+
+        self.scheduler.should_stop = True
+        self.scheduler._wakeup.set()
+        await asyncio.wait_for(loop_task, 1)
+        await self.scheduler._stop_tab_workers()
+        self.assertEqual(self.scheduler._tab_workers, {})
+
+    async def test_parallel_startup_respects_concurrency(self):
+        self.config.update_config(num_tabs=6, startup_concurrency=3, startup_pacing=0.0)
+        self.scheduler.update_config()
+        self.scheduler.resource_monitor = None
+
+        in_flight = {'now': 0, 'max': 0}
+        original_create = self.browser.create_tab
+
+        async def slow_create(tab_id, proxy=None):
+            in_flight['now'] += 1
+            in_flight['max'] = max(in_flight['max'], in_flight['now'])
+            await asyncio.sleep(0.05)
+            in_flight['now'] -= 1
+            return await original_create(tab_id, proxy)
+
+        self.browser.create_tab = slow_create
+        events = []
+
+        async def on_progress(progress):
+            events.append(progress)
+
+        self.scheduler.add_progress_callback(on_progress)
+        await self.scheduler._create_tabs_and_tasks()
+        await self.scheduler.events.drain(timeout=1)
+
+        self.assertEqual(in_flight['max'], 3)
+        self.assertEqual(len(self.scheduler.tasks), 6)
+        self.assertEqual(len(events), 6)
+        self.assertEqual(events[-1]['ready'], 6)
+        self.assertLess(self.scheduler.statistics.time_to_all_tabs_ready, 0.25)
+
+    async def test_startup_waits_for_resource_headroom(self):
+        self.config.update_config(num_tabs=2, startup_concurrency=2, startup_pacing=0.0)
+        self.scheduler.update_config()
+        readings = iter([
+            {'cpu_percent': 10.0, 'memory_percent': 10.0},
+            {'cpu_percent': 99.0, 'memory_percent': 10.0},
+        ])
+
+        class Monitor:
+            def get_resource_pressure(self):
+                return next(readings, {'cpu_percent': 10.0, 'memory_percent': 10.0})
+
+        self.scheduler.resource_monitor = Monitor()
+        original_sleep = asyncio.sleep
+        waits = []
+
+        async def fake_sleep(delay):
+            waits.append(delay)
+            await original_sleep(0)
+
+        from unittest import mock
+        with mock.patch('bot_keydrop.backend.bot_logic.scheduler.asyncio.sleep', fake_sleep):
+            await self.scheduler._create_tabs_and_tasks()
+
+        self.assertEqual(len(self.scheduler.tasks), 2)
+        self.assertIn(1.0, waits)
+
+    async def test_recycled_tab_forgets_page_state(self):
+        self.assertTrue(await self.scheduler.recover_tab(1))
+        self.assertTrue(await self.scheduler.restart_tab(2))
+
+        self.assertEqual(self.automation.forgotten, [1, 2])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,138 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bot_keydrop.backend.bot_logic.browser_manager import BrowserManager
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.closed = False
+
+    def on(self, event, handler):
+        pass
+
+    def is_connected(self):
+        return not self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeChromium:
+    def __init__(self):
+        self.launched = []
+
+    async def launch(self, **options):
+        browser = FakeBrowser()
+        self.launched.append(browser)
+        return browser
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = FakeChromium()
+        self.stopped = False
+
+    async def stop(self):
+        self.stopped = True
+
+
+class FakeDriverFactory:
+    """Substitui async_playwright() contando quantas vezes o driver sobe"""
+
+    def __init__(self):
+        self.started = []
+
+    def __call__(self):
+        return self
+
+    async def start(self):
+        playwright = FakePlaywright()
+        self.started.append(playwright)
+        return playwright
+
+
+class TestBrowserPrewarm(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.manager = BrowserManager()
+        self.manager.user_profiles_dir = Path(self.tmp.name)
+        self.manager.context_pool_size = 0
+        self.driver = FakeDriverFactory()
+        patcher = patch('bot_keydrop.backend.bot_logic.browser_manager.async_playwright', self.driver)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self):
+        await self.manager.stop_browser(keep_driver=False)
+        self.tmp.cleanup()
+
+    async def test_first_start_is_cold(self):
+        self.assertTrue(await self.manager.start_browser())
+
+        self.assertEqual(self.manager.last_startup['mode'], 'cold')
+        self.assertEqual(len(self.driver.started), 1)
+
+    async def test_stop_start_reuses_driver(self):
+        await self.manager.start_browser()
+        self.assertTrue(await self.manager.stop_browser())
+
+        playwright = self.driver.started[0]
+        self.assertFalse(playwright.stopped)
+        self.assertTrue(self.manager.last_shutdown['driver_kept'])
+
+        await self.manager.start_browser()
+        self.assertEqual(len(self.driver.started), 1)
+        self.assertEqual(self.manager.last_startup['mode'], 'driver_warm')
+        self.assertEqual(len(playwright.chromium.launched), 2)
+
+    async def test_prewarmed_browser_is_adopted(self):
+        await self.manager.start_prewarm()
+        status = self.manager.get_warm_status()
+        self.assertTrue(status['driver_ready'])
+        self.assertTrue(status['browser_ready'])
+        warm = self.driver.started[0].chromium.launched[0]
+
+        await self.manager.start_browser()
+
+        self.assertIs(self.manager.browser, warm)
+        self.assertEqual(len(self.driver.started[0].chromium.launched), 1)
+        self.assertEqual(self.manager.last_startup['mode'], 'warm')
+        self.assertEqual(self.manager.startup_latency['warm'].count, 1)
+
+    async def test_prewarm_with_other_options_is_discarded(self):
+        await self.manager.prewarm(mini_window=True)
+        warm = self.driver.started[0].chromium.launched[0]
+
+        await self.manager.start_browser(mini_window=False)
+
+        self.assertTrue(warm.closed)
+        self.assertIsNot(self.manager.browser, warm)
+        self.assertEqual(self.manager.last_startup['mode'], 'driver_warm')
+
+    async def test_release_driver_closes_everything(self):
+        await self.manager.prewarm()
+        playwright = self.driver.started[0]
+
+        await self.manager.release_driver()
+
+        self.assertTrue(playwright.stopped)
+        self.assertTrue(all(b.closed for b in playwright.chromium.launched))
+        self.assertFalse(self.manager.get_warm_status()['driver_ready'])
+
+    async def test_emergency_stop_does_not_keep_driver(self):
+        await self.manager.start_browser()
+        await self.manager.emergency_stop()
+
+        self.assertTrue(self.driver.started[0].stopped)
+        self.assertIsNone(self.manager.playwright)
+
+
+if __name__ == "__main__":
+    unittest.main()
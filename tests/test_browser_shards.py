@@ -0,0 +1,163 @@
+import sys
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bot_keydrop.backend.bot_logic.browser_manager import BrowserManager
+from bot_keydrop.backend.bot_logic.browser_shards import BrowserShard, auto_shard_count, pick_shard
+
+
+class FakePage:
+    def on(self, event, handler):
+        pass
+
+    async def add_init_script(self, script=None):
+        pass
+
+    async def set_extra_http_headers(self, headers):
+        pass
+
+    async def close(self):
+        pass
+
+
+class FakeContext:
+    def set_default_timeout(self, timeout):
+        pass
+
+    async def route(self, pattern, handler):
+        pass
+
+    async def new_page(self):
+        await asyncio.sleep(0.01)
+        return FakePage()
+
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.handlers = {}
+        self.connected = True
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **options):
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+    def crash(self):
+        self.connected = False
+        self.handlers["disconnected"](self)
+
+    async def close(self):
+        self.connected = False
+
+
+class FakeChromium:
+    def __init__(self):
+        self.launched = []
+
+    async def launch(self, **options):
+        browser = FakeBrowser()
+        self.launched.append(browser)
+        return browser
+
+
+class TestShardPlacement(unittest.TestCase):
+    def test_auto_shard_count(self):
+        self.assertEqual(auto_shard_count(cpu_count=1), 1)
+        self.assertEqual(auto_shard_count(cpu_count=8), 4)
+        self.assertEqual(auto_shard_count(cpu_count=64), 4)
+        self.assertEqual(auto_shard_count(num_tabs=2, cpu_count=64), 2)
+
+    def test_pick_least_loaded(self):
+        shards = [BrowserShard(0, object(), {1, 2}), BrowserShard(1, object(), {3})]
+        self.assertEqual(pick_shard(shards).index, 1)
+        shards[1].restarting = True
+        self.assertEqual(pick_shard(shards).index, 0)
+
+
+class TestBrowserManagerShards(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.manager = BrowserManager()
+        self.manager.user_profiles_dir = Path(self.tmp.name)
+        self.manager.context_pool_size = 0
+        self.manager.enable_stealth = False
+        self.manager.playwright = SimpleNamespace(chromium=FakeChromium())
+        self.manager.shards = [BrowserShard(i, FakeBrowser()) for i in range(2)]
+        for shard in self.manager.shards:
+            self.manager._watch_shard(shard)
+        self.manager.browser = self.manager.shards[0].browser
+        self.manager.is_running = True
+
+    async def asyncTearDown(self):
+        self.tmp.cleanup()
+
+    async def test_tabs_are_balanced_across_shards(self):
+        await asyncio.gather(*(self.manager.create_tab(tab_id) for tab_id in range(1, 5)))
+
+        self.assertEqual([shard.load for shard in self.manager.shards], [2, 2])
+        self.assertEqual(len(self.manager.shards[1].browser.contexts), 2)
+        shard_of = {tab_id: info.shard for tab_id, info in self.manager.tabs.items()}
+        self.assertEqual(sorted(shard_of.values()), [0, 0, 1, 1])
+
+        await self.manager.close_tab(1)
+        self.assertEqual(sum(shard.load for shard in self.manager.shards), 3)
+
+    async def test_crash_restarts_only_affected_shard(self):
+        await asyncio.gather(*(self.manager.create_tab(tab_id) for tab_id in range(1, 5)))
+        on_shard_0 = {tab_id: info.context for tab_id, info in self.manager.tabs.items() if info.shard == 0}
+        on_shard_1 = sorted(self.manager.shards[1].tab_ids)
+
+        crashed = self.manager.shards[1].browser
+        crashed.crash()
+        await asyncio.sleep(0.1)
+
+        shard = self.manager.shards[1]
+        self.assertIsNot(shard.browser, crashed)
+        self.assertEqual(shard.crashes, 1)
+        self.assertEqual(sorted(shard.tab_ids), on_shard_1)
+        for tab_id in on_shard_1:
+            self.assertEqual(self.manager.tabs[tab_id].status, 'ready')
+        # Guias do shard saudável mantêm o mesmo contexto
+        for tab_id, context in on_shard_0.items():
+            self.assertIs(self.manager.tabs[tab_id].context, context)
+        self.assertEqual(len(self.manager.playwright.chromium.launched), 1)
+
+    async def test_pooled_contexts_are_spread_and_counted(self):
+        self.manager.set_context_pool_size(4)
+        pool = self.manager.context_pool
+        for _ in range(50):
+            if len(pool.available) == 4:
+                break
+            await asyncio.sleep(0.01)
+
+        self.assertEqual(sorted(pooled.shard for pooled in pool.available), [0, 0, 1, 1])
+        self.assertEqual([shard.reserved for shard in self.manager.shards], [2, 2])
+
+        # Ao virar guia, a reserva passa a ser uma guia do mesmo shard
+        await self.manager.create_tab(1)
+        await asyncio.sleep(0.05)
+        self.assertEqual(sum(s.reserved for s in self.manager.shards), len(pool.available))
+        self.assertEqual(sum(s.load for s in self.manager.shards), len(pool.available) + 1)
+
+        await pool.close()
+        self.assertEqual([s.reserved for s in self.manager.shards], [0, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
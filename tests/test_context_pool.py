@@ -0,0 +1,156 @@
+import sys
+import json
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bot_keydrop.backend.bot_logic.browser_manager import BrowserManager
+from bot_keydrop.backend.bot_logic.context_pool import ContextPool, PooledContext
+
+
+class FakePage:
+    def __init__(self):
+        self.listeners = []
+        self.routes = []
+
+    def on(self, event, handler):
+        self.listeners.append(event)
+
+    async def route(self, pattern, handler):
+        self.routes.append(pattern)
+
+    async def add_init_script(self, script=None):
+        pass
+
+    async def set_extra_http_headers(self, headers):
+        pass
+
+    async def close(self):
+        pass
+
+
+class FakeContext:
+    def __init__(self, options):
+        self.options = options
+        self.cookies = []
+        self.init_scripts = []
+        self.routes = []
+        self.closed = False
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    async def new_page(self):
+        await asyncio.sleep(0.01)  # custo de criação da página
+        return FakePage()
+
+    async def route(self, pattern, handler):
+        self.routes.append(pattern)
+
+    async def add_cookies(self, cookies):
+        self.cookies.extend(cookies)
+
+    async def add_init_script(self, script=None):
+        self.init_scripts.append(script)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    async def new_context(self, **options):
+        context = FakeContext(options)
+        self.contexts.append(context)
+        return context
+
+
+class TestContextPool(unittest.IsolatedAsyncioTestCase):
+    async def test_acquire_never_blocks_and_pool_refills(self):
+        created = []
+
+        async def factory():
+            await asyncio.sleep(0.01)
+            created.append(1)
+            return PooledContext(context=FakeContext({}), page=FakePage())
+
+        pool = ContextPool(factory, size=2)
+        self.assertIsNone(pool.acquire())
+        pool.start()
+        await asyncio.sleep(0.05)
+        self.assertEqual(len(pool.available), 2)
+
+        self.assertIsNotNone(pool.acquire())
+        await asyncio.sleep(0.03)
+        self.assertEqual(len(pool.available), 2)
+        self.assertEqual(pool.get_stats()['hits'], 1)
+        self.assertEqual(pool.get_stats()['misses'], 1)
+
+        idle = list(pool.available)
+        await pool.close()
+        self.assertTrue(all(p.context.closed for p in idle))
+
+
+class TestBrowserManagerPool(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.manager = BrowserManager()
+        self.manager.user_profiles_dir = Path(self.tmp.name)
+        self.manager.browser = FakeBrowser()
+        self.manager.is_running = True
+
+    async def asyncTearDown(self):
+        if self.manager.context_pool:
+            await self.manager.context_pool.close()
+        self.tmp.cleanup()
+
+    async def test_create_tab_uses_warm_context_and_applies_session(self):
+        self.manager.set_context_pool_size(1)
+        await asyncio.sleep(0.05)
+
+        profile = self.manager._create_user_profile(1)
+        (profile / "session.json").write_text(json.dumps({
+            'cookies': [{'name': 'sid', 'value': 'x', 'domain': 'key-drop.com', 'path': '/'}],
+            'origins': [{'origin': 'https://key-drop.com', 'localStorage': [{'name': 'a', 'value': '1'}]}],
+        }))
+
+        tab = await self.manager.create_tab(1)
+        self.assertTrue(tab.pooled)
+        self.assertEqual(tab.context.cookies[0]['name'], 'sid')
+        self.assertIn('key-drop.com', tab.context.init_scripts[0])
+        self.assertIn('console', tab.page.listeners)
+        # Bloqueio registrado uma vez no contexto, não por página
+        self.assertEqual(tab.page.routes, [])
+        self.assertEqual(len(tab.context.routes), 1)
+        self.assertIsNotNone(tab.resources)
+
+    async def test_proxy_tabs_use_cold_path(self):
+        self.manager.set_context_pool_size(1)
+        await asyncio.sleep(0.05)
+        tab = await self.manager.create_tab(1, proxy="http://proxy:8080")
+        self.assertFalse(tab.pooled)
+        self.assertEqual(tab.context.options['proxy'], {"server": "http://proxy:8080"})
+
+    async def test_restart_latency_recorded_per_path(self):
+        self.manager.context_pool_size = 0
+        await self.manager.create_tab(1)
+        self.assertTrue(await self.manager.restart_tab(1))
+
+        self.manager.set_context_pool_size(1)
+        await asyncio.sleep(0.05)
+        self.assertTrue(await self.manager.restart_tab(1))
+
+        stats = self.manager.get_pool_stats()
+        self.assertEqual(stats['restart_latency']['cold']['count'], 1)
+        self.assertEqual(stats['restart_latency']['pooled']['count'], 1)
+        self.assertEqual(self.manager.get_tab_count(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
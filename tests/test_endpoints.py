@@ -44,6 +44,7 @@ def create_test_client():
     browser_manager = types.SimpleNamespace(
         is_running=False,
         get_tab_count=lambda: 0,
+        get_warm_status=lambda: {'driver_ready': False, 'browser_ready': False},
         get_all_tabs_info=lambda: [],
         close_tab=lambda tid: True,
         restart_tab=lambda tid: True,
@@ -60,7 +61,7 @@ def create_test_client():
         }
         def get_participation_stats(self):
             return {}
-        def get_participation_history(self, limit=100):
+        def get_participation_history(self, limit=100, offset=0):
             return []
         def record_winning(self, amt, lt):
             pass
@@ -173,6 +174,7 @@ def test_health_endpoint():
     data = resp.json()
     assert data['status'] == 'healthy'
     assert 'bot_status' in data
+    assert data['browser_warm']['browser_ready'] is False
 
 
 def test_get_config():
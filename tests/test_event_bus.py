@@ -0,0 +1,112 @@
+import sys
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bot_keydrop.backend.bot_logic.event_bus import EventBus
+from bot_keydrop.backend.bot_logic.scheduler import BotScheduler
+from bot_keydrop.backend.config.config_manager import ConfigManager
+from tests.test_bot_scheduler import DummyAutomation, DummyBrowserManager
+
+
+class TestEventBus(unittest.IsolatedAsyncioTestCase):
+    async def test_publish_does_not_wait_for_slow_subscriber(self):
+        bus = EventBus()
+        release = asyncio.Event()
+        received = []
+
+        async def slow(value):
+            await release.wait()
+            received.append(value)
+
+        bus.subscribe("tick", slow)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for i in range(100):
+            bus.publish("tick", i)
+        self.assertLess(loop.time() - started, 0.05)
+
+        release.set()
+        self.assertTrue(await bus.drain(timeout=1))
+        self.assertEqual(received, list(range(100)))
+        await bus.close()
+
+    async def test_coalesces_by_key_and_bounds_queue(self):
+        bus = EventBus(max_queue=3)
+        gate = asyncio.Event()
+        received = []
+
+        async def handler(tab_id, value):
+            await gate.wait()
+            received.append((tab_id, value))
+
+        sub = bus.subscribe("task_completed", handler)
+        for value in range(5):
+            bus.publish("task_completed", 1, value, key=1)
+        for tab_id in (2, 3, 4):
+            bus.publish("task_completed", tab_id, 0, key=tab_id)
+
+        metrics = bus.get_metrics()[0]
+        self.assertEqual(metrics['coalesced'], 4)
+        self.assertEqual(metrics['dropped'], 1)
+        self.assertEqual(metrics['queue_depth'], 3)
+
+        gate.set()
+        await bus.drain(timeout=1)
+        self.assertNotIn((1, 4), received)
+        self.assertEqual(received[-3:], [(2, 0), (3, 0), (4, 0)])
+        self.assertEqual(sub.delivered, len(received))
+        await bus.close()
+
+    async def test_failing_handler_does_not_stop_delivery(self):
+        bus = EventBus()
+        received = []
+
+        def handler(value):
+            if value == 0:
+                raise ValueError("falha")
+            received.append(value)
+
+        bus.subscribe("tick", handler)
+        bus.publish("tick", 0)
+        bus.publish("tick", 1)
+        await bus.drain(timeout=1)
+
+        self.assertEqual(received, [1])
+        self.assertEqual(bus.get_metrics()[0]['errors'], 1)
+        await bus.close()
+
+
+class TestSchedulerCallbacksDecoupled(unittest.IsolatedAsyncioTestCase):
+    async def test_slow_task_callback_does_not_hold_semaphore(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        config = ConfigManager(config_dir=tmp.name)
+        config.update_config(num_tabs=1, max_concurrent_tasks=1)
+        scheduler = BotScheduler(DummyBrowserManager(), DummyAutomation(), config)
+        await scheduler.browser_manager.start_browser()
+        await scheduler.browser_manager.create_tab(1)
+        await scheduler._create_tasks_for_tab(1)
+
+        blocked = asyncio.Event()
+
+        async def slow_callback(task):
+            await blocked.wait()
+
+        scheduler.add_task_callback(slow_callback)
+        task = scheduler.tasks['participate_1']
+        await asyncio.wait_for(scheduler._execute_single_task(task), 0.5)
+        await asyncio.wait_for(scheduler._execute_single_task(task), 0.5)
+
+        self.assertFalse(scheduler.task_semaphore.locked())
+        blocked.set()
+        await scheduler.events.drain(timeout=1)
+        await scheduler.events.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
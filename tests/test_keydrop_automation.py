@@ -32,23 +32,6 @@ def make_attempt(tab_id, result):
     )
 
 
-class FakeElement:
-    def __init__(self, text=None, amateur=False):
-        self._text = text
-        self._amateur = amateur
-
-    async def query_selector(self, selector):
-        from bot_keydrop.backend.bot_logic.automation_tasks import KeydropAutomation
-        if selector == KeydropAutomation.SELECTORS['lottery_title']:
-            return FakeElement(self._text)
-        if selector == KeydropAutomation.SELECTORS['amateur_lottery'] and self._amateur:
-            return FakeElement()
-        return None
-
-    async def inner_text(self):
-        return self._text
-
-
 class TestKeydropAutomation(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
         self.auto = KeydropAutomation(DummyBrowserManager())
@@ -70,13 +53,6 @@ class TestKeydropAutomation(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(len(latest), 1)
         self.assertEqual(latest[0]['amount'], 5.0)
 
-    async def test_extract_lottery_info(self):
-        card = FakeElement('Amateur Test', amateur=True)
-        info = await self.auto._extract_lottery_info(card)
-        self.assertEqual(info['title'], 'Amateur Test')
-        self.assertTrue(info['is_amateur'])
-        self.assertEqual(info['type'], 'amateur')
-
 
 if __name__ == '__main__':
     unittest.main()
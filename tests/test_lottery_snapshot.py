@@ -0,0 +1,118 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bot_keydrop.backend.bot_logic.automation_tasks import KeydropAutomation, ParticipationResult
+from bot_keydrop.backend.bot_logic.lottery_snapshot import (
+    LotteryCard,
+    RESOLVE_SCRIPT,
+    SNAPSHOT_SCRIPT,
+)
+
+
+class DummyBrowserManager:
+    def get_tab_info(self, tab_id):
+        return None
+
+
+class FakeHandle:
+    def __init__(self, element):
+        self.element = element
+        self.disposed = False
+
+    def as_element(self):
+        return self.element
+
+    async def dispose(self):
+        self.disposed = True
+
+
+class SnapshotPage:
+    """Página que só responde ao snapshot e à resolução do card"""
+
+    def __init__(self, rows, links=None):
+        self.rows = rows
+        self.links = links or {}
+        self.evaluations = []
+        self.handles = []
+
+    async def evaluate(self, script, args=None):
+        self.evaluations.append(script)
+        return self.rows
+
+    async def evaluate_handle(self, script, args):
+        assert script == RESOLVE_SCRIPT
+        handle = FakeHandle(self.links.get(args[2]))
+        self.handles.append((args, handle))
+        return handle
+
+    async def wait_for_selector(self, selector, state=None, timeout=None):
+        return object()
+
+    async def query_selector_all(self, selector):
+        raise AssertionError("o snapshot não deve pedir handles de todos os cards")
+
+
+class TestLotterySnapshot(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.auto = KeydropAutomation(DummyBrowserManager())
+
+    def test_card_from_row(self):
+        card = LotteryCard.from_row([2, '/pt/giveaways/abc', 'Amateur Daily', False, True])
+        self.assertEqual(card.index, 2)
+        self.assertEqual(card.info, {'title': 'Amateur Daily', 'type': 'amateur', 'is_amateur': True})
+
+        card = LotteryCard.from_row([0, None, None, False, False])
+        self.assertEqual(card.key, '')
+        self.assertEqual(card.info['type'], 'unknown')
+
+    async def test_discovery_uses_single_evaluate(self):
+        page = SnapshotPage([
+            [0, '/pt/giveaways/1', 'Contender', False, True],
+            [1, '/pt/giveaways/2', 'Amateur', True, False],
+            [2, '/pt/giveaways/3', 'Legend', False, True],
+        ])
+
+        lotteries = await self.auto._find_available_lotteries(page)
+
+        self.assertEqual(page.evaluations, [SNAPSHOT_SCRIPT])
+        self.assertEqual([l['info']['title'] for l in lotteries], ['Contender', 'Legend'])
+        self.assertTrue(all(l['link'] is None for l in lotteries))
+        self.assertEqual(page.handles, [])
+
+    async def test_link_resolved_only_for_chosen_card(self):
+        link = object()
+        page = SnapshotPage(
+            [[0, '/pt/giveaways/1', 'A', False, True], [1, '/pt/giveaways/2', 'B', False, True]],
+            links={'/pt/giveaways/2': link},
+        )
+        lotteries = await self.auto._find_available_lotteries(page)
+
+        resolved = await self.auto._resolve_link(page, lotteries[1])
+
+        self.assertIs(resolved, link)
+        self.assertEqual(len(page.handles), 1)
+        self.assertEqual(page.handles[0][0][2:], ['/pt/giveaways/2', 1])
+
+    async def test_vanished_card_is_button_not_found(self):
+        page = SnapshotPage([[0, '/pt/giveaways/1', 'A', False, True]])
+        lottery = (await self.auto._find_available_lotteries(page))[0]
+
+        result = await self.auto._attempt_participation(page, lottery, 1, 1)
+
+        self.assertEqual(result.result, ParticipationResult.BUTTON_NOT_FOUND)
+        self.assertTrue(page.handles[0][1].disposed)
+
+    async def test_snapshot_failure_returns_empty(self):
+        page = SnapshotPage([])
+        page.evaluate = AsyncMock(side_effect=RuntimeError("Execution context was destroyed"))
+
+        self.assertEqual(await self.auto._find_available_lotteries(page), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bot_keydrop.backend.bot_logic.automation_tasks import KeydropAutomation
+from bot_keydrop.backend.bot_logic.page_freshness import PageFreshness
+
+LISTING = KeydropAutomation.URLS['keydrop_lotteries']
+
+
+class DummyBrowserManager:
+    def get_tab_info(self, tab_id):
+        return None
+
+
+class ListingPage:
+    def __init__(self, url="about:blank", transferred=500_000):
+        self.url = url
+        self.transferred = transferred
+        self.gotos = 0
+        self.reloads = 0
+        self.backs = 0
+
+    async def goto(self, url, wait_until=None, timeout=None):
+        self.gotos += 1
+        self.url = url
+
+    async def reload(self, wait_until=None, timeout=None):
+        self.reloads += 1
+
+    async def go_back(self, wait_until=None):
+        self.backs += 1
+        self.url = LISTING
+
+    async def evaluate(self, script, *args):
+        return self.transferred if not self.reloads else 20_000
+
+
+class TestPageFreshness(unittest.TestCase):
+    def test_decisions(self):
+        freshness = PageFreshness(max_age=30)
+        self.assertEqual(freshness.decide(1, LISTING, LISTING), 'goto')
+
+        freshness.mark_loaded(1)
+        self.assertEqual(freshness.decide(1, LISTING + "?tab=2", LISTING), 'reuse')
+        self.assertEqual(freshness.decide(1, "https://key-drop.com/pt/giveaways/x", LISTING), 'goto')
+
+        freshness.expire(1)
+        self.assertEqual(freshness.decide(1, LISTING, LISTING), 'reload')
+
+        freshness.mark_broken(1)
+        self.assertEqual(freshness.decide(1, LISTING, LISTING), 'goto')
+
+    def test_forgotten_tab_needs_full_navigation(self):
+        freshness = PageFreshness(max_age=30)
+        freshness.mark_loaded(1)
+        freshness.mark_loaded(2)
+
+        freshness.forget(1)
+
+        self.assertEqual(freshness.decide(1, LISTING, LISTING), 'goto')
+        self.assertEqual(freshness.decide(2, LISTING, LISTING), 'reuse')
+
+    def test_savings_relative_to_goto(self):
+        freshness = PageFreshness()
+        freshness.record('goto', 2.0, 400_000)
+        freshness.record('reuse', 0.0)
+        freshness.record('reload', 0.5, 30_000)
+
+        stats = freshness.get_stats()
+
+        self.assertEqual(stats['actions']['reuse']['count'], 1)
+        self.assertAlmostEqual(stats['saved_seconds'], 3.5, places=2)
+        self.assertEqual(stats['saved_bytes'], 770_000)
+
+    def test_no_savings_without_goto_baseline(self):
+        self.assertIsNone(PageFreshness().get_stats()['saved_seconds'])
+
+
+class TestListingNavigation(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.auto = KeydropAutomation(DummyBrowserManager())
+        self.auto.waits.pacing_floor = 0
+        self.auto.ACTION_HOLD = dict.fromkeys(KeydropAutomation.ACTION_HOLD, 0)
+
+    async def test_fresh_listing_is_reused(self):
+        page = ListingPage()
+
+        self.assertEqual(await self.auto._ensure_listing(1, page), 'goto')
+        self.assertEqual(await self.auto._ensure_listing(1, page), 'reuse')
+        self.assertEqual(page.gotos, 1)
+
+        self.auto.freshness.expire(1)
+        self.assertEqual(await self.auto._ensure_listing(1, page), 'reload')
+        self.assertEqual(page.reloads, 1)
+
+        stats = self.auto.get_navigation_stats()
+        self.assertEqual(stats['actions']['goto']['bytes'], 500_000)
+        self.assertEqual(stats['saved_bytes'], 500_000 * 2 - 20_000)
+
+    async def test_return_only_when_navigated_away(self):
+        page = ListingPage(url=LISTING)
+        await self.auto._return_to_listing(1, page)
+        self.assertEqual(page.backs, 0)
+
+        page.url = "https://key-drop.com/pt/giveaways/abc"
+        await self.auto._return_to_listing(1, page)
+        self.assertEqual(page.backs, 1)
+
+    async def test_failed_attempt_forces_full_navigation(self):
+        page = ListingPage()
+        await self.auto._ensure_listing(1, page)
+        tab_info = type('Tab', (), {})()
+        tab_info.page = page
+        tab_info.status = 'ready'
+        tab_info.error_count = 0
+        self.auto.browser_manager.get_tab_info = lambda tab_id: tab_info
+        self.auto._check_login_required = AsyncMock(side_effect=RuntimeError("Target closed"))
+
+        await self.auto.participate_in_lottery(1, max_retries=1)
+
+        self.assertEqual(self.auto.freshness.decide(1, page.url, LISTING), 'goto')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+import sys
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bot_keydrop.backend.bot_logic.automation_tasks import (
+    KeydropAutomation,
+    ParticipationAttempt,
+    ParticipationResult,
+)
+from bot_keydrop.backend.bot_logic.participation_store import ParticipationStore
+
+START = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def fill(store, results, step=60):
+    for index, result in enumerate(results):
+        store.append(START + timedelta(seconds=index * step), index % 4 + 1, result)
+
+
+def naive_counts(rows, since):
+    counts = {'total': 0}
+    for timestamp, result in rows:
+        if since is None or timestamp >= since:
+            counts['total'] += 1
+            counts[result] = counts.get(result, 0) + 1
+    return counts
+
+
+class TestParticipationStore(unittest.TestCase):
+    def test_window_counts_match_linear_scan(self):
+        store = ParticipationStore()
+        results = ['success', 'failed', 'success', 'already_participated', 'failed'] * 40
+        fill(store, results)
+        rows = [(START + timedelta(seconds=i * 60), r) for i, r in enumerate(results)]
+
+        for minutes in (None, 0, 1, 59, 60, 137, 199, 500):
+            since = START + timedelta(minutes=minutes) if minutes is not None else None
+            expected = naive_counts(rows, since)
+            counts = store.counts(since)
+            self.assertEqual(counts['total'], expected['total'])
+            for result in set(results):
+                self.assertEqual(counts[result], expected.get(result, 0), (minutes, result))
+
+    def test_result_first_seen_midway_counts_from_its_row(self):
+        store = ParticipationStore()
+        fill(store, ['success'] * 10)
+        store.append(START + timedelta(hours=1), 1, 'timeout')
+        store.append(START + timedelta(hours=2), 1, 'success')
+
+        self.assertEqual(store.counts()['timeout'], 1)
+        self.assertEqual(store.counts(START + timedelta(minutes=90))['timeout'], 0)
+        self.assertEqual(store.counts(START + timedelta(minutes=30))['success'], 1)
+
+    def test_capacity_drops_oldest_and_keeps_counts(self):
+        store = ParticipationStore(capacity=100)
+        results = ['success', 'failed', 'failed'] * 100
+        fill(store, results)
+
+        self.assertLessEqual(len(store), 100)
+        kept = results[-len(store):]
+        counts = store.counts()
+        self.assertEqual(counts['total'], len(kept))
+        self.assertEqual(counts['success'], kept.count('success'))
+        self.assertEqual(counts['failed'], kept.count('failed'))
+        self.assertEqual(store.totals['success'], 100)
+        first = datetime.fromisoformat(store.page()[0]['timestamp'])
+        self.assertEqual(first, START + timedelta(seconds=(len(results) - len(store)) * 60))
+
+    def test_lower_capacity_shrinks_store(self):
+        results = ['success', 'failed'] * 2500
+        store = ParticipationStore()
+        fill(store, results)
+
+        store.capacity = 1000
+        store.append(START + timedelta(days=1), 1, 'success')
+        self.assertLessEqual(len(store), 1000)
+        self.assertEqual(store.counts()['success'], len(store) - store.counts()['failed'])
+
+        store = ParticipationStore()
+        fill(store, results)
+        store.resize(1000)
+        self.assertEqual(len(store), 1000)
+        kept = results[-1000:]
+        self.assertEqual(store.counts()['failed'], kept.count('failed'))
+        self.assertEqual(datetime.fromisoformat(store.page(1)[0]['timestamp']),
+                         START + timedelta(seconds=(len(results) - 1) * 60))
+
+    def test_clock_going_back_keeps_order(self):
+        store = ParticipationStore()
+        store.append(START, 1, 'success')
+        store.append(START - timedelta(minutes=5), 2, 'failed')
+
+        self.assertEqual(list(store.timestamps), sorted(store.timestamps))
+        self.assertEqual(store.counts(START)['total'], 2)
+
+    def test_page_reads_from_the_end(self):
+        store = ParticipationStore()
+        fill(store, ['success'] * 10)
+
+        self.assertEqual([row['tab_id'] for row in store.page(3)], [4, 1, 2])
+        self.assertEqual([row['tab_id'] for row in store.page(3, offset=3)], [1, 2, 3])
+        self.assertEqual(len(store.page()), 10)
+        self.assertEqual(store.page(5, offset=20), [])
+        self.assertIsNone(store.last_timestamp(START + timedelta(days=1)))
+
+
+class TestAutomationHistory(unittest.TestCase):
+    def setUp(self):
+        self.automation = KeydropAutomation(browser_manager=None)
+
+    def record(self, result, minutes_ago, **extra):
+        attempt = ParticipationAttempt(
+            tab_id=1,
+            attempt_number=1,
+            timestamp=datetime.now() - timedelta(minutes=minutes_ago),
+            result=result,
+            **extra,
+        )
+        self.automation._add_to_history(attempt)
+        return attempt
+
+    def test_history_rows_match_attempt_dict(self):
+        attempt = self.record(ParticipationResult.FAILED, 1, error_message="erro",
+                              lottery_type="amateur", lottery_title="Amador")
+
+        self.assertEqual(self.automation.get_participation_history(), [attempt.to_dict()])
+
+    def test_stats_use_time_window(self):
+        self.record(ParticipationResult.SUCCESS, 180)
+        self.record(ParticipationResult.FAILED, 30)
+        last = self.record(ParticipationResult.SUCCESS, 5)
+
+        stats = self.automation.get_participation_stats(hours=1)
+        self.assertEqual(stats['total_attempts'], 2)
+        self.assertEqual(stats['successful_participations'], 1)
+        self.assertEqual(stats['failed_participations'], 1)
+        self.assertEqual(stats['success_rate'], 50)
+        self.assertEqual(stats['last_attempt'], last.timestamp.isoformat())
+        self.assertEqual(self.automation.get_participation_counts()['success'], 2)
+
+    def test_history_is_not_cleared_when_full(self):
+        for _ in range(1500):
+            self.record(ParticipationResult.SUCCESS, 1)
+
+        self.assertEqual(len(self.automation.get_participation_history()), 1500)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import sys
+import shutil
+import time
+import uuid
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bot_keydrop.backend.bot_logic.browser_manager import BrowserManager
+from bot_keydrop.backend.bot_logic.profile_store import ProfileStore
+
+
+def fill(path: Path, size: int):
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "session.json").write_bytes(b"x" * size)
+
+
+class TestProfileStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_mapping_is_stable_across_instances(self):
+        first = ProfileStore(self.base).path_for(1)
+        self.assertEqual(ProfileStore(self.base).path_for(1), first)
+        self.assertNotEqual(ProfileStore(self.base).path_for(2), first)
+
+    def test_collect_removes_only_orphan_profiles(self):
+        store = ProfileStore(self.base)
+        kept = store.path_for(1)
+        fill(kept, 10)
+        orphan = self.base / str(uuid.uuid4())
+        fill(orphan, 10)
+        foreign = self.base / "backup"
+        foreign.mkdir()
+
+        stats = store.collect()
+
+        self.assertTrue(kept.exists())
+        self.assertFalse(orphan.exists())
+        self.assertTrue(foreign.exists())
+        self.assertEqual(stats['orphans_removed'], 1)
+        self.assertEqual(stats['profiles'], 1)
+
+    def test_budget_evicts_least_recently_used_inactive_profiles(self):
+        store = ProfileStore(self.base, max_bytes=2500)
+        paths = {}
+        for tab_id in (1, 2, 3):
+            paths[tab_id] = store.path_for(tab_id)
+            fill(paths[tab_id], 1000)
+            time.sleep(0.01)
+        store.path_for(1)  # guia 1 usada por último
+
+        stats = store.collect(active_tab_ids=[2])
+
+        self.assertFalse(paths[3].exists())
+        self.assertTrue(paths[1].exists())
+        self.assertTrue(paths[2].exists())
+        self.assertEqual(stats['evicted'], 1)
+        self.assertNotIn('3', ProfileStore(self.base).entries)
+        self.assertEqual(ProfileStore(self.base).path_for(1), paths[1])
+
+    def test_profile_claimed_during_eviction_gets_new_directory(self):
+        store = ProfileStore(self.base, max_bytes=500)
+        doomed = store.path_for(1)
+        fill(doomed, 1000)
+        claimed = []
+        real_rmtree = shutil.rmtree
+
+        def rmtree(path, ignore_errors=False):
+            # A guia é reaberta enquanto o diretório antigo é apagado
+            claimed.append(store.path_for(1))
+            real_rmtree(path, ignore_errors=ignore_errors)
+
+        with patch('bot_keydrop.backend.bot_logic.profile_store.shutil.rmtree', rmtree):
+            store.collect()
+
+        self.assertFalse(doomed.exists())
+        self.assertNotEqual(claimed[0], doomed)
+        self.assertEqual(store.path_for(1), claimed[0])
+
+
+class TestBrowserManagerProfiles(unittest.IsolatedAsyncioTestCase):
+    async def test_restarted_tab_reuses_profile_directory(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = BrowserManager()
+            manager.user_profiles_dir = Path(tmp)
+            first = manager._create_user_profile(1)
+            manager.tab_profiles.clear()
+
+            self.assertEqual(manager._create_user_profile(1), first)
+            stats = await manager.collect_profiles()
+            self.assertEqual(stats['profiles'], 1)
+            self.assertEqual(len(list(Path(tmp).iterdir())), 2)  # perfil + index.json
+
+    async def test_configured_tabs_are_not_evicted_before_reopening(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = BrowserManager()
+            manager.user_profiles_dir = Path(tmp)
+            manager.profile_disk_budget_mb = 0
+            paths = [manager._create_user_profile(tab_id) for tab_id in (1, 2, 3)]
+            for path in paths:
+                fill(path, 1024 * 1024)
+            manager.profile_disk_budget_mb = 1
+            manager.num_tabs = 2
+
+            stats = await manager.collect_profiles()
+
+            self.assertTrue(paths[0].exists())
+            self.assertTrue(paths[1].exists())
+            self.assertFalse(paths[2].exists())
+            self.assertEqual(stats['evicted'], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bot_keydrop.backend.bot_logic.resource_policy import ResourcePolicy, ESTIMATED_BYTES
+
+
+class FakeRoute:
+    def __init__(self, url, resource_type):
+        self.request = SimpleNamespace(url=url, resource_type=resource_type)
+        self.aborted = False
+
+    async def abort(self):
+        self.aborted = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.routes = []
+
+    async def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+
+
+class TestResourcePolicy(unittest.IsolatedAsyncioTestCase):
+    def test_pattern_only_matches_blocked_resources(self):
+        policy = ResourcePolicy(['image', 'font'], ['*doubleclick.net*'])
+
+        self.assertTrue(policy.blocks("https://cdn.key-drop.com/img/case.PNG"))
+        self.assertTrue(policy.blocks("https://cdn.key-drop.com/fonts/a.woff2?v=3"))
+        self.assertTrue(policy.blocks("https://ad.doubleclick.net/pixel"))
+        self.assertFalse(policy.blocks("https://key-drop.com/pt/giveaways/list"))
+        self.assertFalse(policy.blocks("https://key-drop.com/api/giveaways?type=amateur"))
+        self.assertFalse(policy.blocks("https://key-drop.com/static/app.js"))
+        self.assertFalse(policy.blocks("https://key-drop.com/static/app.css"))
+
+    async def test_install_registers_single_narrow_route(self):
+        context = FakeContext()
+        counters = await ResourcePolicy().install(context)
+
+        self.assertEqual(len(context.routes), 1)
+        pattern, handler = context.routes[0]
+        self.assertNotEqual(pattern, "**/*")
+
+        route = FakeRoute("https://cdn.key-drop.com/a.jpg", 'image')
+        await handler(route)
+        self.assertTrue(route.aborted)
+        self.assertEqual(counters.blocked, 1)
+        self.assertEqual(counters.bytes_saved, ESTIMATED_BYTES['image'])
+        self.assertEqual(counters.to_dict()['by_type'], {'image': 1})
+
+    async def test_empty_policy_installs_nothing(self):
+        context = FakeContext()
+        counters = await ResourcePolicy([], []).install(context)
+        self.assertEqual(context.routes, [])
+        self.assertEqual(counters.blocked, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
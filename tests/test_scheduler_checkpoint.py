@@ -0,0 +1,158 @@
+import os
+import sys
+import asyncio
+import json
+import time
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from bot_keydrop.backend.bot_logic.checkpoint import SchedulerCheckpoint
+from bot_keydrop.backend.bot_logic.scheduler import BotScheduler
+from bot_keydrop.backend.config.config_manager import ConfigManager
+from tests.test_bot_scheduler import DummyAutomation, DummyBrowserManager
+
+
+class TestSchedulerCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "checkpoint.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_save_and_load_roundtrip(self):
+        checkpoint = SchedulerCheckpoint(self.path)
+        self.assertTrue(checkpoint.save({'tasks': [[1, 2]]}))
+        self.assertFalse(self.path.with_name("checkpoint.json.tmp").exists())
+        self.assertEqual(checkpoint.load()['tasks'], [[1, 2]])
+
+    def test_expired_or_corrupted_checkpoint_is_ignored(self):
+        checkpoint = SchedulerCheckpoint(self.path, max_age=60)
+        self.path.write_text(json.dumps({'version': 1, 'saved_at': time.time() - 120}))
+        self.assertIsNone(checkpoint.load())
+        self.path.write_text("{corrompido")
+        self.assertIsNone(checkpoint.load())
+
+
+class TestSchedulerWarmResume(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.config = ConfigManager(config_dir=self.tmp.name)
+        self.config.update_config(num_tabs=3, amateur_lottery_wait_time=600, execution_speed=10)
+
+    async def asyncTearDown(self):
+        self.tmp.cleanup()
+
+    async def test_resume_preserves_deadlines_and_retries(self):
+        first = BotScheduler(DummyBrowserManager(), DummyAutomation(), self.config)
+        await first.start_bot()
+        future = datetime.now() + timedelta(minutes=5)
+        first.tasks['participate_1'].next_execution = future
+        first.tasks['participate_1'].retry_count = 2
+        first.tasks['participate_2'].next_execution = datetime.now() - timedelta(minutes=10)
+        first.tasks['participate_3'].next_execution = datetime.now() - timedelta(minutes=20)
+        first.consecutive_failures[1] = 4
+        first.statistics.successful_tasks = 7
+        self.assertTrue(first.save_checkpoint())
+        first.checkpoint_enabled = False
+        await first.stop_bot()
+
+        second = BotScheduler(DummyBrowserManager(), DummyAutomation(), self.config)
+        await second.start_bot()
+        try:
+            task = second.tasks['participate_1']
+            self.assertAlmostEqual(task.next_execution.timestamp(), future.timestamp(), places=3)
+            self.assertEqual(task.retry_count, 2)
+            self.assertEqual(second.consecutive_failures[1], 4)
+            self.assertEqual(second.statistics.successful_tasks, 7)
+
+            # Atrasadas retomam a partir de agora, espaçadas e na ordem original
+            tab3 = second.tasks['participate_3'].next_execution
+            tab2 = second.tasks['participate_2'].next_execution
+            self.assertLess(tab3, tab2)
+            self.assertGreaterEqual((tab2 - tab3).total_seconds(), second.iteration_delay - 0.01)
+            self.assertGreater(tab3, datetime.now() - timedelta(seconds=5))
+        finally:
+            await second.stop_bot()
+
+    async def test_user_stop_clears_checkpoint_and_shutdown_keeps_it(self):
+        scheduler = BotScheduler(DummyBrowserManager(), DummyAutomation(), self.config)
+        await scheduler.start_bot()
+        await scheduler.stop_bot()
+        self.assertFalse(scheduler.checkpoint.path.exists())
+
+        await scheduler.start_bot()
+        await scheduler.stop_bot(keep_checkpoint=True)
+        self.assertIsNotNone(scheduler.checkpoint.load())
+
+    async def test_session_record_ignores_restored_start_time(self):
+        automation = DummyAutomation()
+        since = []
+        automation.get_participation_counts = lambda start: since.append(start) or {'total': 0}
+        automation.get_winnings_history = lambda: []
+
+        first = BotScheduler(DummyBrowserManager(), automation, self.config)
+        await first.start_bot()
+        first.statistics.start_time = datetime.now() - timedelta(hours=2)
+        self.assertTrue(first.save_checkpoint())
+        first.checkpoint_enabled = False
+        with patch('bot_keydrop.backend.bot_logic.scheduler.PerformanceHistory'):
+            await first.stop_bot()
+
+            second = BotScheduler(DummyBrowserManager(), automation, self.config)
+            started = datetime.now()
+            await second.start_bot()
+            self.assertLess(second.statistics.start_time, started - timedelta(hours=1))
+            await second.stop_bot()
+
+        self.assertGreaterEqual(since[-1], started - timedelta(seconds=1))
+
+    async def test_malformed_checkpoint_starts_fresh(self):
+        scheduler = BotScheduler(DummyBrowserManager(), DummyAutomation(), self.config)
+        scheduler.checkpoint.save({
+            'tasks': [['participate_1', 1, 'participate', 'amanhã', 0, None]],
+            'consecutive_failures': {'1': 5},
+            'statistics': [None, 3],
+        })
+
+        self.assertTrue(await scheduler.start_bot())
+        try:
+            self.assertFalse(scheduler.checkpoint.path.exists())
+            self.assertEqual(scheduler.consecutive_failures, {})
+            self.assertEqual(scheduler.statistics.total_tasks_executed, 0)
+            self.assertEqual(len(scheduler.tasks), 3)
+        finally:
+            await scheduler.stop_bot()
+
+    async def test_periodic_save_runs_off_the_event_loop(self):
+        scheduler = BotScheduler(DummyBrowserManager(), DummyAutomation(), self.config)
+        original_save = scheduler.checkpoint.save
+
+        def slow_save(state):
+            time.sleep(0.3)
+            return original_save(state)
+
+        scheduler.checkpoint.save = slow_save
+        await scheduler.start_bot()
+        try:
+            loop = asyncio.get_running_loop()
+            writing = asyncio.ensure_future(scheduler.save_checkpoint_async())
+            started = loop.time()
+            await asyncio.sleep(0.01)
+            # O loop continua respondendo enquanto a thread grava
+            self.assertLess(loop.time() - started, 0.2)
+            self.assertTrue(await writing)
+            self.assertIsNotNone(scheduler.checkpoint.load())
+        finally:
+            await scheduler.stop_bot(keep_checkpoint=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
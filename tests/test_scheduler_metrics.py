@@ -0,0 +1,164 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from datetime import datetime, timedelta
+
+from bot_keydrop.backend.bot_logic.metrics import LatencyHistogram, RollingWindow, SchedulerMetrics
+from bot_keydrop.backend.bot_logic.scheduler import (
+    BotScheduler, BotStatistics, ScheduledTask, TaskStatus, TaskTable
+)
+from bot_keydrop.backend.config.config_manager import ConfigManager
+from tests.test_bot_scheduler import DummyAutomation, DummyBrowserManager
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_percentiles_within_bucket_resolution(self):
+        hist = LatencyHistogram()
+        for ms in range(1, 1001):
+            hist.record(ms / 1000)
+
+        self.assertEqual(hist.count, 1000)
+        for q, expected in ((50, 0.5), (95, 0.95), (99, 0.99)):
+            value = hist.percentile(q)
+            self.assertGreaterEqual(value, expected)
+            self.assertLessEqual(value, expected * 1.5)
+        self.assertEqual(hist.percentile(100), 1.0)
+
+    def test_memory_is_fixed(self):
+        hist = LatencyHistogram()
+        buckets = len(hist.counts)
+        for i in range(10000):
+            hist.record(i * 0.37)
+        self.assertEqual(len(hist.counts), buckets)
+        self.assertEqual(hist.to_dict()['count'], 10000)
+
+    def test_metrics_split_by_tab_and_result(self):
+        metrics = SchedulerMetrics()
+        metrics.record(1, 'success', 0.1, 0.0, 2.0)
+        metrics.record(2, 'failed', 0.5, 0.2, 4.0)
+        metrics.record(2, 'tab_not_ready', 0.3, 0.0)
+
+        data = metrics.to_dict()
+        self.assertEqual(data['by_tab'][2]['dispatch_lag']['count'], 2)
+        self.assertEqual(data['by_tab'][2]['run_time']['count'], 1)
+        self.assertEqual(set(data['by_result']), {'success', 'failed', 'tab_not_ready'})
+        self.assertEqual(data['totals']['semaphore_wait']['count'], 3)
+
+
+class TestSchedulerLatencyInstrumentation(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.config = ConfigManager(config_dir=self.tmp.name)
+        self.config.update_config(num_tabs=1, amateur_lottery_wait_time=60, execution_speed=10)
+        self.scheduler = BotScheduler(DummyBrowserManager(), DummyAutomation(), self.config)
+        self.scheduler.checkpoint_enabled = False
+
+    async def asyncTearDown(self):
+        self.tmp.cleanup()
+
+    async def test_execution_is_recorded(self):
+        await self.scheduler.browser_manager.start_browser()
+        await self.scheduler.browser_manager.create_tab(1)
+        await self.scheduler._create_tasks_for_tab(1)
+
+        await self.scheduler._execute_single_task(self.scheduler.tasks['participate_1'])
+
+        metrics = self.scheduler.get_latency_metrics()
+        self.assertEqual(metrics['by_tab'][1]['run_time']['count'], 1)
+        self.assertEqual(metrics['by_result']['success']['count'], 1)
+        self.assertEqual(self.scheduler.get_status()['latency']['dispatch_lag']['count'], 1)
+
+
+class TestRollingWindows(unittest.TestCase):
+    def test_window_expires_old_buckets(self):
+        window = RollingWindow(60)
+        window.record(True, 1000.0)
+        window.record(False, 1030.0)
+        self.assertEqual(window.totals(1030.0), (1, 2))
+        self.assertEqual(window.totals(1075.0), (0, 1))
+        self.assertEqual(window.totals(2000.0), (0, 0))
+
+    def test_statistics_report_rates_and_throughput(self):
+        stats = BotStatistics(start_time=datetime.now())
+        for success in (True, True, True, False):
+            stats.record_result(success)
+
+        data = stats.to_dict()
+        self.assertEqual(data['total_tasks_executed'], 4)
+        self.assertEqual(data['failed_tasks'], 1)
+        self.assertEqual(data['windows']['1m']['success_rate'], 75.0)
+        self.assertEqual(data['windows']['1m']['participations_per_hour'], 180.0)
+        self.assertEqual(data['windows']['1h']['participations_per_hour'], 3.0)
+
+
+class TestTaskTable(unittest.TestCase):
+    def _task(self, tab_id):
+        return ScheduledTask(
+            task_id=f"participate_{tab_id}", tab_id=tab_id, task_type="participate",
+            next_execution=datetime.now(), interval=timedelta(seconds=60)
+        )
+
+    def test_counts_follow_status_changes(self):
+        table = TaskTable()
+        for tab_id in range(1, 4):
+            table[f"participate_{tab_id}"] = self._task(tab_id)
+        self.assertEqual(table.active_count, 3)
+
+        table["participate_1"].status = TaskStatus.RUNNING
+        table["participate_2"].status = TaskStatus.CANCELLED
+        self.assertEqual(table.counts[TaskStatus.PENDING], 1)
+        self.assertEqual(table.counts[TaskStatus.RUNNING], 1)
+        self.assertEqual(table.active_count, 2)
+
+        # Substituir uma tarefa descarta a contagem da anterior
+        table["participate_2"] = self._task(2)
+        self.assertEqual(table.active_count, 3)
+        del table["participate_3"]
+        self.assertEqual(table.counts_dict()['pending'], 1)
+
+    def test_snapshot_rebuilt_only_after_changes(self):
+        table = TaskTable()
+        table["participate_1"] = self._task(1)
+        table.snapshot()
+        cached = table._snapshot
+        table.snapshot()
+        self.assertIs(table._snapshot, cached)
+
+        table["participate_1"].retry_count = 2
+        second = table.snapshot()
+        self.assertIsNot(table._snapshot, cached)
+        self.assertEqual(second[0]['retry_count'], 2)
+
+    def test_snapshot_and_to_dict_return_copies(self):
+        table = TaskTable()
+        table["participate_1"] = self._task(1)
+        table.snapshot()[0]['status'] = 'corrompido'
+        table["participate_1"].to_dict()['retry_count'] = 99
+
+        self.assertEqual(table.snapshot()[0]['status'], 'pending')
+        self.assertEqual(table["participate_1"].to_dict()['retry_count'], 0)
+
+    def test_bulk_dict_methods_keep_counts(self):
+        table = TaskTable()
+        table.update({"participate_1": self._task(1)}, participate_2=self._task(2))
+        table.setdefault("participate_3", self._task(3))
+        table.setdefault("participate_3", self._task(3))
+        table |= {"participate_4": self._task(4)}
+        self.assertEqual(table.counts[TaskStatus.PENDING], 4)
+
+        table["participate_4"].status = TaskStatus.RUNNING
+        table.pop("participate_4")
+        table.popitem()
+        self.assertEqual(table.counts[TaskStatus.PENDING], 2)
+        self.assertEqual(table.counts[TaskStatus.RUNNING], 0)
+        self.assertEqual(table.active_count, 2)
+        self.assertEqual(len(table.snapshot()), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.scheduler_sim import TabProfile, VirtualTimeLoop, run_simulation  # noqa: E402
+
+
+def test_virtual_loop_skips_sleep():
+    import asyncio
+
+    loop = VirtualTimeLoop()
+    started = time.perf_counter()
+    loop.run_until_complete(asyncio.sleep(3600))
+    loop.close()
+    assert time.perf_counter() - started < 1
+    assert loop.time() >= 3600
+
+
+def test_one_simulated_hour_runs_fast():
+    profile = TabProfile(latency_median=5.0, failure_rate=0.0)
+    started = time.perf_counter()
+    report = run_simulation(5, hours=1.0, profile=profile)
+    assert time.perf_counter() - started < 5
+
+    # 5 guias, ciclo de ~185s (180s de espera + ~5s de execução)
+    assert 80 <= report.participations_per_hour <= 100
+    assert report.retries == 0
+    assert report.tab_restarts == 0
+
+
+def test_per_tab_mode_isolates_hanging_tab():
+    profiles = {1: TabProfile(latency_median=5.0, hang_rate=1.0, hang_latency=600, failure_rate=0.0)}
+    fast = TabProfile(latency_median=5.0, failure_rate=0.0)
+    batch = run_simulation(10, hours=1.0, mode="batch", profile=fast, tab_profiles=profiles)
+    per_tab = run_simulation(10, hours=1.0, mode="per_tab", profile=fast, tab_profiles=profiles)
+    assert per_tab.participations > batch.participations
+    assert per_tab.percentile(95) < batch.percentile(95)
+
+
+def test_failing_tabs_are_triaged_for_recovery():
+    profile = TabProfile(latency_median=5.0, failure_rate=0.9)
+    report = run_simulation(5, hours=1.0, profile=profile)
+    assert report.tab_restarts > 0
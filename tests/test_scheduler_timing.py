@@ -0,0 +1,130 @@
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bot_keydrop.backend.bot_logic.scheduler import BotScheduler, ScheduledTask
+from bot_keydrop.backend.config.config_manager import ConfigManager
+from tests.test_bot_scheduler import DummyAutomation, DummyBrowserManager
+
+
+class TestSchedulerTiming(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.config = ConfigManager(config_dir=self.tmp.name)
+        self.config.update_config(num_tabs=3, amateur_lottery_wait_time=60, iteration_delay=5.0,
+                                  checkpoint_enabled=False)
+        self.browser = DummyBrowserManager()
+        self.scheduler = BotScheduler(self.browser, DummyAutomation(), self.config)
+        self.clock = datetime(2025, 1, 1, 12, 0, 0)
+        self.scheduler._now = lambda: self.clock
+        self.scheduler._schedule_anchor = self.clock
+
+    async def asyncTearDown(self):
+        self.tmp.cleanup()
+
+    async def test_fixed_rate_does_not_drift_with_run_time(self):
+        self.config.update_config(fixed_rate_scheduling=True)
+        self.scheduler.update_config()
+        await self.browser.start_browser()
+        await self.browser.create_tab(2)
+        await self.scheduler._create_tasks_for_tab(2)
+        task = self.scheduler.tasks['participate_2']
+        self.assertEqual(task.next_execution, self.clock + timedelta(seconds=5))
+
+        # Execução termina 17s depois do prazo: próxima fica na grade (5 + 60)
+        self.clock += timedelta(seconds=22)
+        await self.scheduler._execute_single_task(task)
+        self.assertEqual(task.next_execution, self.scheduler._schedule_anchor + timedelta(seconds=65))
+
+        # Slots perdidos são pulados, mantendo a fase da guia
+        self.clock = self.scheduler._schedule_anchor + timedelta(seconds=200)
+        await self.scheduler._execute_single_task(task)
+        self.assertEqual(task.next_execution, self.scheduler._schedule_anchor + timedelta(seconds=245))
+
+    async def test_fixed_delay_keeps_previous_behaviour(self):
+        await self.browser.start_browser()
+        await self.browser.create_tab(1)
+        await self.scheduler._create_tasks_for_tab(1)
+        task = self.scheduler.tasks['participate_1']
+        self.clock += timedelta(seconds=22)
+        await self.scheduler._execute_single_task(task)
+        self.assertEqual(task.next_execution, self.clock + timedelta(seconds=60))
+
+    async def test_recreated_task_keeps_stagger_phase(self):
+        self.config.update_config(fixed_rate_scheduling=True)
+        self.scheduler.update_config()
+        await self.scheduler._create_tasks_for_tab(3)
+        self.clock += timedelta(seconds=100)
+
+        await self.scheduler._create_tasks_for_tab(3)
+        task = self.scheduler.tasks['participate_3']
+        offset = (task.next_execution - self.scheduler._schedule_anchor).total_seconds()
+        self.assertEqual(offset, 130)  # 10 + 2*60
+
+    async def test_overdue_tasks_are_spread_out(self):
+        tasks = [
+            ScheduledTask(
+                task_id=f"participate_{tab_id}", tab_id=tab_id, task_type="participate",
+                next_execution=self.clock - timedelta(minutes=30, seconds=-tab_id),
+                interval=timedelta(seconds=60),
+            )
+            for tab_id in (1, 2, 3)
+        ]
+        for task in tasks:
+            self.scheduler.tasks[task.task_id] = task
+
+        run_now = self.scheduler._defer_overdue(tasks, self.clock)
+
+        self.assertEqual(run_now, [tasks[0]])
+        self.assertEqual(tasks[1].next_execution, self.clock + timedelta(seconds=5))
+        self.assertEqual(tasks[2].next_execution, self.clock + timedelta(seconds=10))
+
+
+class TestSchedulerClock(unittest.IsolatedAsyncioTestCase):
+    async def test_wall_clock_jump_shifts_deadlines_uniformly(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        config = ConfigManager(config_dir=tmp.name)
+        config.update_config(num_tabs=2, checkpoint_enabled=False)
+        scheduler = BotScheduler(DummyBrowserManager(), DummyAutomation(), config)
+        await scheduler._create_tasks_for_tab(1)
+        await scheduler._create_tasks_for_tab(2)
+        before = {tid: t.next_execution for tid, t in scheduler.tasks.items()}
+
+        # Simula o relógio de parede adiantando 1h (ex.: retorno de suspensão)
+        scheduler._wall_anchor -= timedelta(hours=1)
+        drift = scheduler._resync_clock()
+
+        self.assertAlmostEqual(drift, 3600, delta=1)
+        self.assertAlmostEqual((datetime.now() - scheduler._now()).total_seconds(), 0, delta=0.5)
+        spacing = [(scheduler.tasks[tid].next_execution - before[tid]).total_seconds() for tid in before]
+        self.assertAlmostEqual(spacing[0], spacing[1], places=6)
+        self.assertEqual(scheduler._resync_clock(), 0.0)
+
+    async def test_checkpoint_after_clock_jump_uses_shifted_deadlines(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        config = ConfigManager(config_dir=tmp.name)
+        config.update_config(num_tabs=2, checkpoint_enabled=False)
+        scheduler = BotScheduler(DummyBrowserManager(), DummyAutomation(), config)
+        await scheduler._create_tasks_for_tab(1)
+        await scheduler._create_tasks_for_tab(2)
+        offsets = {tid: (t.next_execution - scheduler._schedule_anchor).total_seconds()
+                   for tid, t in scheduler.tasks.items()}
+
+        scheduler._wall_anchor -= timedelta(hours=1)
+        state = scheduler._checkpoint_state()
+
+        # Prazos e âncora gravados na mesma base: a grade de fases continua valendo
+        for row in state['tasks']:
+            self.assertAlmostEqual(row[3] - state['anchor'], offsets[row[0]], places=3)
+        self.assertGreater(min(row[3] for row in state['tasks']), datetime.now().timestamp() - 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import sys
+import json
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bot_keydrop.backend.bot_logic.session_store import SessionStore
+
+
+def state(value):
+    return {'cookies': [{'name': 'sid', 'value': value}], 'origins': []}
+
+
+class TestSessionStore(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "profile_1" / "session.json"
+        self.store = SessionStore(debounce=0.02)
+
+    async def asyncTearDown(self):
+        await self.store.flush()
+        self.tmp.cleanup()
+
+    async def test_repeated_saves_are_debounced(self):
+        for value in ('a', 'b', 'c'):
+            self.store.save(self.path, state(value))
+        self.assertFalse(self.path.exists())
+
+        await asyncio.sleep(0.1)
+        self.assertEqual(json.loads(self.path.read_text()), state('c'))
+        self.assertNotIn('\n', self.path.read_text())
+        self.assertFalse(self.path.with_name('session.json.tmp').exists())
+        stats = self.store.get_stats()
+        self.assertEqual(stats['writes'], 1)
+        self.assertEqual(stats['coalesced'], 2)
+
+    async def test_unchanged_state_is_not_rewritten(self):
+        self.store.save(self.path, state('a'))
+        await self.store.flush()
+        mtime = self.path.stat().st_mtime_ns
+
+        self.store.save(self.path, state('a'))
+        await self.store.flush()
+        self.assertEqual(self.path.stat().st_mtime_ns, mtime)
+        self.assertEqual(self.store.get_stats()['unchanged'], 1)
+
+    async def test_load_uses_cache_until_file_changes(self):
+        self.path.parent.mkdir(parents=True)
+        self.path.write_text(json.dumps(state('a'), indent=2))
+
+        self.assertEqual(await self.store.load(self.path), state('a'))
+        self.assertEqual(await self.store.load(self.path), state('a'))
+        self.assertEqual(self.store.reads, 1)
+        self.assertEqual(self.store.cache_hits, 1)
+
+        # Estado pendente tem prioridade sobre o arquivo
+        self.store.save(self.path, state('b'))
+        self.assertEqual(await self.store.load(self.path), state('b'))
+        await self.store.flush()
+        self.assertEqual(await self.store.load(self.path), state('b'))
+        self.assertEqual(self.store.reads, 1)
+
+        self.assertIsNone(await self.store.load(Path(self.tmp.name) / "missing.json"))
+
+
+if __name__ == "__main__":
+    unittest.main()
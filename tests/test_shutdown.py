@@ -0,0 +1,160 @@
+import sys
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bot_keydrop.backend.bot_logic.browser_manager import BrowserManager
+from bot_keydrop.backend.bot_logic.browser_shards import BrowserShard
+
+
+class FakePage:
+    def on(self, event, handler):
+        pass
+
+    async def close(self):
+        pass
+
+
+class FakeContext:
+    def __init__(self, close_delay):
+        self.close_delay = close_delay
+        self.closed = False
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    async def route(self, pattern, handler):
+        pass
+
+    async def new_page(self):
+        return FakePage()
+
+    async def close(self):
+        await asyncio.sleep(self.close_delay)
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, close_delay=0.0):
+        self.close_delay = close_delay
+        self.context_delay = 0.1
+        self.closed = False
+
+    async def new_context(self, **options):
+        return FakeContext(self.context_delay)
+
+    async def close(self):
+        await asyncio.sleep(self.close_delay)
+        self.closed = True
+
+
+class FakePlaywright:
+    def __init__(self, stop_delay=0.0):
+        self.stop_delay = stop_delay
+        self.stopped = False
+
+    async def stop(self):
+        await asyncio.sleep(self.stop_delay)
+        self.stopped = True
+
+
+class TestShutdown(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.manager = BrowserManager()
+        self.manager.user_profiles_dir = Path(self.tmp.name)
+        self.manager.context_pool_size = 0
+        self.manager.enable_stealth = False
+        self.manager.keep_cookies = False
+
+    async def asyncTearDown(self):
+        self.tmp.cleanup()
+
+    async def _open_tabs(self, browsers, num_tabs):
+        self.manager.shards = [BrowserShard(i, b) for i, b in enumerate(browsers)]
+        self.manager.browser = browsers[0]
+        self.manager.is_running = True
+        for tab_id in range(1, num_tabs + 1):
+            await self.manager.create_tab(tab_id)
+
+    async def test_contexts_close_concurrently_with_single_gc(self):
+        browsers = [FakeBrowser(), FakeBrowser()]
+        await self._open_tabs(browsers, 50)
+        contexts = [info.context for info in self.manager.tabs.values()]
+
+        with patch('bot_keydrop.backend.bot_logic.browser_manager.gc.collect') as collect:
+            self.assertTrue(await self.manager.stop_browser())
+
+        report = self.manager.last_shutdown
+        self.assertLess(report['duration'], 1.0)  # 50 x 0.1s em sequência levaria 5s
+        self.assertEqual(report['tabs'], 50)
+        self.assertEqual(report['timed_out'], [])
+        self.assertTrue(all(context.closed for context in contexts))
+        self.assertTrue(all(browser.closed for browser in browsers))
+        self.assertEqual(collect.call_count, 1)
+        self.assertFalse(self.manager.is_running)
+        self.assertEqual(self.manager.tabs, {})
+
+    async def test_deadline_escalates_to_kill(self):
+        browser = FakeBrowser(close_delay=10)
+        await self._open_tabs([browser], 3)
+        self.manager.shutdown_timeout = 0.3
+
+        with patch.object(BrowserManager, '_kill_browser_processes', return_value=2) as kill:
+            self.assertTrue(await self.manager.stop_browser())
+
+        report = self.manager.last_shutdown
+        self.assertLess(report['duration'], 1.0)
+        self.assertIn('browsers', report['timed_out'])
+        self.assertEqual(report['killed_processes'], 2)
+        kill.assert_called_once()
+        self.assertIsNone(self.manager.browser)
+
+    async def test_driver_stop_is_awaited_after_timed_out_stage(self):
+        await self._open_tabs([FakeBrowser(close_delay=10)], 2)
+        self.manager.shutdown_timeout = 0.2
+        self.manager.playwright = playwright = FakePlaywright(stop_delay=0.05)
+
+        with patch.object(BrowserManager, '_kill_browser_processes', return_value=1) as kill:
+            self.assertTrue(await self.manager.stop_browser())
+
+        self.assertTrue(playwright.stopped)
+        self.assertNotIn('playwright', self.manager.last_shutdown['timed_out'])
+        kill.assert_called_once_with()
+        self.assertIsNone(self.manager.playwright)
+
+    async def test_hung_driver_is_killed(self):
+        await self._open_tabs([FakeBrowser(close_delay=10)], 2)
+        self.manager.shutdown_timeout = 0.2
+        self.manager.driver_stop_grace = 0.1
+        self.manager.playwright = FakePlaywright(stop_delay=10)
+
+        with patch.object(BrowserManager, '_kill_browser_processes', return_value=1) as kill:
+            self.assertTrue(await self.manager.stop_browser())
+
+        report = self.manager.last_shutdown
+        self.assertLess(report['duration'], 1.0)
+        self.assertIn('playwright', report['timed_out'])
+        self.assertEqual(kill.call_args_list[-1].args, (True,))
+        self.assertEqual(report['killed_processes'], 2)
+        self.assertIsNone(self.manager.playwright)
+
+    def test_driver_process_matches_node_running_playwright(self):
+        self.assertTrue(BrowserManager._is_driver_process('node', ['node', '/x/playwright/driver/cli.js']))
+        self.assertTrue(BrowserManager._is_driver_process('playwright.exe', []))
+        self.assertFalse(BrowserManager._is_driver_process('node', ['node', 'server.js']))
+
+    async def test_emergency_stop_no_longer_uses_missing_attributes(self):
+        await self._open_tabs([FakeBrowser()], 2)
+        self.assertTrue(await self.manager.emergency_stop())
+        self.assertEqual(self.manager.tabs, {})
+        self.assertFalse(self.manager.is_running)
+
+
+if __name__ == "__main__":
+    unittest.main()
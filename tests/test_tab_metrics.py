@@ -0,0 +1,81 @@
+import sys
+import unittest
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bot_keydrop.backend.bot_logic.tab_metrics import TabBudget, TabUsage, MB
+from bot_keydrop.backend.bot_logic.tab_watchdog import TabWatchdog
+
+
+def usage_with(*samples):
+    usage = TabUsage()
+    for timestamp, heap_mb, busy in samples:
+        usage.add(timestamp, {'JSHeapTotalSize': heap_mb * MB, 'TaskDuration': busy, 'Nodes': 100})
+    return usage
+
+
+class TestTabUsage(unittest.TestCase):
+    def test_cpu_and_trend_from_samples(self):
+        usage = usage_with((0, 50, 0.0), (5, 55, 1.0), (10, 60, 3.5))
+
+        self.assertEqual(usage.memory_mb, 60)
+        self.assertAlmostEqual(usage.cpu_percent, 50.0)
+        self.assertAlmostEqual(usage.memory_trend, 60.0)  # 1 MB/s
+        self.assertEqual(usage.to_dict()['dom_nodes'], 100)
+
+    def test_budget_reasons(self):
+        budget = TabBudget(memory_mb=100, cpu_percent=80, growth_mb_per_min=30)
+        self.assertIsNone(budget.check(usage_with((0, 50, 0.0), (5, 50, 0.5))))
+        self.assertIn('memória', budget.check(usage_with((0, 120, 0.0))))
+        self.assertIn('CPU', budget.check(usage_with((0, 50, 0.0), (5, 50, 4.5))))
+        self.assertIn('crescendo', budget.check(usage_with((0, 10, 0), (5, 20, 0), (10, 30, 0))))
+
+
+class FakeBrowserManager:
+    def __init__(self, usages):
+        self.usages = usages
+        self.tabs = {
+            tab_id: SimpleNamespace(status='ready', last_activity=datetime.now())
+            for tab_id in usages
+        }
+        self.recover_tab = AsyncMock(return_value='reload')
+
+    async def sample_all_tabs(self):
+        return self.usages
+
+
+class TestWatchdogBudgets(unittest.IsolatedAsyncioTestCase):
+    async def test_only_offending_tab_is_recycled_after_strikes(self):
+        manager = FakeBrowserManager({
+            1: usage_with((0, 40, 0.0)),
+            2: usage_with((0, 400, 0.0)),
+        })
+        watchdog = TabWatchdog(manager, memory_budget_mb=150, budget_strikes=2)
+
+        await watchdog._check_tabs()
+        manager.recover_tab.assert_not_called()
+
+        await watchdog._check_tabs()
+        manager.recover_tab.assert_awaited_once_with(2)
+        self.assertNotIn(2, watchdog._strikes)
+
+    async def test_participating_tab_is_not_interrupted(self):
+        manager = FakeBrowserManager({1: usage_with((0, 400, 0.0))})
+        manager.tabs[1].status = 'participating'
+        watchdog = TabWatchdog(manager, memory_budget_mb=150, budget_strikes=1)
+
+        await watchdog._check_tabs()
+        manager.recover_tab.assert_not_called()
+
+        manager.tabs[1].status = 'ready'
+        await watchdog._check_tabs()
+        manager.recover_tab.assert_awaited_once_with(1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import sys
+import asyncio
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bot_keydrop.backend.bot_logic.browser_manager import BrowserManager, TabInfo
+from bot_keydrop.backend.bot_logic.tab_watchdog import TabWatchdog
+
+GIVEAWAYS = "https://key-drop.com/pt/giveaways/list"
+
+
+class ProbePage:
+    def __init__(self, url=GIVEAWAYS, ready_state="complete", hang=False):
+        self.url = url
+        self.ready_state = ready_state
+        self.hang = hang
+        self.evaluations = 0
+
+    def is_closed(self):
+        return False
+
+    async def evaluate(self, script, *args):
+        self.evaluations += 1
+        if self.hang:
+            await asyncio.sleep(10)
+        return [self.ready_state, self.url]
+
+
+class TestTabProbe(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.manager = BrowserManager()
+        self.manager.user_profiles_dir = Path(self.tmp.name)
+        self.manager.probe_timeout = 0.05
+        self.manager.navigate_tab = AsyncMock(return_value=True)
+
+    async def asyncTearDown(self):
+        self.tmp.cleanup()
+
+    def _add_tab(self, page, status='ready'):
+        self.manager.tabs[1] = TabInfo(
+            tab_id=1,
+            page=page,
+            context=None,
+            url=GIVEAWAYS,
+            status=status,
+            last_activity=datetime.now() - timedelta(minutes=5),
+        )
+        return self.manager.tabs[1]
+
+    async def test_responsive_tab_is_healthy(self):
+        tab = self._add_tab(ProbePage(url=GIVEAWAYS + "?page=2#top"), status='error')
+
+        self.assertEqual(await self.manager.triage_tab(1), 'healthy')
+        self.assertTrue(tab.responsive)
+        self.assertEqual(tab.status, 'ready')
+        self.assertLess((datetime.now() - tab.last_activity).total_seconds(), 5)
+        self.assertEqual(tab.probe_latency.count, 1)
+        self.manager.navigate_tab.assert_not_called()
+
+    async def test_hung_renderer_needs_recovery(self):
+        tab = self._add_tab(ProbePage(hang=True))
+
+        probe = await self.manager.probe_tab(1)
+
+        self.assertFalse(probe.alive)
+        self.assertFalse(tab.responsive)
+        self.assertLess(probe.latency, 1)
+        self.assertEqual(await self.manager.triage_tab(1), 'recover')
+
+    async def test_wrong_page_only_navigates(self):
+        self._add_tab(ProbePage(url="https://key-drop.com/pt/login"))
+
+        self.assertEqual(await self.manager.triage_tab(1), 'navigated')
+        self.manager.navigate_tab.assert_awaited_once_with(1, GIVEAWAYS)
+
+    async def test_loading_page_is_not_on_page(self):
+        self._add_tab(ProbePage(ready_state="loading"))
+        self.manager.navigate_tab.return_value = False
+
+        probe = await self.manager.probe_tab(1)
+
+        self.assertTrue(probe.alive)
+        self.assertFalse(probe.on_page)
+        self.assertEqual(await self.manager.triage_tab(1), 'recover')
+
+    async def test_missing_tab(self):
+        self.assertIsNone(await self.manager.probe_tab(42))
+        self.assertEqual(await self.manager.triage_tab(42), 'recover')
+
+
+class TestWatchdogProbe(unittest.IsolatedAsyncioTestCase):
+    async def test_inactive_but_responsive_tab_is_not_recovered(self):
+        manager = AsyncMock()
+        manager.triage_tab.return_value = 'healthy'
+        watchdog = TabWatchdog(manager, timeout_seconds=1)
+        watchdog._recover_tab = AsyncMock()
+
+        await watchdog._restart_tab(1, 120)
+
+        manager.triage_tab.assert_awaited_once_with(1)
+        watchdog._recover_tab.assert_not_called()
+
+    async def test_unresponsive_tab_is_recovered(self):
+        manager = AsyncMock()
+        manager.triage_tab.return_value = 'recover'
+        watchdog = TabWatchdog(manager, timeout_seconds=1)
+        watchdog._recover_tab = AsyncMock()
+
+        await watchdog._restart_tab(1, 120)
+
+        watchdog._recover_tab.assert_awaited_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import sys
+import asyncio
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bot_keydrop.backend.bot_logic.browser_manager import BrowserManager, TabInfo
+
+
+class FakePage:
+    def __init__(self, fail_reload=False, fail_goto=False):
+        self.fail_reload = fail_reload
+        self.fail_goto = fail_goto
+        self.reloads = 0
+        self.visited = []
+        self.closed = False
+
+    def on(self, event, handler):
+        pass
+
+    async def route(self, pattern, handler):
+        pass
+
+    async def add_init_script(self, script=None):
+        pass
+
+    async def set_extra_http_headers(self, headers):
+        pass
+
+    def is_closed(self):
+        return self.closed
+
+    async def reload(self, wait_until=None, timeout=None):
+        self.reloads += 1
+        if self.fail_reload:
+            raise TimeoutError("reload timeout")
+
+    async def goto(self, url, wait_until=None, timeout=None):
+        if self.fail_goto:
+            raise TimeoutError("goto timeout")
+        self.visited.append(url)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self, next_page):
+        self.next_page = next_page
+        self.closed = False
+
+    async def new_page(self):
+        return self.next_page
+
+    async def close(self):
+        self.closed = True
+
+
+class TestTabRecovery(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.manager = BrowserManager()
+        self.manager.user_profiles_dir = Path(self.tmp.name)
+        self.manager.enable_stealth = False
+        self.manager.restart_tab = AsyncMock(return_value=True)
+
+    async def asyncTearDown(self):
+        self.tmp.cleanup()
+
+    def _add_tab(self, page, new_page, proxy=""):
+        context = FakeContext(new_page)
+        self.manager.tabs[1] = TabInfo(
+            tab_id=1,
+            page=page,
+            context=context,
+            url="https://key-drop.com/pt/giveaways/list",
+            status='error',
+            last_activity=datetime.now(),
+            proxy=proxy,
+        )
+        return context
+
+    async def test_reload_is_tried_first(self):
+        page = FakePage()
+        self._add_tab(page, FakePage())
+
+        tier = await self.manager.recover_tab(1)
+
+        self.assertEqual(tier, 'reload')
+        self.assertEqual(page.reloads, 1)
+        self.assertIs(self.manager.tabs[1].page, page)
+        self.assertEqual(self.manager.tabs[1].status, 'ready')
+        self.manager.restart_tab.assert_not_called()
+
+    async def test_new_page_keeps_context_when_reload_fails(self):
+        old_page = FakePage(fail_reload=True)
+        new_page = FakePage()
+        context = self._add_tab(old_page, new_page)
+
+        tier = await self.manager.recover_tab(1)
+
+        self.assertEqual(tier, 'new_page')
+        self.assertIs(self.manager.tabs[1].page, new_page)
+        self.assertIs(self.manager.tabs[1].context, context)
+        self.assertTrue(old_page.closed)
+        self.assertFalse(context.closed)
+        self.assertEqual(new_page.visited, ["https://key-drop.com/pt/giveaways/list"])
+        self.manager.restart_tab.assert_not_called()
+
+    async def test_escalates_to_new_context(self):
+        old_page = FakePage(fail_reload=True)
+        new_page = FakePage(fail_goto=True)
+        self._add_tab(old_page, new_page)
+
+        tier = await self.manager.recover_tab(1)
+
+        self.assertEqual(tier, 'new_context')
+        self.assertTrue(new_page.closed)
+        self.manager.restart_tab.assert_awaited_once_with(1)
+
+        stats = self.manager.get_recovery_stats()
+        self.assertEqual(stats['reload']['attempts'], 1)
+        self.assertEqual(stats['reload']['successes'], 0)
+        self.assertEqual(stats['new_page']['attempts'], 1)
+        self.assertEqual(stats['new_context']['successes'], 1)
+        self.assertEqual(stats['new_context']['latency']['count'], 1)
+
+    async def test_proxy_change_needs_new_context(self):
+        page = FakePage()
+        self._add_tab(page, FakePage(), proxy="http://old:8080")
+
+        tier = await self.manager.recover_tab(1, proxy="http://new:8080")
+
+        self.assertEqual(tier, 'new_context')
+        self.assertEqual(page.reloads, 0)
+        self.manager.restart_tab.assert_awaited_once_with(1, "http://new:8080")
+
+    async def test_all_tiers_failing_returns_none(self):
+        self._add_tab(FakePage(fail_reload=True), FakePage(fail_goto=True))
+        self.manager.restart_tab.return_value = False
+
+        self.assertIsNone(await self.manager.recover_tab(1))
+        self.assertIsNone(await self.manager.recover_tab(99))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bot_keydrop.backend.bot_logic.automation_tasks import KeydropAutomation, ParticipationResult
+from bot_keydrop.backend.bot_logic.template_matcher import TemplateMatcher
+
+try:
+    import cv2
+    import numpy as np
+except ImportError:
+    cv2 = None
+
+
+def png(image):
+    ok, data = cv2.imencode('.png', image)
+    return data.tobytes()
+
+
+@unittest.skipIf(cv2 is None, "opencv não instalado")
+class TestTemplateMatcher(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.template = rng.integers(0, 255, (40, 120), dtype=np.uint8)
+        self.template_path = Path(self.tmp.name) / 'button.png'
+        cv2.imwrite(str(self.template_path), self.template)
+        self.screen = rng.integers(0, 255, (720, 1280), dtype=np.uint8)
+        self.screen[300:340, 500:620] = self.template
+        self.matcher = TemplateMatcher(self.template_path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_finds_center_from_png_bytes(self):
+        x, y, score = self.matcher.match(png(self.screen), key=1)
+
+        self.assertAlmostEqual(x, 560, delta=1)
+        self.assertAlmostEqual(y, 320, delta=1)
+        self.assertGreater(score, 0.9)
+
+    def test_second_call_uses_last_region(self):
+        self.matcher.match(png(self.screen), key=1)
+        self.matcher.match(png(self.screen), key=1)
+
+        stats = self.matcher.get_stats()
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['region_hits'], 1)
+        self.assertEqual(stats['latency']['count'], 2)
+
+    def test_template_loaded_once(self):
+        first = self.matcher.template()
+        self.template_path.unlink()
+        self.assertIs(self.matcher.template(), first)
+
+    def test_missing_button(self):
+        blank = np.full((720, 1280), 128, dtype=np.uint8)
+        self.assertIsNone(self.matcher.match(png(blank)))
+
+
+class FakeMatcher:
+    def __init__(self, result):
+        self.result = result
+        self.template_path = Path(__file__)
+        self.calls = []
+
+    def match(self, screenshot, key=None):
+        self.calls.append((screenshot, key, threading.current_thread()))
+        return self.result
+
+
+class ImagePage:
+    def __init__(self):
+        self.url = KeydropAutomation.URLS['keydrop_lotteries']
+        self.clicks = []
+        self.screenshot_args = None
+        self.mouse = self
+
+    async def screenshot(self, **kwargs):
+        self.screenshot_args = kwargs
+        return b'png'
+
+    async def click(self, x, y):
+        self.clicks.append((x, y))
+
+
+class DummyBrowserManager:
+    def get_tab_info(self, tab_id):
+        return None
+
+
+class TestImageParticipation(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.auto = KeydropAutomation(DummyBrowserManager())
+        self.auto.waits.pacing_floor = 0
+        self.auto.ACTION_HOLD = dict.fromkeys(KeydropAutomation.ACTION_HOLD, 0)
+        self.auto._watch_join_response = lambda page: None
+        self.auto._verify_participation_success = AsyncMock(return_value=True)
+        self.lottery = {'info': {'type': 'unknown', 'title': 'A'}}
+
+    async def test_screenshot_stays_in_memory_and_matches_off_loop(self):
+        self.auto.template_matcher = FakeMatcher((560.0, 320.0, 0.95))
+        page = ImagePage()
+
+        result = await self.auto._attempt_participation_image(page, self.lottery, 3, 1)
+
+        self.assertEqual(result.result, ParticipationResult.SUCCESS)
+        self.assertEqual(page.screenshot_args, {})
+        screenshot, key, thread = self.auto.template_matcher.calls[0]
+        self.assertEqual((screenshot, key), (b'png', 3))
+        self.assertIsNot(thread, threading.main_thread())
+        self.assertEqual(page.clicks, [(560.0, 320.0)])
+
+    async def test_not_found(self):
+        self.auto.template_matcher = FakeMatcher(None)
+        page = ImagePage()
+
+        result = await self.auto._attempt_participation_image(page, self.lottery, 3, 1)
+
+        self.assertEqual(result.result, ParticipationResult.BUTTON_NOT_FOUND)
+        self.assertEqual(page.clicks, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
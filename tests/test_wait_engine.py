@@ -0,0 +1,252 @@
+import sys
+import asyncio
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bot_keydrop.backend.bot_logic.automation_tasks import KeydropAutomation
+from bot_keydrop.backend.bot_logic.wait_engine import WaitEngine
+
+
+async def after(delay, value=True):
+    await asyncio.sleep(delay)
+    return value
+
+
+async def fails(delay):
+    await asyncio.sleep(delay)
+    raise TimeoutError("condição não ocorreu")
+
+
+class TestWaitEngine(unittest.IsolatedAsyncioTestCase):
+    async def test_first_condition_ends_the_wait(self):
+        engine = WaitEngine()
+        slow = asyncio.ensure_future(after(5))
+
+        met = await engine.until('list', [slow, after(0.01)], timeout=3, fixed=2)
+
+        self.assertTrue(met)
+        self.assertTrue(slow.cancelled())
+        stats = engine.get_stats()['waits']['list']
+        self.assertEqual(stats['met'], 1)
+        self.assertLess(stats['actual_seconds'], 0.5)
+        self.assertGreater(stats['saved_seconds'], 1.5)
+
+    async def test_failed_condition_does_not_end_the_wait(self):
+        engine = WaitEngine()
+
+        met = await engine.until('result', [fails(0.01), after(0.05)], timeout=1, fixed=4)
+
+        self.assertTrue(met)
+
+    async def test_timeout_is_bounded(self):
+        engine = WaitEngine()
+
+        met = await engine.until('result', [after(5)], timeout=0.05, fixed=0.05)
+
+        self.assertFalse(met)
+        stats = engine.get_stats()['waits']['result']
+        self.assertEqual(stats['timeouts'], 1)
+        self.assertLess(stats['actual']['max'], 0.5)
+
+    async def test_pacing_floor_per_tab(self):
+        engine = WaitEngine(pacing_floor=0.1, pacing_jitter=0)
+
+        self.assertEqual(await engine.pace(1), 0.0)
+        self.assertEqual(await engine.pace(2), 0.0)
+        waited = await engine.pace(1)
+
+        self.assertGreater(waited, 0.05)
+        self.assertGreater(engine.get_stats()['paced_seconds'], 0.05)
+
+    async def test_hold_extends_spacing_beyond_floor(self):
+        engine = WaitEngine(pacing_floor=0.01, pacing_jitter=0)
+        await engine.pace(1)
+        engine.hold(1, 0.15)
+
+        self.assertEqual(await engine.pace(2), 0.0)
+        self.assertGreater(await engine.pace(1), 0.1)
+        # O hold vale uma vez; depois volta o piso
+        self.assertLess(await engine.pace(1), 0.05)
+
+
+class ResultPage:
+    """Página em que o botão muda de estado logo após o clique"""
+
+    def __init__(self, change_after=0.02):
+        self.change_after = change_after
+
+    async def wait_for_selector(self, selector, state=None, timeout=None):
+        await asyncio.sleep(10)
+
+    async def wait_for_function(self, script, arg=None, timeout=None):
+        await asyncio.sleep(self.change_after)
+        return True
+
+    async def query_selector(self, selector):
+        return None
+
+
+class FakeButton:
+    async def inner_text(self):
+        return "Participando"
+
+    async def is_enabled(self):
+        return False
+
+
+class SlowRenderPage:
+    """Página que recebe a resposta da participação antes de atualizar o botão"""
+
+    def __init__(self, loop, change_after):
+        self.changed_at = loop.time() + change_after
+        self.loop = loop
+
+    async def wait_for_selector(self, selector, state=None, timeout=None):
+        await asyncio.sleep(10)
+
+    async def wait_for_function(self, script, arg=None, timeout=None):
+        await asyncio.sleep(max(0.0, self.changed_at - self.loop.time()))
+        return True
+
+    async def query_selector(self, selector):
+        return None
+
+
+class RenderedButton:
+    def __init__(self, page):
+        self.page = page
+
+    def _changed(self):
+        return self.page.loop.time() >= self.page.changed_at
+
+    async def inner_text(self):
+        return "Participando" if self._changed() else "Participar"
+
+    async def is_enabled(self):
+        return not self._changed()
+
+
+class FakeRequest:
+    def __init__(self, method):
+        self.method = method
+
+
+class FakeResponse:
+    def __init__(self, status=200, url="https://ws.key-drop.com/v1/giveaway//joinGiveaway/abc", method="PUT"):
+        self.status = status
+        self.ok = 200 <= status < 300
+        self.url = url
+        self.request = FakeRequest(method)
+
+
+def respond_after(delay, status=200):
+    return asyncio.ensure_future(after(delay, FakeResponse(status)))
+
+
+class DummyBrowserManager:
+    def get_tab_info(self, tab_id):
+        return None
+
+
+class TestParticipationWaits(unittest.IsolatedAsyncioTestCase):
+    async def test_verify_returns_when_button_changes(self):
+        auto = KeydropAutomation(DummyBrowserManager())
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        success = await auto._verify_participation_success(ResultPage(), FakeButton(), timeout=4, fixed=4)
+
+        self.assertTrue(success)
+        self.assertLess(loop.time() - started, 1.0)
+        stats = auto.get_wait_stats()['waits']['participation_result']
+        self.assertEqual(stats['met'], 1)
+        self.assertGreater(stats['saved_seconds'], 3)
+
+    async def test_join_response_before_render_counts_as_success(self):
+        auto = KeydropAutomation(DummyBrowserManager())
+        loop = asyncio.get_running_loop()
+        page = SlowRenderPage(loop, change_after=0.5)
+        started = loop.time()
+
+        success = await auto._verify_participation_success(
+            page, RenderedButton(page), respond_after(0.05), timeout=2, fixed=4
+        )
+
+        self.assertTrue(success)
+        self.assertLess(loop.time() - started, 0.4)
+
+    async def test_join_response_without_button_counts_as_success(self):
+        auto = KeydropAutomation(DummyBrowserManager())
+        page = SlowRenderPage(asyncio.get_running_loop(), change_after=0.5)
+
+        self.assertTrue(await auto._verify_participation_success(page, None, respond_after(0.05), timeout=2))
+
+    async def test_error_response_keeps_waiting_for_the_page(self):
+        auto = KeydropAutomation(DummyBrowserManager())
+        loop = asyncio.get_running_loop()
+        page = SlowRenderPage(loop, change_after=0.3)
+        started = loop.time()
+
+        success = await auto._verify_participation_success(
+            page, RenderedButton(page), respond_after(0.05, status=500), timeout=2
+        )
+
+        self.assertTrue(success)
+        self.assertGreaterEqual(loop.time() - started, 0.25)
+
+    async def test_error_response_without_page_change_fails(self):
+        auto = KeydropAutomation(DummyBrowserManager())
+        page = SlowRenderPage(asyncio.get_running_loop(), change_after=10)
+
+        self.assertFalse(await auto._verify_participation_success(page, None, respond_after(0.05, 429), timeout=0.3))
+
+    def test_join_response_matches_only_the_join_endpoint(self):
+        matches = KeydropAutomation._is_join_response
+        self.assertTrue(matches(FakeResponse()))
+        self.assertTrue(matches(FakeResponse(url="https://key-drop.com/api/giveaways/12/join", method="POST")))
+        self.assertFalse(matches(FakeResponse(method="GET")))
+        self.assertFalse(matches(FakeResponse(url="https://key-drop.com/api/giveaways/list", method="POST")))
+        self.assertFalse(matches(FakeResponse(url="https://stats.example.com/collect?event=giveaway_join", method="POST")))
+        self.assertFalse(matches(FakeResponse(url="https://key-drop.com/api/chat/join", method="POST")))
+
+
+class BackPage:
+    url = "https://key-drop.com/pt/giveaways/1"
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.back_at = None
+
+    async def go_back(self, wait_until=None):
+        self.back_at = self.loop.time()
+        self.url = KeydropAutomation.URLS['keydrop_lotteries']
+
+
+class TestActionSpacing(unittest.IsolatedAsyncioTestCase):
+    async def test_go_back_waits_for_join_hold(self):
+        auto = KeydropAutomation(DummyBrowserManager())
+        auto.ACTION_HOLD = dict(auto.ACTION_HOLD, join=0.2)
+        auto.waits.pacing_floor = 0.01
+        loop = asyncio.get_running_loop()
+        page = BackPage(loop)
+
+        await auto.waits.pace(1)
+        clicked = loop.time()
+        auto.waits.hold(1, auto.ACTION_HOLD['join'])
+        await auto._return_to_listing(1, page)
+
+        self.assertGreaterEqual(page.back_at - clicked, 0.19)
+
+    def test_config_floor_cannot_disable_pacing(self):
+        from pydantic import ValidationError
+        from bot_keydrop.backend.config.config_manager import BotConfig
+
+        with self.assertRaises(ValidationError):
+            BotConfig(wait_pacing_floor=0)
+
+
+if __name__ == "__main__":
+    unittest.main()